@@ -0,0 +1,9 @@
+"""
+Benchmarks de rendimiento de la aplicación de Programación Lineal.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks model -o actual.json           # Construcción y resolución de LPModel
+    python -m benchmarks presolve -o presolve.json      # Resolución con y sin presolve
+    python -m benchmarks gui -o gui.json                # Interfaz gráfica bajo Xvfb
+    python -m benchmarks compare base.json actual.json  # Falla si alguna métrica empeora
+"""
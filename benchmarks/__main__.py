@@ -0,0 +1,57 @@
+"""
+Punto de entrada: python -m benchmarks <model|presolve|gui|compare> [opciones]
+"""
+
+import argparse
+import sys
+
+from . import bench_gui, bench_model, bench_presolve
+from .report import DEFAULT_THRESHOLD, compare_main
+
+
+def build_parser():
+    """Construye el parser de argumentos de los benchmarks."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks de rendimiento del solucionador de Programación Lineal."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    model_parser = subparsers.add_parser("model", help="Construcción y resolución de LPModel")
+    bench_model.add_arguments(model_parser)
+    
+    presolve_parser = subparsers.add_parser("presolve", help="Resolución con y sin presolve")
+    bench_presolve.add_arguments(presolve_parser)
+    
+    gui_parser = subparsers.add_parser("gui", help="Interfaz gráfica bajo Xvfb")
+    bench_gui.add_arguments(gui_parser)
+    
+    compare_parser = subparsers.add_parser("compare", help="Compara un informe con una línea base")
+    compare_parser.add_argument("baseline", help="Informe JSON de referencia")
+    compare_parser.add_argument("current", help="Informe JSON nuevo")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="Aumento relativo tolerado por métrica (por defecto 0.25 = 25%%)"
+    )
+    return parser
+
+
+def main(argv=None):
+    """
+    Ejecuta el comando pedido.
+    
+    Returns:
+        int: Código de salida (1 si compare encuentra regresiones)
+    """
+    args = build_parser().parse_args(argv)
+    if args.command == "model":
+        return bench_model.model_main(args)
+    if args.command == "presolve":
+        return bench_presolve.presolve_main(args)
+    if args.command == "gui":
+        return bench_gui.gui_main(args)
+    return compare_main(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""
+Benchmark de LPSolverGUI bajo una pantalla virtual (Xvfb).
+
+Mide el tiempo hasta el primer pintado de la ventana y, para cada tamaño de
+tabla n × n: la reconstrucción de la tabla (_build_table), el llenado con
+datos (_fill_table), la vista del modelo (_update_model_display) y la
+resolución completa desde el botón hasta el resultado en pantalla. También
+mide la carga de los cuatro ejemplos (_load_example_*).
+
+Cada medición incluye el procesamiento de los eventos pendientes de Tk
+(root.update()), que es lo que ve el usuario. La resolución completa está
+cuantizada por el sondeo de _poll_solve (cada 100 ms).
+"""
+
+import contextlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from .instances import generate_instance
+
+
+DEFAULT_SIZES = (10, 50, 100)
+SCREEN = "1280x1024x24"
+XVFB_TIMEOUT = 10.0
+SOLVE_TIMEOUT = 300.0
+
+
+@contextlib.contextmanager
+def virtual_display(force=False):
+    """
+    Arranca Xvfb y exporta DISPLAY mientras dura el bloque.
+    
+    Si ya hay una pantalla (DISPLAY definido) y force es False, la usa.
+    
+    Args:
+        force (bool): Arrancar Xvfb aunque haya pantalla
+    
+    Raises:
+        RuntimeError: Si no hay pantalla y Xvfb no está instalado o no arranca
+    """
+    if os.environ.get("DISPLAY") and not force:
+        yield os.environ["DISPLAY"]
+        return
+    
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise RuntimeError("No hay pantalla y Xvfb no está instalado (paquete xvfb).")
+    
+    # Xvfb elige un número de pantalla libre y lo escribe en el descriptor
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen(
+        [xvfb, "-displayfd", str(write_fd), "-screen", "0", SCREEN, "-nolisten", "tcp"],
+        pass_fds=(write_fd,),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    os.close(write_fd)
+    previous = os.environ.get("DISPLAY")
+    try:
+        number = _read_display_number(read_fd, process)
+        os.environ["DISPLAY"] = f":{number}"
+        yield os.environ["DISPLAY"]
+    finally:
+        os.close(read_fd)
+        process.terminate()
+        process.wait()
+        if previous is None:
+            os.environ.pop("DISPLAY", None)
+        else:
+            os.environ["DISPLAY"] = previous
+
+
+def _read_display_number(read_fd, process):
+    """Espera a que Xvfb informe su número de pantalla."""
+    deadline = time.monotonic() + XVFB_TIMEOUT
+    data = b""
+    while not data.endswith(b"\n"):
+        if process.poll() is not None or time.monotonic() > deadline:
+            raise RuntimeError("Xvfb no pudo arrancar.")
+        chunk = os.read(read_fd, 16)
+        if not chunk:
+            raise RuntimeError("Xvfb no pudo arrancar.")
+        data += chunk
+    return int(data)
+
+
+@contextlib.contextmanager
+def _captured_dialogs(errors):
+    """
+    Sustituye los cuadros de diálogo modales (que bloquearían el benchmark)
+    por funciones que guardan el mensaje.
+    """
+    from tkinter import messagebox
+    
+    originals = {name: getattr(messagebox, name) for name in ("showinfo", "showerror", "showwarning")}
+    messagebox.showinfo = lambda *args, **kwargs: None
+    messagebox.showwarning = lambda title, message, **kwargs: errors.append(message)
+    messagebox.showerror = lambda title, message, **kwargs: errors.append(message)
+    try:
+        yield
+    finally:
+        for name, function in originals.items():
+            setattr(messagebox, name, function)
+
+
+def _timed(root, function):
+    """Ejecuta function, procesa los eventos pendientes y devuelve los segundos."""
+    start = time.perf_counter()
+    function()
+    root.update()
+    return time.perf_counter() - start
+
+
+def _solve_round_trip(app, root):
+    """
+    Pulsa "Resolver" y espera a que el resultado esté en pantalla.
+    
+    Returns:
+        float: Segundos desde el clic hasta el resultado mostrado
+    """
+    # Sin modelo conservado: se mide la reconstrucción completa, no un parcheo
+    app._lp_model = None
+    start = time.perf_counter()
+    app._solve_problem()
+    root.update()
+    deadline = start + SOLVE_TIMEOUT
+    while app._active_model is not None:
+        if time.perf_counter() > deadline:
+            app._cancel_solve()
+            raise RuntimeError("La resolución superó el tiempo máximo del benchmark.")
+        root.update()
+        time.sleep(0.001)
+    return time.perf_counter() - start
+
+
+def _instance_texts(size, seed):
+    """Datos de una instancia n × n como textos de celda (formato de _fill_table)."""
+    instance = generate_instance(size, size, dense=True, seed=seed)
+    names = [f"X{j+1}" for j in range(size)]
+    objective = [f"{value:g}" for value in instance.c]
+    constraints = [
+        ([f"{value:g}" for value in instance.dense_row(i)], "<=", f"{instance.b[i]:g}")
+        for i in range(size)
+    ]
+    return names, objective, constraints
+
+
+def run_gui_benchmark(sizes, backend=None, seed=0, solve=True):
+    """
+    Ejecuta el benchmark de la interfaz (requiere una pantalla).
+    
+    Args:
+        sizes (list): Tamaños n de la tabla (n variables × n restricciones)
+        backend (str, optional): Backend para la resolución (por defecto, automático)
+        seed (int): Semilla de las instancias
+        solve (bool): Medir también la resolución completa
+    
+    Returns:
+        list: Casos con name, params, metrics e info
+    """
+    import tkinter as tk
+    
+    start = time.perf_counter()
+    from src.ui.main_window import LPSolverGUI
+    import_s = time.perf_counter() - start
+    
+    errors = []
+    cases = []
+    with _captured_dialogs(errors):
+        start = time.perf_counter()
+        root = tk.Tk()
+        app = LPSolverGUI(root)
+        root.update()
+        first_paint_s = time.perf_counter() - start
+        if backend:
+            app.backend_var.set(backend)
+        
+        try:
+            startup = {'import_s': import_s, 'first_paint_s': first_paint_s}
+            for number in range(1, 5):
+                load = getattr(app, f"_load_example_{number}")
+                startup[f'example_{number}_s'] = _timed(root, load)
+            cases.append({'name': 'gui-startup', 'params': {}, 'metrics': startup, 'info': {}})
+            
+            for size in sizes:
+                print(f"→ tabla {size}x{size}", file=sys.stderr)
+                metrics, info = {}, {}
+                # Instancias de maximización continuas, sin restos del último ejemplo
+                app.sense_var.set("Maximizar")
+                app.problem_data = None
+                app.num_vars.set(size)
+                app.num_constraints.set(size)
+                metrics['build_table_s'] = _timed(root, app._build_table)
+                names, objective, constraints = _instance_texts(size, seed)
+                metrics['fill_table_s'] = _timed(root, lambda: app._fill_table(names, objective, constraints))
+                metrics['model_preview_s'] = _timed(root, app._update_model_display)
+                if solve:
+                    del errors[:]
+                    metrics['solve_round_trip_s'] = _solve_round_trip(app, root)
+                    info['status'] = app.solve_status_label.cget("text")
+                    info['errors'] = list(errors)
+                    info['phase_timings'] = dict(app._gui_timings)
+                cases.append({
+                    'name': f'gui-{size}x{size}',
+                    'params': {'vars': size, 'constraints': size},
+                    'metrics': metrics,
+                    'info': info
+                })
+                summary = ", ".join(f"{k} {v * 1000:.1f} ms" for k, v in metrics.items())
+                print(f"  {summary}", file=sys.stderr)
+        finally:
+            root.destroy()
+    return cases
+
+
+def gui_main(args):
+    """
+    Comando 'gui': arranca Xvfb si hace falta, ejecuta el benchmark y escribe
+    el informe JSON.
+    
+    Args:
+        args (argparse.Namespace): Opciones de la línea de comandos
+    
+    Returns:
+        int: Código de salida (2 si no hay pantalla disponible)
+    """
+    from .report import write_report
+    
+    # Cada resolución debe llegar al solver, no a la caché
+    os.environ["LP_SOLVER_CACHE"] = "off"
+    try:
+        with virtual_display(force=args.xvfb):
+            cases = run_gui_benchmark(args.sizes, backend=args.backend, seed=args.seed, solve=not args.no_solve)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    write_report('gui', cases, args.output)
+    return 0
+
+
+def add_arguments(parser):
+    """Añade las opciones del comando 'gui'."""
+    parser.add_argument(
+        "--sizes", type=lambda text: [int(s) for s in text.split(",")], default=list(DEFAULT_SIZES),
+        help="Tamaños n de la tabla (n × n) separados por comas (por defecto 10,50,100)"
+    )
+    parser.add_argument("--backend", help="Backend de la resolución (por defecto, automático)")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de las instancias")
+    parser.add_argument("--no-solve", action="store_true", help="No medir la resolución completa")
+    parser.add_argument("--xvfb", action="store_true", help="Arrancar Xvfb aunque DISPLAY esté definido")
+    parser.add_argument("-o", "--output", help="Archivo JSON de salida (por defecto stdout)")
@@ -0,0 +1,227 @@
+"""
+Benchmark de LPModel: tiempo de construcción (create_problem + add_constraint
+y from_arrays), tiempo de resolución por backend y memoria máxima, en
+instancias PL y MIP densas y dispersas de 10 × 10 a 10 000 × 10 000.
+
+La memoria se mide con tracemalloc en una pasada aparte (para no inflar los
+tiempos) y solo cuenta la memoria de Python: no incluye la de los solvers
+nativos ni la del subproceso de CBC.
+
+Antes de medir se comprueba el arranque en caliente: en MIP pequeños
+aleatorios se cambia un coeficiente del objetivo y la nueva resolución en
+caliente debe dar el mismo estado y objetivo que una en frío.
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.models.lp_model import LPModel
+from src.models.solver_backends import available_backends
+
+from .instances import generate_instance
+
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+
+# Límites por defecto: una instancia densa de 10 000 × 10 000 tiene 10⁸
+# coeficientes y el símplex denso usa un tableau m × (n + m)
+DEFAULT_MAX_DENSE = 1000
+DEFAULT_MAX_SIMPLEX = 1000
+DEFAULT_TIME_LIMIT = 60.0
+
+# MIP aleatorios de la comprobación del arranque en caliente
+WARM_START_TRIALS = 200
+
+
+def build_with_constraints(instance):
+    """
+    Construye el modelo como la interfaz: create_problem y una llamada a
+    add_constraint por fila con la lista densa de coeficientes.
+    
+    Returns:
+        LPModel: Modelo construido
+    """
+    model = LPModel()
+    model.create_problem('Maximizar', instance.c.tolist(), integer_vars=[instance.integer] * instance.num_cols)
+    for i in range(instance.num_rows):
+        model.add_constraint(instance.dense_row(i), '<=', float(instance.b[i]), f"R{i+1}")
+    return model
+
+
+def _timed(function, repeat):
+    """Ejecuta function repeat veces y devuelve (mejor tiempo, último resultado)."""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _peak_memory(function):
+    """Memoria máxima de Python (bytes) durante function()."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _random_mip(rng):
+    """Argumentos de LPModel.from_arrays de un MIP pequeño con cotas superiores."""
+    num_rows, num_cols = rng.integers(1, 5, size=2)
+    return {
+        'sense': str(rng.choice(['Minimizar', 'Maximizar'])),
+        'c': rng.integers(-5, 6, size=num_cols) / 4,
+        'A': rng.integers(-3, 5, size=(num_rows, num_cols)).astype(float),
+        'senses': [str(s) for s in rng.choice(['<=', '>=', '='], size=num_rows, p=[0.5, 0.3, 0.2])],
+        'b': rng.integers(-3, 10, size=num_rows).astype(float),
+        'upper_bounds': rng.integers(1, 6, size=num_cols).astype(float).tolist(),
+        'integer_vars': (rng.random(num_cols) < 0.7).tolist()
+    }
+
+
+def check_warm_starts(backends, trials=WARM_START_TRIALS, seed=0):
+    """
+    Resuelve MIP aleatorios, cambia un coeficiente del objetivo y compara la
+    nueva resolución en caliente con una en frío del mismo backend.
+    
+    Args:
+        backends (list): Backends a comprobar
+        trials (int): Modelos por backend
+        seed (int): Semilla del generador
+    
+    Returns:
+        list: Descripción de cada diferencia (vacía si todas coinciden)
+    """
+    failures = []
+    for backend in backends:
+        if backend == 'simplex':
+            continue
+        rng = np.random.default_rng(seed)
+        for k in range(trials):
+            spec = _random_mip(rng)
+            var_index = int(rng.integers(0, len(spec['c'])))
+            coef = float(rng.integers(-5, 6)) / 4
+            model = LPModel.from_arrays(**spec)
+            if model.solve(use_cache=False, backend=backend, presolve=False)['status'] != 'Optimal':
+                continue
+            model.set_objective_coef(var_index, coef)
+            warm = model.solve(use_cache=False, backend=backend, presolve=False)
+            cold = model.solve(use_cache=False, backend=backend, presolve=False, warm_start=False)
+            if (warm['status'] != cold['status']
+                    or abs(warm.get('objective_value', 0) - cold.get('objective_value', 0)) > 1e-6):
+                failures.append(
+                    f"modelo {k + 1}, {backend}: en caliente {warm['status']} {warm.get('objective_value')}, "
+                    f"en frío {cold['status']} {cold.get('objective_value')}"
+                )
+    return failures
+
+
+def run_case(instance, backends, repeat=1, time_limit=DEFAULT_TIME_LIMIT, memory=True,
+             max_simplex=DEFAULT_MAX_SIMPLEX):
+    """
+    Mide una instancia.
+    
+    Args:
+        instance (Instance): Instancia generada
+        backends (list): Backends a medir
+        repeat (int): Repeticiones por medición (se guarda la mejor)
+        time_limit (float): Tiempo máximo por resolución
+        memory (bool): Medir también la memoria máxima
+        max_simplex (int): Tamaño máximo para el símplex denso
+    
+    Returns:
+        dict: Caso con name, params, metrics e info
+    """
+    metrics, info = {}, {}
+    metrics['build_s'], model = _timed(lambda: build_with_constraints(instance), repeat)
+    spec = instance.from_arrays_spec()
+    metrics['build_from_arrays_s'], _ = _timed(lambda: LPModel.from_arrays(**spec), repeat)
+    if memory:
+        metrics['build_peak_bytes'] = _peak_memory(lambda: build_with_constraints(instance))
+    
+    for backend in backends:
+        if backend == 'simplex' and (instance.integer or max(instance.num_rows, instance.num_cols) > max_simplex):
+            continue
+        # Sin caché ni arranque en caliente: cada repetición resuelve desde cero
+        def solve():
+            model._warm = None
+            return model.solve(time_limit=time_limit, use_cache=False, backend=backend)
+        
+        metrics[f'solve_{backend}_s'], result = _timed(solve, repeat)
+        info[f'{backend}_status'] = result['status']
+        info[f'{backend}_objective'] = result.get('objective_value')
+        if memory:
+            metrics[f'solve_{backend}_peak_bytes'] = _peak_memory(solve)
+    
+    return {
+        'name': instance.name,
+        'params': {
+            'rows': instance.num_rows,
+            'cols': instance.num_cols,
+            'nonzeros': instance.nonzeros,
+            'integer': instance.integer
+        },
+        'metrics': metrics,
+        'info': info
+    }
+
+
+def model_main(args):
+    """
+    Comando 'model': ejecuta el benchmark y escribe el informe JSON.
+    
+    Args:
+        args (argparse.Namespace): Opciones de la línea de comandos
+    
+    Returns:
+        int: Código de salida (1 si algún arranque en caliente da otro resultado que en frío)
+    """
+    from .report import write_report
+    
+    backends = args.backends or available_backends()
+    failures = check_warm_starts(backends, seed=args.seed)
+    for failure in failures:
+        print(f"✗ {failure}", file=sys.stderr)
+    
+    cases = []
+    for size in args.sizes:
+        for dense in (True, False):
+            if dense and size > args.max_dense:
+                continue
+            for integer in (False, True):
+                if integer and size > args.max_mip:
+                    continue
+                instance = generate_instance(size, size, dense=dense, integer=integer, seed=args.seed)
+                print(f"→ {instance.name} ({instance.nonzeros} coeficientes)", file=sys.stderr)
+                case = run_case(
+                    instance, backends, repeat=args.repeat, time_limit=args.time_limit,
+                    memory=not args.no_memory, max_simplex=args.max_simplex
+                )
+                cases.append(case)
+                summary = ", ".join(f"{k} {v * 1000:.1f} ms" for k, v in case['metrics'].items() if k.endswith('_s'))
+                print(f"  {summary}", file=sys.stderr)
+    write_report('model', cases, args.output)
+    return 1 if failures else 0
+
+
+def add_arguments(parser):
+    """Añade las opciones del comando 'model'."""
+    parser.add_argument(
+        "--sizes", type=lambda text: [int(s) for s in text.split(",")], default=list(DEFAULT_SIZES),
+        help="Tamaños n (instancias n × n) separados por comas (por defecto 10,100,1000,10000)"
+    )
+    parser.add_argument("--backends", type=lambda text: text.split(","), help="Backends separados por comas (por defecto, todos los disponibles)")
+    parser.add_argument("--max-dense", type=int, default=DEFAULT_MAX_DENSE, help="Tamaño máximo de las instancias densas")
+    parser.add_argument("--max-mip", type=int, default=DEFAULT_SIZES[-1], help="Tamaño máximo de las instancias MIP")
+    parser.add_argument("--max-simplex", type=int, default=DEFAULT_MAX_SIMPLEX, help="Tamaño máximo para el símplex denso")
+    parser.add_argument("-t", "--time-limit", type=float, default=DEFAULT_TIME_LIMIT, help="Tiempo máximo por resolución en segundos")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="Repeticiones por medición (se guarda la mejor)")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de las instancias")
+    parser.add_argument("--no-memory", action="store_true", help="No medir la memoria (más rápido)")
+    parser.add_argument("-o", "--output", help="Archivo JSON de salida (por defecto stdout)")
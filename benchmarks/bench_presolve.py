@@ -0,0 +1,384 @@
+"""
+Benchmark del presolve: resuelve cada instancia con y sin presolve y compara
+tiempos, reducciones y valor objetivo.
+
+Las instancias de instances.py se amplían con la estructura que deja la
+tabla de la interfaz: filas en blanco, variables sin usar, cotas escritas
+como restricciones de una variable (algunas repetidas) y restricciones
+copiadas con otra escala.
+
+Las instancias MIP son de localización de plantas escritas como en la
+tabla: cada planta se abre con una binaria y sus envíos se enlazan con un
+big-M holgado (10 veces la demanda total), con las cotas de binarias y
+envíos como filas de una variable. Se resuelven sin presolve, solo con el
+de PL y con el completo, y se comparan nodos y tiempos.
+
+Antes de medir se resuelven unos modelos borde (no acotados, sin filas
+tras el presolve, igualdades con desigualdades proporcionales, enteras con
+cotas fraccionarias) con cada backend, con y sin presolve, y se comprueba
+que todos den el mismo estado y objetivo.
+"""
+
+import sys
+
+import numpy as np
+
+from src.models.lp_model import LPModel
+from src.models.solver_backends import available_backends
+
+from .bench_model import DEFAULT_MAX_SIMPLEX, DEFAULT_TIME_LIMIT, _timed
+from .instances import generate_instance
+
+try:
+    from scipy.sparse import csr_matrix
+except ImportError:  # SciPy es opcional
+    csr_matrix = None
+
+
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_MIP_SIZES = (10, 20, 30)
+
+# Modos de LPModel.solve(presolve=...) que compara el benchmark MIP
+MIP_MODES = ((False, 'off'), ('lp', 'lp'), (True, 'mip'))
+
+# Múltiplo de la demanda total usado como big-M en las instancias MIP
+BIG_M_FACTOR = 10
+
+# Proporciones de la estructura redundante respecto del tamaño de la instancia
+EMPTY_ROWS = 0.2
+UNUSED_COLUMNS = 0.2
+DUPLICATE_ROWS = 0.2
+
+# Modelos borde (sense, c, A, senses, b, opciones) y estado esperado
+EDGE_CASES = (
+    # Variable libre que no aparece en ninguna fila: el presolve deja 0 filas
+    (('Minimizar', [1, -1], [[1, 0]], ['<='], [4], {'lower_bounds': [0, None]}), 'Unbounded'),
+    # Cotas escritas como filas de una variable: el presolve deja 0 filas
+    (('Maximizar', [1, 2], [[1, 0], [0, 1]], ['<=', '<='], [4.5, 3.5], {'integer_vars': [True, True]}), 'Optimal'),
+    (('Maximizar', [1, 2], [[1, 0], [0, 1]], ['<=', '<='], [4, 3], {}), 'Optimal'),
+    # Igualdad con una desigualdad proporcional que la excluye (o la admite),
+    # también con la desigualdad a escala negativa
+    (('Maximizar', [1, 1], [[1, 1], [2, 2]], ['=', '<='], [4, -4], {}), 'Infeasible'),
+    (('Maximizar', [1, 1], [[1, 1], [2, 2]], ['=', '>='], [4, 10], {}), 'Infeasible'),
+    (('Maximizar', [1, 1], [[1, 1], [-2, -2]], ['=', '<='], [4, -10], {}), 'Infeasible'),
+    (('Maximizar', [1, 1], [[1, 1], [-2, -2]], ['=', '>='], [4, -4], {}), 'Infeasible'),
+    (('Maximizar', [1, 1], [[1, 1], [2, 2]], ['=', '<='], [4, 10], {}), 'Optimal'),
+    (('Maximizar', [1, 1], [[1, 1], [2, 2]], ['=', '>='], [4, -4], {}), 'Optimal'),
+    (('Maximizar', [1, 1], [[1, 1], [2, 2], [3, 3]], ['=', '<=', '>='], [4, 9, 11], {'integer_vars': [True, True]}), 'Optimal'),
+    (('Maximizar', [1, 1], [[1, 1], [2, 2], [3, 3]], ['=', '<=', '>='], [4, 9, 13], {'integer_vars': [True, True]}), 'Infeasible'),
+    # Entera sin valores enteros entre sus cotas
+    (('Maximizar', [1], [[1]], ['<='], [0.7], {'lower_bounds': [0.2], 'integer_vars': [True]}), 'Infeasible'),
+)
+
+
+def grid_like_spec(instance, seed=0):
+    """
+    Argumentos de LPModel.from_arrays con la instancia y la estructura
+    redundante de un modelo escrito en la tabla.
+    
+    Args:
+        instance (Instance): Instancia generada
+        seed (int): Semilla del generador
+    
+    Returns:
+        dict: sense, c, A, senses, b e integer_vars
+    """
+    rng = np.random.default_rng(seed)
+    num_rows, num_cols = instance.num_rows, instance.num_cols
+    unused = max(1, int(num_cols * UNUSED_COLUMNS))
+    total_cols = num_cols + unused
+    
+    rows = np.repeat(np.arange(num_rows), np.diff(instance.indptr))
+    blocks = [(rows, instance.indices, instance.data)]
+    b = [instance.b]
+    next_row = num_rows
+    
+    # Restricciones copiadas con otra escala y un lado derecho más holgado
+    copied = rng.choice(num_rows, size=max(1, int(num_rows * DUPLICATE_ROWS)), replace=False)
+    for k, row in enumerate(np.sort(copied).tolist()):
+        start, end = instance.indptr[row], instance.indptr[row + 1]
+        blocks.append((np.full(end - start, next_row + k), instance.indices[start:end], instance.data[start:end] * 2))
+    b.append(instance.b[np.sort(copied)] * 2 + 1)
+    next_row += len(copied)
+    
+    # Cotas superiores como filas de una variable; la mitad se repite más holgada
+    upper = np.ceil(instance.b.max() / instance.data.min()) + 1
+    bounded = np.concatenate([np.arange(total_cols), np.arange(0, total_cols, 2)])
+    blocks.append((next_row + np.arange(len(bounded)), bounded, np.ones(len(bounded))))
+    b.append(np.where(np.arange(len(bounded)) < total_cols, upper, upper * 2))
+    next_row += len(bounded)
+    
+    # Filas en blanco al final de la tabla
+    empty = max(1, int(num_rows * EMPTY_ROWS))
+    b.append(np.zeros(empty))
+    total_rows = next_row + empty
+    
+    all_rows = np.concatenate([block[0] for block in blocks])
+    all_cols = np.concatenate([block[1] for block in blocks])
+    all_values = np.concatenate([block[2] for block in blocks])
+    if csr_matrix is not None:
+        A = csr_matrix((all_values, (all_rows, all_cols)), shape=(total_rows, total_cols))
+    else:
+        A = np.zeros((total_rows, total_cols))
+        A[all_rows, all_cols] = all_values
+    return {
+        'sense': 'Maximizar',
+        # Las variables sin usar no aportan al objetivo o lo empeoran
+        'c': np.concatenate([instance.c, -rng.integers(0, 2, size=unused).astype(float)]),
+        'A': A,
+        'senses': ['<='] * total_rows,
+        'b': np.concatenate(b),
+        'integer_vars': [instance.integer] * total_cols
+    }
+
+
+def facility_spec(num_facilities, num_customers, seed=0):
+    """
+    Argumentos de LPModel.from_arrays de una instancia de localización de plantas.
+    
+    Variables: y_i (abrir la planta i, entera con fila y_i <= 1) y x_ij
+    (envío de i a j, con fila x_ij <= u_ij). Minimiza costo fijo más costo
+    de envío sujeto a la demanda de cada cliente y a sum_j x_ij <= M·y_i.
+    
+    Args:
+        num_facilities (int): Número de plantas
+        num_customers (int): Número de clientes
+        seed (int): Semilla del generador
+    
+    Returns:
+        dict: sense, c, A, senses, b e integer_vars
+    """
+    rng = np.random.default_rng(seed)
+    demand = rng.integers(5, 30, size=num_customers).astype(float)
+    fixed_cost = rng.integers(100, 400, size=num_facilities).astype(float)
+    shipping_cost = rng.integers(1, 20, size=(num_facilities, num_customers)).astype(float)
+    arc_bound = np.ceil(rng.uniform(0.1, 0.5, size=(num_facilities, num_customers)) * demand)
+    big_m = BIG_M_FACTOR * demand.sum()
+    
+    num_arcs = num_facilities * num_customers
+    facility = np.repeat(np.arange(num_facilities), num_customers)
+    customer = np.tile(np.arange(num_customers), num_facilities)
+    arc = num_facilities + np.arange(num_arcs)  # Columna de x_ij
+    
+    # Demanda, enlace big-M, cotas de y y cotas de x, en ese orden de filas
+    link_row = num_customers + facility
+    y_bound_row = num_customers + num_facilities + np.arange(num_facilities)
+    x_bound_row = num_customers + 2 * num_facilities + np.arange(num_arcs)
+    rows = np.concatenate([customer, link_row, num_customers + np.arange(num_facilities), y_bound_row, x_bound_row])
+    cols = np.concatenate([arc, arc, np.arange(num_facilities), np.arange(num_facilities), arc])
+    values = np.concatenate([
+        np.ones(num_arcs), np.ones(num_arcs), np.full(num_facilities, -big_m),
+        np.ones(num_facilities), np.ones(num_arcs)
+    ])
+    num_rows = num_customers + 2 * num_facilities + num_arcs
+    shape = (num_rows, num_facilities + num_arcs)
+    if csr_matrix is not None:
+        A = csr_matrix((values, (rows, cols)), shape=shape)
+    else:
+        A = np.zeros(shape)
+        A[rows, cols] = values
+    return {
+        'sense': 'Minimizar',
+        'c': np.concatenate([fixed_cost, shipping_cost.ravel()]),
+        'A': A,
+        'senses': ['>='] * num_customers + ['<='] * (num_rows - num_customers),
+        'b': np.concatenate([demand, np.zeros(num_facilities), np.ones(num_facilities), arc_bound.ravel()]),
+        'integer_vars': [True] * num_facilities + [False] * num_arcs
+    }
+
+
+def check_edge_cases(backends):
+    """
+    Resuelve los modelos de EDGE_CASES con cada backend, con y sin presolve.
+    
+    Args:
+        backends (list): Backends a comprobar
+    
+    Returns:
+        list: Descripción de cada resultado distinto del esperado (vacía si
+              todos coinciden)
+    """
+    failures = []
+    for k, ((sense, c, A, senses, b, options), expected) in enumerate(EDGE_CASES):
+        objectives = set()
+        for backend in backends:
+            if backend == 'simplex' and options.get('integer_vars'):
+                continue
+            for presolve in (False, True):
+                model = LPModel.from_arrays(sense, c, A, senses, b, **options)
+                try:
+                    result = model.solve(use_cache=False, backend=backend, presolve=presolve)
+                except Exception as error:
+                    failures.append(f"caso {k + 1}, {backend}, presolve={presolve}: {error}")
+                    continue
+                if result['status'] != expected:
+                    failures.append(
+                        f"caso {k + 1}, {backend}, presolve={presolve}: {result['status']} (se esperaba {expected})"
+                    )
+                elif 'objective_value' in result:
+                    objectives.add(round(result['objective_value'], 6))
+        if len(objectives) > 1:
+            failures.append(f"caso {k + 1}: objetivos distintos {sorted(objectives)}")
+    return failures
+
+
+def run_case(instance, backends, repeat=1, time_limit=DEFAULT_TIME_LIMIT, max_simplex=DEFAULT_MAX_SIMPLEX):
+    """
+    Mide una instancia con y sin presolve.
+    
+    Args:
+        instance (Instance): Instancia generada
+        backends (list): Backends a medir
+        repeat (int): Repeticiones por medición (se guarda la mejor)
+        time_limit (float): Tiempo máximo por resolución
+        max_simplex (int): Tamaño máximo para el símplex denso
+    
+    Returns:
+        dict: Caso con name, params, metrics e info
+    """
+    spec = grid_like_spec(instance)
+    model = LPModel.from_arrays(**spec)
+    metrics, info = {}, {}
+    
+    for backend in backends:
+        if backend == 'simplex' and (instance.integer or max(spec['A'].shape) > max_simplex):
+            continue
+        for presolve, suffix in ((False, ''), (True, '_presolve')):
+            # Sin caché ni arranque en caliente: cada repetición resuelve desde cero
+            def solve():
+                model._warm = None
+                return model.solve(time_limit=time_limit, use_cache=False, backend=backend, presolve=presolve)
+            
+            metrics[f'solve_{backend}{suffix}_s'], result = _timed(solve, repeat)
+            info[f'{backend}{suffix}_status'] = result['status']
+            info[f'{backend}{suffix}_objective'] = result.get('objective_value')
+        info[f'{backend}_saved_s'] = metrics[f'solve_{backend}_s'] - metrics[f'solve_{backend}_presolve_s']
+        if 'presolve' in result:
+            metrics['presolve_s'] = result['presolve']['seconds']
+            info['presolve'] = {key: value for key, value in result['presolve'].items() if key != 'seconds'}
+    
+    return {
+        'name': f"{instance.name}-grid",
+        'params': {
+            'rows': spec['A'].shape[0],
+            'cols': spec['A'].shape[1],
+            'integer': instance.integer
+        },
+        'metrics': metrics,
+        'info': info
+    }
+
+
+def run_mip_case(num_facilities, backends, repeat=1, time_limit=DEFAULT_TIME_LIMIT, seed=0):
+    """
+    Mide una instancia de localización sin presolve, con el de PL y con el completo.
+    
+    Args:
+        num_facilities (int): Número de plantas (los clientes son el doble)
+        backends (list): Backends a medir (se omiten los que no admiten enteras)
+        repeat (int): Repeticiones por medición (se guarda la mejor)
+        time_limit (float): Tiempo máximo por resolución
+        seed (int): Semilla de la instancia
+    
+    Returns:
+        dict: Caso con name, params, metrics e info
+    """
+    spec = facility_spec(num_facilities, 2 * num_facilities, seed=seed)
+    model = LPModel.from_arrays(**spec)
+    metrics, info = {}, {}
+    
+    for backend in backends:
+        if backend == 'simplex':
+            continue
+        for presolve, mode in MIP_MODES:
+            def solve():
+                model._warm = None
+                return model.solve(time_limit=time_limit, use_cache=False, backend=backend, presolve=presolve)
+            
+            metrics[f'solve_{backend}_{mode}_s'], result = _timed(solve, repeat)
+            info[f'{backend}_{mode}_status'] = result['status']
+            info[f'{backend}_{mode}_objective'] = result.get('objective_value')
+            info[f'{backend}_{mode}_nodes'] = result['nodes']
+        if 'presolve' in result:
+            metrics['presolve_s'] = result['presolve']['seconds']
+            info['presolve'] = {key: value for key, value in result['presolve'].items() if key != 'seconds'}
+    
+    return {
+        'name': f"mip-facility-{num_facilities}x{2 * num_facilities}",
+        'params': {
+            'rows': spec['A'].shape[0],
+            'cols': spec['A'].shape[1],
+            'integer': True
+        },
+        'metrics': metrics,
+        'info': info
+    }
+
+
+def presolve_main(args):
+    """
+    Comando 'presolve': ejecuta el benchmark y escribe el informe JSON.
+    
+    Args:
+        args (argparse.Namespace): Opciones de la línea de comandos
+    
+    Returns:
+        int: Código de salida (1 si algún modelo borde da un resultado distinto del esperado)
+    """
+    from .report import write_report
+    
+    backends = args.backends or available_backends()
+    failures = check_edge_cases(backends)
+    for failure in failures:
+        print(f"✗ {failure}", file=sys.stderr)
+    
+    cases = []
+    for size in args.sizes:
+        instance = generate_instance(size, size, dense=False, integer=False, seed=args.seed)
+        print(f"→ {instance.name}-grid", file=sys.stderr)
+        case = run_case(instance, backends, repeat=args.repeat, time_limit=args.time_limit,
+                        max_simplex=args.max_simplex)
+        cases.append(case)
+        stats = case['info'].get('presolve', {})
+        print(f"  -{stats.get('rows_removed', 0)} filas, -{stats.get('columns_removed', 0)} columnas", file=sys.stderr)
+        for backend in backends:
+            if f'solve_{backend}_s' in case['metrics']:
+                print(
+                    f"  {backend}: {case['metrics'][f'solve_{backend}_s'] * 1000:.1f} ms → "
+                    f"{case['metrics'][f'solve_{backend}_presolve_s'] * 1000:.1f} ms",
+                    file=sys.stderr
+                )
+    
+    for size in args.mip_sizes:
+        print(f"→ mip-facility-{size}x{2 * size}", file=sys.stderr)
+        case = run_mip_case(size, backends, repeat=args.repeat, time_limit=args.time_limit, seed=args.seed)
+        cases.append(case)
+        for backend in backends:
+            if f'solve_{backend}_off_s' in case['metrics']:
+                summary = ", ".join(
+                    f"{mode} {case['metrics'][f'solve_{backend}_{mode}_s'] * 1000:.1f} ms "
+                    f"({case['info'][f'{backend}_{mode}_nodes']} nodos)"
+                    for _, mode in MIP_MODES
+                )
+                print(f"  {backend}: {summary}", file=sys.stderr)
+    write_report('presolve', cases, args.output)
+    return 1 if failures else 0
+
+
+def add_arguments(parser):
+    """Añade las opciones del comando 'presolve'."""
+    parser.add_argument(
+        "--sizes", type=lambda text: [int(s) for s in text.split(",")], default=list(DEFAULT_SIZES),
+        help="Tamaños n (instancias n × n antes de ampliarlas) separados por comas (por defecto 10,100,1000)"
+    )
+    parser.add_argument(
+        "--mip-sizes", type=lambda text: [int(s) for s in text.split(",")] if text else [],
+        default=list(DEFAULT_MIP_SIZES),
+        help="Plantas de las instancias MIP (con el doble de clientes) separadas por comas (por defecto 10,20,30)"
+    )
+    parser.add_argument("--backends", type=lambda text: text.split(","), help="Backends separados por comas (por defecto, todos los disponibles)")
+    parser.add_argument("--max-simplex", type=int, default=DEFAULT_MAX_SIMPLEX, help="Tamaño máximo para el símplex denso")
+    parser.add_argument("-t", "--time-limit", type=float, default=DEFAULT_TIME_LIMIT, help="Tiempo máximo por resolución en segundos")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="Repeticiones por medición (se guarda la mejor)")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de las instancias")
+    parser.add_argument("-o", "--output", help="Archivo JSON de salida (por defecto stdout)")
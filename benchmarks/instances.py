@@ -0,0 +1,122 @@
+"""
+Generador de instancias de PL y MIP reproducibles para los benchmarks.
+
+Todas las instancias son de maximización con coeficientes positivos y
+restricciones '<=': x = 0 es factible y cada columna aparece en al menos
+una fila, así que el óptimo existe y es finito. La matriz se genera en CSR
+para que las instancias dispersas grandes no ocupen memoria densa.
+"""
+
+import numpy as np
+
+try:
+    from scipy.sparse import csr_matrix
+except ImportError:  # SciPy es opcional
+    csr_matrix = None
+
+
+# Coeficientes distintos de cero por fila en las instancias dispersas
+SPARSE_NONZEROS_PER_ROW = 5
+
+
+class Instance:
+    """Instancia generada: datos del modelo en forma matricial con A en CSR."""
+    
+    def __init__(self, name, c, indptr, indices, data, b, integer):
+        self.name = name
+        self.c = c
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.b = b
+        self.integer = integer
+    
+    @property
+    def num_rows(self):
+        return len(self.b)
+    
+    @property
+    def num_cols(self):
+        return len(self.c)
+    
+    @property
+    def nonzeros(self):
+        return int(self.indptr[-1])
+    
+    def dense_row(self, i):
+        """
+        Fila i como lista densa de coeficientes (formato de add_constraint).
+        
+        Args:
+            i (int): Posición de la fila
+        
+        Returns:
+            list: num_cols coeficientes
+        """
+        row = np.zeros(self.num_cols)
+        start, end = self.indptr[i], self.indptr[i + 1]
+        row[self.indices[start:end]] = self.data[start:end]
+        return row.tolist()
+    
+    def from_arrays_spec(self):
+        """
+        Argumentos de LPModel.from_arrays (A disperso si SciPy está instalado).
+        
+        Returns:
+            dict: sense, c, A, senses, b e integer_vars
+        """
+        shape = (self.num_rows, self.num_cols)
+        if csr_matrix is not None:
+            A = csr_matrix((self.data, self.indices, self.indptr), shape=shape)
+        else:
+            A = np.zeros(shape)
+            A[np.repeat(np.arange(self.num_rows), np.diff(self.indptr)), self.indices] = self.data
+        return {
+            'sense': 'Maximizar',
+            'c': self.c,
+            'A': A,
+            'senses': ['<='] * self.num_rows,
+            'b': self.b,
+            'integer_vars': [self.integer] * self.num_cols
+        }
+
+
+def generate_instance(num_rows, num_cols, dense=True, integer=False, seed=0):
+    """
+    Genera una instancia aleatoria reproducible.
+    
+    Args:
+        num_rows (int): Número de restricciones
+        num_cols (int): Número de variables
+        dense (bool): Matriz completa o con SPARSE_NONZEROS_PER_ROW por fila
+        integer (bool): Todas las variables enteras (MIP)
+        seed (int): Semilla del generador
+    
+    Returns:
+        Instance: Instancia con nombre '<lp|mip>-<dense|sparse>-<filas>x<columnas>'
+    """
+    rng = np.random.default_rng(seed)
+    name = f"{'mip' if integer else 'lp'}-{'dense' if dense else 'sparse'}-{num_rows}x{num_cols}"
+    
+    if dense:
+        rows = np.repeat(np.arange(num_rows), num_cols)
+        cols = np.tile(np.arange(num_cols), num_rows)
+    else:
+        per_row = min(SPARSE_NONZEROS_PER_ROW, num_cols)
+        rows = np.repeat(np.arange(num_rows), per_row)
+        cols = rng.integers(0, num_cols, size=num_rows * per_row)
+        # Cada columna en al menos una fila para que el problema sea acotado
+        forced = np.arange(num_cols)
+        rows = np.concatenate([rows, forced % num_rows])
+        cols = np.concatenate([cols, forced])
+        # Posiciones únicas, ya ordenadas por fila y columna
+        keys = np.unique(rows.astype(np.int64) * num_cols + cols)
+        rows, cols = keys // num_cols, keys % num_cols
+    
+    data = rng.uniform(1.0, 10.0, size=len(rows)).round(2)
+    indptr = np.zeros(num_rows + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(rows, minlength=num_rows))
+    row_sums = np.bincount(rows, weights=data, minlength=num_rows)
+    b = (row_sums * rng.uniform(0.2, 0.6, size=num_rows)).round(2)
+    c = rng.uniform(1.0, 10.0, size=num_cols).round(2)
+    return Instance(name, c, indptr, cols.astype(np.int64), data, b, integer)
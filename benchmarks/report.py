@@ -0,0 +1,171 @@
+"""
+Formato JSON de los resultados y comparación contra una línea base.
+
+Un informe es:
+    
+    {
+        "suite": "model",
+        "machine": {...},
+        "cases": [
+            {"name": "lp-sparse-100x100", "params": {...},
+             "metrics": {"build_s": 0.01, ...}, "info": {...}}
+        ]
+    }
+
+Todas las métricas son "menor es mejor": segundos (sufijo _s) o bytes
+(sufijo _bytes). "info" guarda datos no comparables (estados, objetivos).
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+
+# Diferencias absolutas por debajo de estas se consideran ruido
+MIN_DELTA_SECONDS = 0.005
+MIN_DELTA_BYTES = 1024 * 1024
+
+DEFAULT_THRESHOLD = 0.25
+
+
+def machine_info():
+    """
+    Datos del entorno que afectan a los tiempos.
+    
+    Returns:
+        dict: Python, plataforma, núcleos, versiones de NumPy y PuLP y fecha
+    """
+    try:
+        import pulp
+        pulp_version = pulp.__version__
+    except (ImportError, AttributeError):
+        pulp_version = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pulp': pulp_version,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+
+def write_report(suite, cases, path=None):
+    """
+    Escribe el informe como JSON en un archivo o en stdout.
+    
+    Args:
+        suite (str): Nombre del conjunto de benchmarks
+        cases (list): Casos con name, params, metrics e info
+        path (str, optional): Archivo de salida (None = stdout)
+    """
+    report = {'suite': suite, 'machine': machine_info(), 'cases': cases}
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+def load_report(path):
+    """
+    Lee un informe JSON.
+    
+    Args:
+        path (str): Ruta del archivo
+    
+    Returns:
+        dict: Informe
+    
+    Raises:
+        ValueError: Si el archivo no tiene el formato de informe
+    """
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    if not isinstance(report, dict) or 'cases' not in report:
+        raise ValueError(f"'{path}' no es un informe de benchmarks.")
+    return report
+
+
+def compare_reports(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara las métricas de dos informes caso por caso.
+    
+    Una métrica empeora si supera a la base en más de threshold (relativo)
+    y en más de MIN_DELTA_SECONDS o MIN_DELTA_BYTES (absoluto).
+    
+    Args:
+        baseline (dict): Informe de referencia
+        current (dict): Informe nuevo
+        threshold (float): Aumento relativo tolerado (0.25 = 25 %)
+    
+    Returns:
+        list: Tuplas (caso, métrica, base, actual, cociente, empeoró)
+    """
+    base_cases = {case['name']: case['metrics'] for case in baseline['cases']}
+    rows = []
+    for case in current['cases']:
+        base_metrics = base_cases.get(case['name'])
+        if base_metrics is None:
+            continue
+        for metric, value in case['metrics'].items():
+            base = base_metrics.get(metric)
+            if base is None or value is None:
+                continue
+            min_delta = MIN_DELTA_BYTES if metric.endswith('_bytes') else MIN_DELTA_SECONDS
+            ratio = value / base if base > 0 else float('inf') if value > 0 else 1.0
+            regressed = value > base * (1 + threshold) and value - base > min_delta
+            rows.append((case['name'], metric, base, value, ratio, regressed))
+    return rows
+
+
+def format_comparison(rows):
+    """
+    Tabla legible de la comparación.
+    
+    Args:
+        rows (list): Resultado de compare_reports
+    
+    Returns:
+        str: Una línea por métrica, marcando las que empeoraron
+    """
+    lines = [f"{'Caso':<28}{'Métrica':<28}{'Base':>14}{'Actual':>14}{'Cociente':>10}"]
+    for name, metric, base, value, ratio, regressed in rows:
+        mark = "  ✗ EMPEORÓ" if regressed else ""
+        lines.append(
+            f"{name:<28}{metric:<28}{_format_metric(metric, base):>14}"
+            f"{_format_metric(metric, value):>14}{ratio:>10.2f}{mark}"
+        )
+    return "\n".join(lines)
+
+
+def _format_metric(metric, value):
+    """Formatea segundos en ms y bytes en MiB."""
+    if metric.endswith('_bytes'):
+        return f"{value / (1024 * 1024):.1f} MiB"
+    return f"{value * 1000:.2f} ms"
+
+
+def compare_main(args):
+    """
+    Comando 'compare': devuelve 1 si alguna métrica empeoró.
+    
+    Args:
+        args (argparse.Namespace): baseline, current y threshold
+    
+    Returns:
+        int: Código de salida
+    """
+    rows = compare_reports(load_report(args.baseline), load_report(args.current), args.threshold)
+    print(format_comparison(rows))
+    regressions = sum(1 for row in rows if row[5])
+    if regressions:
+        print(f"\n{regressions} métrica(s) empeoraron más de {args.threshold:.0%}.", file=sys.stderr)
+        return 1
+    print(f"\nSin regresiones ({len(rows)} métricas comparadas).", file=sys.stderr)
+    return 0
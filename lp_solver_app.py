@@ -7,16 +7,28 @@ Autor: Proyecto Final
 Versión: 1.0.0
 Descripción: Aplicación de escritorio para resolver problemas de Programación Lineal
              con 2 variables de decisión y 3 restricciones usando PuLP y Tkinter.
+
+Uso:
+    python lp_solver_app.py                    # Interfaz gráfica
+    python lp_solver_app.py solve <archivo>    # Resolver un archivo (sin interfaz)
+    python lp_solver_app.py batch <directorio> # Resolver un directorio (sin interfaz)
 """
 
-import tkinter as tk
-from src.ui.main_window import LPSolverGUI
+import sys
 
 
 def main():
     """
     Función principal que inicializa y ejecuta la aplicación.
     """
+    # Con argumentos se usa el modo de línea de comandos, que nunca importa tkinter
+    if len(sys.argv) > 1:
+        from src.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    
+    import tkinter as tk
+    from src.ui.main_window import LPSolverGUI
+    
     # Crear la ventana principal
     root = tk.Tk()
     
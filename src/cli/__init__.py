@@ -0,0 +1,8 @@
+"""
+Modo de línea de comandos (sin interfaz gráfica) de la aplicación de Programación Lineal.
+No importa tkinter ni src.ui, por lo que funciona en servidores sin pantalla.
+"""
+
+from .commands import main
+
+__all__ = ['main']
@@ -0,0 +1,155 @@
+"""
+Comandos 'solve' y 'batch' para resolver archivos de problema sin interfaz gráfica.
+Los resultados se escriben como líneas JSON (un objeto por problema).
+El comando 'convert' pasa un problema a formato MPS, CPLEX LP o proyecto (.npz).
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+from ..models.batch_solver import solve_batch, BatchStats
+from ..models.lp_model import LPModel
+from ..models.solver_backends import AUTO, BACKENDS
+from ..utils.model_formats import write_lp, write_mps
+from ..utils.problem_files import read_problem_file
+from ..utils.project_files import PROJECT_EXTENSION, save_project
+
+
+def _write_project(model, path):
+    """Guarda el modelo como archivo de proyecto."""
+    save_project(path, model.to_arrays())
+
+
+# Escritores según la extensión del archivo de salida de 'convert'
+WRITERS = {'.mps': write_mps, '.lp': write_lp, PROJECT_EXTENSION: _write_project}
+
+
+def _problem_files(directory, pattern):
+    """Lista ordenada de archivos de problema en un directorio."""
+    return sorted(glob.glob(os.path.join(directory, pattern)))
+
+
+def _write_records(records, output, stats):
+    """
+    Escribe cada registro como una línea JSON a medida que llega.
+    
+    Returns:
+        int: 0 si todos los problemas se procesaron, 1 si alguno falló
+    """
+    exit_code = 0
+    for record in records:
+        stats.add(record)
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+        if record['status'] == 'Error':
+            exit_code = 1
+    return exit_code
+
+
+def _add_backend_argument(parser):
+    """Añade la opción para elegir el solver."""
+    parser.add_argument(
+        "-b", "--backend", default=AUTO, choices=[AUTO] + list(BACKENDS),
+        help="Solver a usar (por defecto 'auto', según tamaño e integralidad)"
+    )
+
+
+def build_parser():
+    """Construye el parser de argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        prog="lp_solver_app.py",
+        description="Solucionador de Programación Lineal (modo sin interfaz gráfica)."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    solve_parser = subparsers.add_parser("solve", help="Resuelve un archivo de problema")
+    solve_parser.add_argument("file", help="Archivo de problema (.json, .mps, .lp o .npz)")
+    solve_parser.add_argument("-o", "--output", help="Archivo de salida JSON lines (por defecto stdout)")
+    solve_parser.add_argument("-t", "--timeout", type=float, help="Tiempo máximo en segundos")
+    solve_parser.add_argument("--no-cache", action="store_true", help="No reutilizar resultados en caché")
+    _add_backend_argument(solve_parser)
+    
+    batch_parser = subparsers.add_parser("batch", help="Resuelve todos los problemas de un directorio")
+    batch_parser.add_argument("directory", help="Directorio con archivos de problema")
+    batch_parser.add_argument("-p", "--pattern", default="*.json", help="Patrón de archivos (por defecto *.json)")
+    batch_parser.add_argument("-o", "--output", help="Archivo de salida JSON lines (por defecto stdout)")
+    batch_parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="Número de procesos en paralelo (por defecto, uno por núcleo)"
+    )
+    batch_parser.add_argument("-t", "--timeout", type=float, help="Tiempo máximo por instancia en segundos")
+    batch_parser.add_argument("--no-cache", action="store_true", help="No reutilizar resultados en caché")
+    _add_backend_argument(batch_parser)
+    batch_parser.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="No mostrar el resumen de rendimiento en stderr"
+    )
+    
+    convert_parser = subparsers.add_parser("convert", help="Convierte un problema a MPS, CPLEX LP o proyecto")
+    convert_parser.add_argument("input", help="Archivo de problema (.json, .mps, .lp o .npz)")
+    convert_parser.add_argument("output", help="Archivo de salida (.mps, .lp o .npz)")
+    
+    return parser
+
+
+def _convert(input_path, output_path):
+    """
+    Lee un problema y lo escribe en el formato indicado por la extensión de salida.
+    
+    Returns:
+        int: Código de salida del proceso
+    """
+    writer = WRITERS.get(os.path.splitext(output_path)[1].lower())
+    if writer is None:
+        print(f"Error: la salida debe ser .mps, .lp o .npz, no '{output_path}'.", file=sys.stderr)
+        return 2
+    try:
+        model = LPModel.from_arrays(**read_problem_file(input_path))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    writer(model, output_path)
+    return 0
+
+
+def main(argv=None):
+    """
+    Punto de entrada del modo de línea de comandos.
+    
+    Args:
+        argv (list, optional): Argumentos (por defecto sys.argv[1:])
+    
+    Returns:
+        int: Código de salida del proceso
+    """
+    args = build_parser().parse_args(argv)
+    
+    if args.command == "convert":
+        return _convert(args.input, args.output)
+    if args.command == "solve":
+        files = [args.file]
+        workers = 1
+    else:
+        if not os.path.isdir(args.directory):
+            print(f"Error: '{args.directory}' no es un directorio.", file=sys.stderr)
+            return 2
+        files = _problem_files(args.directory, args.pattern)
+        workers = args.workers
+    
+    stats = BatchStats()
+    records = solve_batch(
+        files, max_workers=workers, time_limit=args.timeout,
+        use_cache=not args.no_cache, backend=args.backend
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            exit_code = _write_records(records, output, stats)
+    else:
+        exit_code = _write_records(records, sys.stdout, stats)
+    
+    if args.command == "batch" and not args.quiet:
+        print(stats.format_summary(), file=sys.stderr)
+    return exit_code
@@ -3,5 +3,6 @@ Módulo de modelos para la aplicación de Programación Lineal.
 """
 
 from .lp_model import LPModel
+from .problem_data import ProblemData
 
-__all__ = ['LPModel']
+__all__ = ['LPModel', 'ProblemData']
@@ -0,0 +1,194 @@
+"""
+Resolución en lote de muchos problemas independientes.
+Reparte las instancias entre procesos con ProcessPoolExecutor y devuelve los
+resultados en orden de finalización, junto con estadísticas de rendimiento.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .lp_model import LPModel
+from .solver_backends import AUTO
+from ..utils.problem_files import read_problem_file
+from ..utils.timing import PhaseTimer
+
+
+# Margen sobre el límite de tiempo antes de matar el subproceso del solver
+TIMEOUT_GRACE = 1.0
+
+
+def solve_instance(instance, time_limit=None, use_cache=True, backend=AUTO):
+    """
+    Construye y resuelve una instancia, devolviendo un registro serializable a JSON.
+    
+    Args:
+        instance (str o dict): Ruta de un archivo de problema o diccionario con
+            los argumentos de LPModel.from_arrays
+        time_limit (float, optional): Tiempo máximo por instancia en segundos
+        use_cache (bool): Reutilizar resultados de instancias idénticas
+        backend (str): Solver a usar (ver solver_backends.py)
+    
+    Returns:
+        dict: Registro con el estado, el valor objetivo, los valores de las
+              variables, el tiempo de resolución ('elapsed') y sus fases ('timings')
+    """
+    record = {'file': instance} if isinstance(instance, str) else {}
+    start = time.perf_counter()
+    watchdog = None
+    timer = PhaseTimer()
+    try:
+        spec = read_problem_file(instance) if isinstance(instance, str) else instance
+        timer.lap('read')
+        model = LPModel.from_arrays(**spec)
+        timer.lap('build')
+        if time_limit is not None:
+            # El solver respeta el límite por sí mismo; el temporizador solo actúa si se excede
+            watchdog = threading.Timer(time_limit + TIMEOUT_GRACE, model.cancel)
+            watchdog.daemon = True
+            watchdog.start()
+        result = model.solve(time_limit=time_limit, use_cache=use_cache, backend=backend, sensitivity=False)
+    except Exception as e:
+        # Un fallo del solver en una instancia no debe detener el lote
+        record['status'] = 'Error'
+        record['error'] = str(e)
+    else:
+        record['status'] = 'TimeLimit' if result['status'] == 'Cancelled' else result['status']
+        record['status_code'] = result.get('status_code')
+        if 'solution_status' in result:
+            record['solution_status'] = result['solution_status']
+        if result.get('backend'):
+            record['backend'] = result['backend']
+        if result.get('cache_hit'):
+            record['cache_hit'] = True
+        if 'objective_value' in result:
+            record['objective_value'] = result['objective_value']
+            record['variable_values'] = result['variable_values']
+        timings = timer.as_dict()
+        timings.update(result.get('timings', {}))
+        timings['total'] = timings.get('total', 0.0) + timings['read'] + timings['build']
+        record['timings'] = timings
+    finally:
+        if watchdog is not None:
+            watchdog.cancel()
+    record['elapsed'] = time.perf_counter() - start
+    return record
+
+
+def _solve_task(key, instance, time_limit, use_cache, backend):
+    """Tarea ejecutada en cada proceso trabajador (debe ser de nivel de módulo)."""
+    record = solve_instance(instance, time_limit, use_cache, backend)
+    record['id'] = key
+    return record
+
+
+def solve_batch(instances, max_workers=None, time_limit=None, use_cache=True, backend=AUTO):
+    """
+    Resuelve muchas instancias en paralelo.
+    
+    Args:
+        instances (iterable): Rutas de archivo o diccionarios de problema. Si se
+            pasa un diccionario {id: instancia}, las claves se usan como 'id'.
+        max_workers (int, optional): Número de procesos (por defecto os.cpu_count()).
+            Con 1 se resuelve en el proceso actual, sin pool.
+        time_limit (float, optional): Tiempo máximo por instancia en segundos
+        use_cache (bool): Reutilizar resultados de instancias idénticas
+        backend (str): Solver a usar (ver solver_backends.py)
+    
+    Yields:
+        dict: Registro de cada instancia en orden de finalización
+    """
+    if isinstance(instances, dict):
+        items = list(instances.items())
+    else:
+        items = [
+            (instance if isinstance(instance, str) else index, instance)
+            for index, instance in enumerate(instances)
+        ]
+    
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    
+    if max_workers <= 1 or len(items) <= 1:
+        for key, instance in items:
+            yield _solve_task(key, instance, time_limit, use_cache, backend)
+        return
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_solve_task, key, instance, time_limit, use_cache, backend): (key, instance)
+            for key, instance in items
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # El proceso trabajador terminó sin devolver el registro
+                key, instance = futures[future]
+                record = {'file': instance} if isinstance(instance, str) else {}
+                record.update({'status': 'Error', 'error': str(e), 'elapsed': 0.0, 'id': key})
+                yield record
+
+
+class BatchStats:
+    """
+    Acumula estadísticas de rendimiento de un lote: instancias por segundo
+    y percentiles del tiempo de resolución.
+    """
+    
+    def __init__(self):
+        """Inicia el cronómetro del lote."""
+        self.start = time.perf_counter()
+        self.elapsed = []
+        self.status_counts = {}
+    
+    def add(self, record):
+        """
+        Registra el resultado de una instancia.
+        
+        Args:
+            record (dict): Registro devuelto por solve_batch
+        """
+        self.elapsed.append(record['elapsed'])
+        status = record['status']
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+    
+    def summary(self):
+        """
+        Calcula el resumen del lote.
+        
+        Returns:
+            dict: instances, wall_time, instances_per_sec, p50/p95/max del
+                  tiempo de resolución (segundos) y conteo por estado
+        """
+        wall_time = time.perf_counter() - self.start
+        count = len(self.elapsed)
+        times = np.asarray(self.elapsed) if count else np.zeros(1)
+        return {
+            'instances': count,
+            'wall_time': wall_time,
+            'instances_per_sec': count / wall_time if wall_time > 0 else 0.0,
+            'p50': float(np.percentile(times, 50)),
+            'p95': float(np.percentile(times, 95)),
+            'max': float(times.max()),
+            'status_counts': dict(self.status_counts)
+        }
+    
+    def format_summary(self):
+        """
+        Resumen legible para mostrar en consola.
+        
+        Returns:
+            str: Texto con el rendimiento del lote
+        """
+        s = self.summary()
+        statuses = ", ".join(f"{k}: {v}" for k, v in sorted(s['status_counts'].items()))
+        return (
+            f"{s['instances']} instancias en {s['wall_time']:.2f} s "
+            f"({s['instances_per_sec']:.1f} inst/s) | "
+            f"p50 {s['p50'] * 1000:.1f} ms, p95 {s['p95'] * 1000:.1f} ms, "
+            f"máx {s['max'] * 1000:.1f} ms | {statuses}"
+        )
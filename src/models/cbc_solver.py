@@ -0,0 +1,147 @@
+"""
+Solver CBC cancelable.
+Replica la invocación de CBC de PuLP guardando una referencia al subproceso
+para que otro hilo (por ejemplo, la interfaz gráfica) pueda detenerlo.
+"""
+
+import re
+import subprocess
+import tempfile
+import threading
+
+from pulp import PULP_CBC_CMD, LpMaximize
+from pulp.apis.core import PulpSolverError, operating_system
+
+from ..utils.timing import PhaseTimer
+
+
+# Líneas del registro de CBC con el esfuerzo de la resolución
+MIP_ITERATIONS_RE = re.compile(r"Total iterations:\s+(\d+)")
+MIP_NODES_RE = re.compile(r"Enumerated nodes:\s+(\d+)")
+LP_ITERATIONS_RE = re.compile(r"Optimal objective \S+ - (\d+) iterations")
+
+
+class SolveCancelled(Exception):
+    """Se lanza cuando la resolución se cancela antes de terminar."""
+
+
+class CancellableCBC(PULP_CBC_CMD):
+    """
+    Variante de PULP_CBC_CMD cuyo subproceso puede terminarse con cancel().
+    Siempre intercambia el problema con CBC en formato MPS.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Inicializa el solver con los mismos argumentos que PULP_CBC_CMD."""
+        super().__init__(*args, **kwargs)
+        self._process = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self.iterations = None  # Iteraciones del símplex de la última resolución
+        self.nodes = None  # Nodos de ramificación de la última resolución (MIP)
+        self.timer = PhaseTimer()  # Tiempos de escritura, resolución y lectura
+
+    @property
+    def cancelled(self):
+        """bool: True si se solicitó la cancelación."""
+        return self._cancelled
+
+    def cancel(self):
+        """
+        Detiene el subproceso de CBC si está en ejecución.
+        Es seguro llamarlo desde cualquier hilo, antes o durante la resolución.
+        """
+        with self._lock:
+            self._cancelled = True
+            process = self._process
+        if process is not None and process.poll() is None:
+            process.kill()
+
+    def solve_CBC(self, lp, use_mps=True):
+        """
+        Resuelve el problema ejecutando CBC como subproceso cancelable.
+
+        Args:
+            lp (LpProblem): Problema de PuLP a resolver
+            use_mps (bool): Ignorado; siempre se usa MPS
+
+        Returns:
+            int: Código de estado de PuLP
+
+        Raises:
+            SolveCancelled: Si se llamó a cancel() antes de terminar
+            PulpSolverError: Si CBC falla o no puede ejecutarse
+        """
+        if not self.executable(self.path):
+            raise PulpSolverError(f"Pulp: no se puede ejecutar {self.path}")
+
+        tmp_mps, tmp_sol, tmp_mst = self.create_tmp_files(lp.name, "mps", "sol", "mst")
+        vs, variable_names, constraint_names, _ = lp.writeMPS(tmp_mps, rename=1)
+
+        args = [self.path, tmp_mps]
+        if lp.sense == LpMaximize:
+            args.append("-max")
+        if self.optionsDict.get("warmStart", False):
+            self.writesol(tmp_mst, lp, vs, variable_names, constraint_names)
+            args += ["-mips", tmp_mst]
+        if self.timeLimit is not None:
+            args += ["-sec", str(self.timeLimit)]
+        if self.optionsDict.get("presolve") is not None:
+            args += ["-presolve", "on" if self.optionsDict["presolve"] else "off"]
+        for option in self.options + self.getOptions():
+            args += ("-" + option).split()
+        args.append("-solve" if self.mip else "-initialSolve")
+        args += ["-printingOptions", "all", "-solution", tmp_sol]
+        self.timer.lap('write')
+
+        popen_kwargs = {}
+        if not self.msg and operating_system == "win":
+            # Evitar que parpadee una consola al usarse desde la interfaz gráfica
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            popen_kwargs['startupinfo'] = startupinfo
+
+        # Sin mensajes en pantalla, la salida se guarda para leer iteraciones y nodos
+        pipe = None if self.msg else tempfile.TemporaryFile(mode="w+")
+        try:
+            with self._lock:
+                if self._cancelled:
+                    raise SolveCancelled()
+                self._process = subprocess.Popen(
+                    args, stdout=pipe, stderr=pipe, stdin=subprocess.DEVNULL,
+                    **popen_kwargs
+                )
+            return_code = self._process.wait()
+            if pipe:
+                pipe.seek(0)
+                self._read_log(pipe.read())
+        finally:
+            self._process = None
+            if pipe:
+                pipe.close()
+
+        if self._cancelled:
+            self.delete_tmp_files(tmp_mps, tmp_sol, tmp_mst)
+            raise SolveCancelled()
+        if return_code != 0:
+            raise PulpSolverError(f"Pulp: error al ejecutar {self.path}")
+        self.timer.lap('solve')
+
+        status, values, reduced_costs, shadow_prices, slacks, sol_status = self.readsol_MPS(
+            tmp_sol, lp, vs, variable_names, constraint_names
+        )
+        lp.assignVarsVals(values)
+        lp.assignVarsDj(reduced_costs)
+        lp.assignConsPi(shadow_prices)
+        lp.assignConsSlack(slacks, activity=True)
+        lp.assignStatus(status, sol_status)
+        self.delete_tmp_files(tmp_mps, tmp_sol, tmp_mst)
+        self.timer.lap('parse')
+        return status
+
+    def _read_log(self, log):
+        """Extrae del registro de CBC las iteraciones y los nodos explorados."""
+        iterations = MIP_ITERATIONS_RE.search(log) or LP_ITERATIONS_RE.search(log)
+        nodes = MIP_NODES_RE.search(log)
+        self.iterations = int(iterations.group(1)) if iterations else None
+        self.nodes = int(nodes.group(1)) if nodes else None
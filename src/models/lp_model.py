@@ -3,40 +3,106 @@ Modelo de Programación Lineal usando PuLP.
 Este módulo encapsula toda la lógica de resolución de problemas de PL.
 """
 
-from pulp import LpProblem, LpVariable, LpMaximize, LpMinimize, LpStatus, value
+import bisect
+import hashlib
+import math
+import time
+
+import numpy as np
+from pulp import (
+    LpProblem, LpVariable, LpAffineExpression, LpConstraint,
+    LpMaximize, LpMinimize, LpStatus, LpSolution, value,
+    LpConstraintLE, LpConstraintGE, LpConstraintEQ, LpInteger, LpContinuous
+)
+from .. import __version__
+from .cbc_solver import SolveCancelled
+from .presolve import run_presolve
+from .problem_data import VARIABLE_TYPES, variable_type
+from .sensitivity import analyze
+from .solve_cache import get_default_cache
+from .solver_backends import AUTO, create_backend
+from ..utils.project_files import project_to_spec
+from ..utils.timing import PhaseTimer, log_timings
+
+
+# Mapeo de los tipos de restricción de la interfaz a los sentidos de PuLP
+CONSTRAINT_SENSES = {
+    '<=': LpConstraintLE,
+    '>=': LpConstraintGE,
+    '=': LpConstraintEQ
+}
+
+# Mapeo del sentido de la función objetivo
+OBJECTIVE_SENSES = {
+    'Maximizar': LpMaximize,
+    'Minimizar': LpMinimize
+}
 
 
 class LPModel:
     """
     Clase para manejar la creación y resolución de problemas de Programación Lineal.
-    Soporta hasta 15 variables de decisión y 12 restricciones.
+    No limita el número de variables ni de restricciones: from_arrays construye
+    modelos grandes desde su forma matricial (densa o dispersa) con un costo
+    proporcional a los coeficientes distintos de cero.
     """
     
     def __init__(self):
         """Inicializa el modelo de PL."""
         self.problem = None
         self.variables = {}  # Diccionario para almacenar todas las variables
+        self._var_list = []  # Variables en orden de columna (evita reconstruir la lista por fila)
+        self._var_names = []  # Nombres tal como los dio el usuario, en orden de columna
         self.num_variables = 0
         self.status = None
         self.objective_value = None
+        self._solver = None  # Backend en ejecución (para poder cancelarlo)
+        self._warm = None  # Solución y base de la última resolución óptima
+        self._cold_work = {}  # Backend -> (iteraciones, nodos) de su última resolución en frío
         
-    def create_problem(self, sense, objective_coefficients, variable_names=None, integer_vars=None):
+        # Copia en forma matricial de lo construido (para hashing y otros solvers)
+        self._sense = None
+        self._objective = []
+        self._integer = []
+        self._lower = []  # Cotas de las variables (-inf / inf si no tienen)
+        self._upper = []
+        self._rows = []  # Listas [columnas, valores, tipo, rhs, nombre]
+        self._constraints = []  # LpConstraint de cada fila (para modificarlas en el lugar)
+        
+    def create_problem(self, sense, objective_coefficients, variable_names=None, integer_vars=None,
+                       lower_bounds=None, upper_bounds=None):
         """
         Crea el problema de PL con la función objetivo.
         
+        Las cotas se pasan al solver como cotas propias de las variables, no
+        como restricciones. Sin lower_bounds las variables son no negativas;
+        en las listas, None indica que la variable no tiene esa cota.
+        
         Args:
             sense (str): 'Maximizar' o 'Minimizar'
             objective_coefficients (list): Lista de coeficientes para cada variable
             variable_names (list, optional): Lista de nombres personalizados para variables
             integer_vars (list, optional): Lista de booleanos indicando si la variable es entera
-        """
-        sense_map = {
-            'Maximizar': LpMaximize,
-            'Minimizar': LpMinimize
-        }
+            lower_bounds (list, optional): Cota inferior de cada variable (por defecto 0)
+            upper_bounds (list, optional): Cota superior de cada variable (por defecto ninguna)
         
-        self.problem = LpProblem("Problema_PL", sense_map[sense])
+        Raises:
+            ValueError: Si alguna cota no es válida o la inferior supera a la superior
+        """
+        self.problem = LpProblem("Problema_PL", OBJECTIVE_SENSES[sense])
         self.num_variables = len(objective_coefficients)
+        self.variables = {}
+        self._var_list = []
+        self._var_names = []
+        self._sense = sense
+        self._objective = [float(coef) for coef in objective_coefficients]
+        self._integer = []
+        self._lower = _bound_list(lower_bounds, self.num_variables, 0.0, -math.inf)
+        self._upper = _bound_list(upper_bounds, self.num_variables, math.inf, math.inf)
+        self._rows = []
+        self._constraints = []
+        self._warm = None
+        self._cold_work = {}
         
         # Crear variables de decisión dinámicamente (no negativas por defecto)
         for i in range(self.num_variables):
@@ -49,13 +115,19 @@ class LPModel:
             # Determinar si la variable es entera
             is_integer = integer_vars and i < len(integer_vars) and integer_vars[i]
             cat = 'Integer' if is_integer else 'Continuous'
+            _check_bounds(self._lower[i], self._upper[i], var_name)
             
-            self.variables[var_name] = LpVariable(var_name, lowBound=0, cat=cat)
+            variable = LpVariable(
+                var_name, lowBound=_pulp_bound(self._lower[i]), upBound=_pulp_bound(self._upper[i]), cat=cat
+            )
+            self.variables[var_name] = variable
+            self._var_list.append(variable)
+            self._var_names.append(var_name)
+            self._integer.append(bool(is_integer))
         
-        # Definir función objetivo usando los nombres de variables actuales
-        var_list = list(self.variables.values())
-        objective = sum(objective_coefficients[i] * var_list[i] 
-                       for i in range(self.num_variables))
+        # Definir función objetivo en bloque. Se conservan los coeficientes
+        # cero para que todas las variables queden registradas en el problema.
+        objective = LpAffineExpression(zip(self._var_list, self._objective))
         self.problem += objective, "Funcion_Objetivo"
         
     def add_constraint(self, coefficients, constraint_type, rhs, name):
@@ -68,24 +140,415 @@ class LPModel:
             rhs (float): Valor del lado derecho de la restricción
             name (str): Nombre de la restricción
         """
-        # Construir lado izquierdo de la restricción usando las variables en orden
-        var_list = list(self.variables.values())
-        lhs = sum(coefficients[i] * var_list[i] 
-                 for i in range(len(coefficients)))
-        
-        if constraint_type == '<=':
-            self.problem += lhs <= rhs, name
-        elif constraint_type == '>=':
-            self.problem += lhs >= rhs, name
-        elif constraint_type == '=':
-            self.problem += lhs == rhs, name
+        if constraint_type not in CONSTRAINT_SENSES:
+            return
+        
+        # Construir lado izquierdo solo con los coeficientes distintos de cero
+        columns = [j for j, coef in enumerate(coefficients) if coef != 0]
+        values = [float(coefficients[j]) for j in columns]
+        self._add_sparse_row(columns, values, constraint_type, rhs, name)
+    
+    @classmethod
+    def from_arrays(cls, sense, c, A, senses, b, variable_names=None,
+                    integer_vars=None, constraint_names=None, lower_bounds=None, upper_bounds=None):
+        """
+        Construye el problema completo a partir de su forma matricial.
+        
+        El costo de construcción es proporcional al número de coeficientes
+        distintos de cero de A, no a filas × columnas.
+        
+        Args:
+            sense (str): 'Maximizar' o 'Minimizar'
+            c (array-like): Coeficientes de la función objetivo (n)
+            A (array-like o matriz dispersa de SciPy): Matriz de restricciones (m × n)
+            senses (list): Tipo de cada restricción: '<=', '>=', '=' (m)
+            b (array-like): Lados derechos de las restricciones (m)
+            variable_names (list, optional): Nombres personalizados de las variables
+            integer_vars (list, optional): Booleanos indicando variables enteras
+            constraint_names (list, optional): Nombres de las restricciones
+            lower_bounds (array-like, optional): Cotas inferiores de las variables
+                (por defecto 0; -inf o None si no tiene)
+            upper_bounds (array-like, optional): Cotas superiores de las variables
+                (por defecto ninguna; inf o None si no tiene)
             
-    def solve(self):
+        Returns:
+            LPModel: Modelo listo para resolver
+            
+        Raises:
+            ValueError: Si las dimensiones o los valores no son válidos
+        """
+        c = np.asarray(c, dtype=float).ravel()
+        b = np.asarray(b, dtype=float).ravel()
+        num_rows, num_cols = len(b), len(c)
+        
+        if len(senses) != num_rows:
+            raise ValueError(
+                f"Se esperaban {num_rows} tipos de restricción, se recibieron {len(senses)}."
+            )
+        invalid = [s for s in senses if s not in CONSTRAINT_SENSES]
+        if invalid:
+            raise ValueError(f"Tipo de restricción no válido: '{invalid[0]}'")
+        if not (np.isfinite(c).all() and np.isfinite(b).all()):
+            raise ValueError("Los coeficientes y valores deben ser números finitos.")
+        
+        indptr, indices, data = _as_csr_arrays(A, num_rows, num_cols)
+        if not np.isfinite(data).all():
+            raise ValueError("La matriz de restricciones contiene valores no finitos.")
+        
+        for name, bounds in (('inferiores', lower_bounds), ('superiores', upper_bounds)):
+            if bounds is not None and len(bounds) != num_cols:
+                raise ValueError(f"Se esperaban {num_cols} cotas {name}, se recibieron {len(bounds)}.")
+        
+        model = cls()
+        model.create_problem(sense, c, variable_names, integer_vars, lower_bounds, upper_bounds)
+        
+        indices = indices.tolist()
+        data = data.tolist()
+        rhs_values = b.tolist()
+        for i in range(num_rows):
+            start, end = indptr[i], indptr[i + 1]
+            if constraint_names and i < len(constraint_names):
+                name = constraint_names[i]
+            else:
+                name = f"R{i+1}"
+            model._add_sparse_row(
+                indices[start:end], data[start:end], senses[i], rhs_values[i], name
+            )
+        
+        return model
+    
+    def _add_sparse_row(self, columns, values, constraint_type, rhs, name):
+        """
+        Añade una restricción dada en forma dispersa (índices de columna y valores).
+        
+        Args:
+            columns (list): Índices de las variables con coeficiente distinto de cero
+            values (list): Coeficientes correspondientes a cada índice
+            constraint_type (str): Tipo de restricción: '<=', '>=', '='
+            rhs (float): Valor del lado derecho de la restricción
+            name (str): Nombre de la restricción
+        """
+        var_list = self._var_list
+        lhs = LpAffineExpression(zip([var_list[j] for j in columns], values))
+        constraint = LpConstraint(lhs, CONSTRAINT_SENSES[constraint_type], name, float(rhs))
+        self.problem += constraint
+        self._constraints.append(constraint)
+        self._rows.append([list(columns), list(values), constraint_type, float(rhs), name])
+    
+    def set_objective_coef(self, var_index, coef):
+        """
+        Cambia un coeficiente de la función objetivo en el problema existente.
+        
+        Args:
+            var_index (int): Posición de la variable
+            coef (float): Nuevo coeficiente
+        """
+        coef = float(coef)
+        self._objective[var_index] = coef
+        # El cero se conserva para que la variable siga registrada en el problema
+        self.problem.objective[self._var_list[var_index]] = coef
+    
+    def set_constraint_coef(self, row_index, var_index, coef):
+        """
+        Cambia un coeficiente de una restricción en el problema existente.
+        
+        Args:
+            row_index (int): Posición de la restricción
+            var_index (int): Posición de la variable
+            coef (float): Nuevo coeficiente (0 lo elimina de la restricción)
+        """
+        coef = float(coef)
+        columns, values = self._rows[row_index][0], self._rows[row_index][1]
+        expr = self._constraints[row_index].expr
+        variable = self._var_list[var_index]
+        
+        # Las columnas de cada fila se mantienen ordenadas (igual que from_arrays)
+        position = bisect.bisect_left(columns, var_index)
+        present = position < len(columns) and columns[position] == var_index
+        if coef == 0:
+            if present:
+                del columns[position]
+                del values[position]
+                del expr[variable]
+        elif present:
+            values[position] = coef
+            expr[variable] = coef
+        else:
+            columns.insert(position, var_index)
+            values.insert(position, coef)
+            expr[variable] = coef
+    
+    def set_rhs(self, row_index, rhs):
+        """
+        Cambia el lado derecho de una restricción.
+        
+        Args:
+            row_index (int): Posición de la restricción
+            rhs (float): Nuevo valor del lado derecho
+        """
+        self._rows[row_index][3] = float(rhs)
+        self._constraints[row_index].changeRHS(float(rhs))
+    
+    def set_constraint_type(self, row_index, constraint_type):
+        """
+        Cambia el tipo de una restricción.
+        
+        Args:
+            row_index (int): Posición de la restricción
+            constraint_type (str): Tipo de restricción: '<=', '>=', '='
+        
+        Raises:
+            ValueError: Si el tipo no es válido
+        """
+        if constraint_type not in CONSTRAINT_SENSES:
+            raise ValueError(f"Tipo de restricción no válido: '{constraint_type}'")
+        self._rows[row_index][2] = constraint_type
+        self._constraints[row_index].sense = CONSTRAINT_SENSES[constraint_type]
+    
+    def set_sense(self, sense):
+        """
+        Cambia el sentido de la función objetivo.
+        
+        Args:
+            sense (str): 'Maximizar' o 'Minimizar'
+        """
+        self._sense = sense
+        self.problem.sense = OBJECTIVE_SENSES[sense]
+    
+    def set_variable_name(self, var_index, name):
+        """
+        Renombra una variable (no cambia el problema ni su hash).
+        
+        Args:
+            var_index (int): Posición de la variable
+            name (str): Nuevo nombre
+        """
+        variable = self._var_list[var_index]
+        self.variables.pop(self._var_names[var_index], None)
+        variable.name = name
+        self.variables[name] = variable
+        self._var_names[var_index] = name
+    
+    def set_integer(self, var_index, is_integer):
+        """
+        Marca una variable como entera o continua.
+        
+        Args:
+            var_index (int): Posición de la variable
+            is_integer (bool): True para variable entera
+        """
+        self._integer[var_index] = bool(is_integer)
+        self._var_list[var_index].cat = LpInteger if is_integer else LpContinuous
+    
+    def set_bounds(self, var_index, lower=0.0, upper=None):
+        """
+        Cambia las cotas de una variable en el problema existente.
+        
+        Args:
+            var_index (int): Posición de la variable
+            lower (float, optional): Cota inferior (None o -inf si no tiene)
+            upper (float, optional): Cota superior (None o inf si no tiene)
+        
+        Raises:
+            ValueError: Si alguna cota no es válida o la inferior supera a la superior
+        """
+        lower = -math.inf if lower is None else float(lower)
+        upper = math.inf if upper is None else float(upper)
+        _check_bounds(lower, upper, self._var_names[var_index])
+        self._lower[var_index] = lower
+        self._upper[var_index] = upper
+        variable = self._var_list[var_index]
+        variable.lowBound = _pulp_bound(lower)
+        variable.upBound = _pulp_bound(upper)
+    
+    def variable_type(self, var_index):
+        """
+        Tipo de una variable.
+        
+        Args:
+            var_index (int): Posición de la variable
+        
+        Returns:
+            str: 'Continua', 'Entera' o 'Binaria' (entera con cotas 0 y 1)
+        """
+        return variable_type(self._integer[var_index], self._lower[var_index], self._upper[var_index])
+    
+    def set_variable_type(self, var_index, var_type):
+        """
+        Cambia el tipo de una variable. 'Binaria' la hace entera con cotas 0 y
+        1; 'Continua' y 'Entera' solo cambian la integralidad.
+        
+        Args:
+            var_index (int): Posición de la variable
+            var_type (str): 'Continua', 'Entera' o 'Binaria'
+        
+        Raises:
+            ValueError: Si el tipo no es válido
+        """
+        if var_type not in VARIABLE_TYPES:
+            raise ValueError(f"Tipo de variable no válido: '{var_type}'")
+        self.set_integer(var_index, var_type != 'Continua')
+        if var_type == 'Binaria':
+            self.set_bounds(var_index, 0.0, 1.0)
+    
+    def add_variable(self, objective_coef=0.0, name=None, integer=False, coefficients=None,
+                     lower=0.0, upper=None):
+        """
+        Añade una variable nueva al problema existente.
+        
+        Args:
+            objective_coef (float): Coeficiente en la función objetivo
+            name (str, optional): Nombre de la variable (por defecto x{n})
+            integer (bool): True para variable entera
+            coefficients (dict, optional): {posición de restricción: coeficiente}
+            lower (float, optional): Cota inferior (None si no tiene; por defecto 0)
+            upper (float, optional): Cota superior (None si no tiene)
+            
+        Returns:
+            int: Posición de la nueva variable
+        
+        Raises:
+            ValueError: Si alguna cota no es válida o la inferior supera a la superior
+        """
+        lower = -math.inf if lower is None else float(lower)
+        upper = math.inf if upper is None else float(upper)
+        var_index = self.num_variables
+        name = name or f"x{var_index + 1}"
+        _check_bounds(lower, upper, name)
+        variable = LpVariable(
+            name, lowBound=_pulp_bound(lower), upBound=_pulp_bound(upper),
+            cat=LpInteger if integer else LpContinuous
+        )
+        self.variables[name] = variable
+        self._var_list.append(variable)
+        self._var_names.append(name)
+        self._integer.append(bool(integer))
+        self._lower.append(lower)
+        self._upper.append(upper)
+        self._objective.append(0.0)
+        self.num_variables += 1
+        
+        self.set_objective_coef(var_index, objective_coef)
+        for row_index, coef in (coefficients or {}).items():
+            self.set_constraint_coef(row_index, var_index, coef)
+        return var_index
+    
+    def remove_constraint(self, row_index):
+        """
+        Elimina una restricción; las posteriores bajan una posición.
+        
+        Args:
+            row_index (int): Posición de la restricción
+        """
+        constraint = self._constraints.pop(row_index)
+        del self._rows[row_index]
+        del self.problem.constraints[constraint.name]
+    
+    def to_arrays(self):
+        """
+        Devuelve el modelo construido en forma matricial.
+        
+        Returns:
+            dict: sense, c, indptr, indices, data (A en formato CSR), senses, b,
+                  integer (arreglo booleano), lower y upper (cotas de las
+                  variables, ±inf si no tienen) y los nombres de variables y
+                  restricciones
+        """
+        indptr = np.zeros(len(self._rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(row[0]) for row in self._rows])
+        indices = np.fromiter(
+            (j for row in self._rows for j in row[0]), dtype=np.int64, count=indptr[-1]
+        )
+        data = np.fromiter(
+            (v for row in self._rows for v in row[1]), dtype=float, count=indptr[-1]
+        )
+        return {
+            'sense': self._sense,
+            'c': np.asarray(self._objective, dtype=float),
+            'indptr': indptr,
+            'indices': indices,
+            'data': data,
+            'senses': [row[2] for row in self._rows],
+            'b': np.asarray([row[3] for row in self._rows], dtype=float),
+            'integer': np.asarray(self._integer, dtype=bool),
+            'lower': np.asarray(self._lower, dtype=float),
+            'upper': np.asarray(self._upper, dtype=float),
+            'variable_names': list(self._var_names),
+            'constraint_names': [row[4] for row in self._rows]
+        }
+    
+    def problem_hash(self):
+        """
+        Calcula un hash canónico del problema.
+        
+        Incluye sentido, coeficientes, tipos de restricción, lados derechos,
+        integralidad y cotas; los nombres de variables y restricciones no influyen.
+        
+        Returns:
+            str: Resumen SHA-256 en hexadecimal
+        """
+        arrays = self.to_arrays()
+        digest = hashlib.sha256()
+        digest.update(f"{arrays['sense']}|{len(arrays['c'])}|{len(arrays['b'])}|".encode())
+        digest.update("".join(arrays['senses']).encode())
+        digest.update(arrays['integer'].tobytes())
+        digest.update(arrays['indptr'].tobytes())
+        digest.update(arrays['indices'].tobytes())
+        # Sumar 0.0 normaliza -0.0 a 0.0
+        for name in ('c', 'data', 'b', 'lower', 'upper'):
+            digest.update((arrays[name] + 0.0).tobytes())
+        return digest.hexdigest()
+    
+    def _cache_key(self, solver, presolve):
+        """
+        Clave de la caché de resultados: el hash del problema junto con el
+        backend, su versión, el modo de presolve y la versión de este paquete
+        (que incluye el presolve y el símplex propios). Un cambio de cualquiera
+        de ellos invalida las entradas anteriores, también las del disco.
+        """
+        mode = 'lp' if presolve == 'lp' else bool(presolve)
+        digest = hashlib.sha256(self.problem_hash().encode())
+        digest.update(f"|{solver.name}|{solver.version()}|{mode}|{__version__}".encode())
+        return digest.hexdigest()
+            
+    def solve(self, time_limit=None, use_cache=True, backend=AUTO, warm_start=True, presolve=True,
+              sensitivity=True):
         """
         Resuelve el problema de PL.
         
+        Args:
+            time_limit (float, optional): Tiempo máximo del solver en segundos
+            use_cache (bool): Si es True, reutiliza el resultado de un problema
+                idéntico resuelto antes (ver solve_cache.py)
+            backend (str): Solver a usar: 'cbc', 'highs', 'scipy' o 'auto' para
+                elegirlo según el tamaño y la integralidad (ver solver_backends.py)
+            warm_start (bool): Si es True, parte de la solución (MIP) o la base (LP)
+                de la resolución óptima anterior de este modelo
+            presolve (bool o str): Si es True, quita filas vacías, duplicadas y
+                de una variable y fija las variables que se puedan antes de
+                llamar al solver, y lleva la solución y los duales al modelo
+                original; en modelos con enteras además propaga cotas, ajusta
+                coeficientes big-M y sondea las binarias. 'lp' omite estas
+                reducciones de MIP (ver presolve.py)
+            sensitivity (bool): Si es True, calcula el informe de sensibilidad
+                de los PL continuos óptimos y lo añade al mensaje. Con False se
+                omite (ahorra el análisis y su formato, que en modelos medianos
+                cuestan más que la resolución)
+        
         Returns:
-            dict: Diccionario con el estado, valor objetivo y valores de variables
+            dict: Diccionario con el estado, valor objetivo y valores de variables.
+                  Incluye 'warm_start', 'iterations' y 'nodes' y, si hubo arranque en
+                  caliente, 'iterations_saved'/'nodes_saved' respecto de la última
+                  resolución en frío con el mismo backend. En PL continuos óptimos
+                  (si se pidió), 'sensitivity' trae precios sombra, holguras, costos reducidos e
+                  intervalos de costos y lados derechos (ver sensitivity.py).
+                  'presolve' trae las reducciones aplicadas, si hubo alguna.
+                  'timings' trae los segundos de cada fase (caché, presolve,
+                  escritura, resolución, postsolve, lectura de la solución,
+                  sensibilidad, formato y total)
+        
+        Raises:
+            ValueError: Si el backend no existe o no está disponible
         """
         if self.problem is None:
             return {
@@ -93,31 +556,227 @@ class LPModel:
                 'message': 'El problema no ha sido creado correctamente.'
             }
         
-        # Resolver el problema
-        self.problem.solve()
+        solver = create_backend(backend, self)
+        start = time.perf_counter()
+        timer = PhaseTimer()
+        
+        # Buscar un resultado previo para este mismo problema
+        cache = get_default_cache() if use_cache else None
+        if cache is not None:
+            cache_key = self._cache_key(solver, presolve)
+            cached = cache.get(cache_key)
+            timer.lap('cache')
+            if cached is not None and sensitivity and self._lacks_sensitivity(cached):
+                # Se guardó sin sensibilidad: se resuelve de nuevo para calcularla
+                cached = None
+            if cached is not None:
+                result = self._result_from_cache(cached, sensitivity)
+                timer.lap('format')
+                return self._finish_timings(result, timer, start)
+        
+        # Reducir el modelo antes de pasarlo al solver
+        reduction = None
+        if presolve:
+            reduction = run_presolve(self.to_arrays(), mip=presolve != 'lp')
+            if not reduction.changed:
+                reduction = None
+            timer.lap('presolve')
+        layout = (len(self._rows), self.num_variables) if reduction is None else reduction.layout
+        
+        # Resolver con un backend que puede cancelarse desde otro hilo
+        warm = self._warm_start_data(solver.name, layout) if warm_start else None
+        self._solver = solver
+        try:
+            if reduction is None:
+                raw = solver.solve(self, time_limit, warm)
+            else:
+                raw = reduction.raw_result()
+                if raw is None:
+                    if warm is not None:
+                        warm['values'] = [warm['values'][j] for j in reduction.cols.tolist()]
+                    reduced = _ReducedModel(reduction.arrays, warm['values'] if warm else None)
+                    raw = solver.solve(reduced, time_limit, warm)
+                solver.timer.restart()
+                raw = reduction.postsolve(raw)
+                solver.timer.lap('postsolve')
+        except SolveCancelled:
+            self.status = 'Cancelled'
+            timer.merge(solver.timer.as_dict())
+            return self._finish_timings({
+                'status': self.status,
+                'status_code': None,
+                'backend': solver.name,
+                'message': self._format_non_optimal_solution(self.status)
+            }, timer, start)
+        finally:
+            self._solver = None
+        timer.merge(solver.timer.as_dict())
+        timer.restart()
         
         # Obtener estado
-        self.status = LpStatus[self.problem.status]
+        self.status = LpStatus[raw['status_code']]
         
         # Preparar resultado
         result = {
             'status': self.status,
-            'status_code': self.problem.status
+            'status_code': raw['status_code'],
+            # Distingue un óptimo probado de una solución entera cortada por tiempo
+            'solution_status': LpSolution[raw['sol_status']],
+            'backend': solver.name,
+            'warm_start': raw['warm_start'],
+            'iterations': raw['iterations'],
+            'nodes': raw['nodes']
         }
+        if reduction is not None:
+            result['presolve'] = dict(reduction.stats, seconds=reduction.seconds)
+        self._record_work(solver.name, raw, result)
         
         # Si es óptimo, obtener valores
         if self.status == 'Optimal':
-            result['objective_value'] = value(self.problem.objective)
+            for var, var_value in zip(self._var_list, raw['values']):
+                var.varValue = var_value
+            result['objective_value'] = raw['objective_value']
             # Almacenar valores de todas las variables
-            result['variable_values'] = {
-                var_name: value(var) for var_name, var in self.variables.items()
+            result['variable_values'] = dict(zip(self._var_names, raw['values']))
+            self._warm = {
+                'backend': solver.name,
+                'shape': layout,
+                'values': list(raw['values']),
+                'basis': raw['basis']
             }
+            timer.lap('parse')
+            if sensitivity and raw['duals'] is not None:
+                report = analyze(self.to_arrays(), raw['values'], raw['duals'])
+                result['sensitivity'] = {
+                    key: (None if array is None else array.tolist())
+                    for key, array in report.items()
+                }
+                timer.lap('sensitivity')
             result['message'] = self._format_optimal_solution(result)
         else:
+            timer.lap('parse')
             result['message'] = self._format_non_optimal_solution(self.status)
+        if reduction is not None:
+            result['message'] += "\n\n" + reduction.report()
+        timer.lap('format')
+        
+        if cache is not None and self._is_cacheable(result):
+            cache.put(cache_key, self._result_to_cache(result))
+            timer.lap('cache')
             
+        return self._finish_timings(result, timer, start)
+    
+    @staticmethod
+    def _finish_timings(result, timer, start):
+        """Añade al resultado los tiempos por fase y el total, y los registra si se pidió."""
+        timings = timer.as_dict()
+        timings['total'] = time.perf_counter() - start
+        result['timings'] = timings
+        log_timings(timings, 'solve')
         return result
     
+    def _warm_start_data(self, backend_name, layout):
+        """
+        Punto de partida para el backend dado a partir de la última resolución óptima.
+        
+        Args:
+            backend_name (str): Backend que va a resolver
+            layout (tuple): Forma del problema que recibe el backend (la del
+                modelo reducido si hubo presolve)
+        
+        Returns:
+            dict o None: 'values' por columna (None en variables nuevas) y 'basis'
+                         (solo si la dejó el mismo backend con igual forma)
+        """
+        warm = self._warm
+        if warm is None:
+            return None
+        values = warm['values'][:self.num_variables]
+        values += [None] * (self.num_variables - len(values))
+        same_shape = warm['shape'] == layout
+        basis = warm['basis'] if warm['backend'] == backend_name and same_shape else None
+        return {'values': values, 'basis': basis}
+    
+    def _record_work(self, backend_name, raw, result):
+        """Guarda el esfuerzo en frío o, si hubo arranque en caliente, calcula el ahorro."""
+        if not raw['warm_start']:
+            self._cold_work[backend_name] = (raw['iterations'], raw['nodes'])
+            return
+        cold = self._cold_work.get(backend_name)
+        if cold is None:
+            return
+        if cold[0] is not None and raw['iterations'] is not None:
+            result['iterations_saved'] = cold[0] - raw['iterations']
+        if cold[1] is not None and raw['nodes'] is not None:
+            result['nodes_saved'] = cold[1] - raw['nodes']
+    
+    @staticmethod
+    def _is_cacheable(result):
+        """Solo se guardan resultados definitivos (no cortados por tiempo)."""
+        if result['status'] == 'Optimal':
+            return result['solution_status'] == LpSolution[1]
+        return result['status'] in ('Infeasible', 'Unbounded')
+    
+    def _result_to_cache(self, result):
+        """
+        Convierte un resultado a su forma canónica: los valores se guardan por
+        posición de columna para que sirvan aunque cambien los nombres.
+        """
+        entry = {
+            'status': result['status'],
+            'status_code': result['status_code'],
+            'solution_status': result['solution_status'],
+            'backend': result['backend']
+        }
+        if 'objective_value' in result:
+            entry['objective_value'] = result['objective_value']
+            entry['values'] = [value(var) for var in self._var_list]
+        if 'sensitivity' in result:
+            entry['sensitivity'] = result['sensitivity']
+        return entry
+    
+    def _lacks_sensitivity(self, entry):
+        """True si la entrada es un óptimo continuo guardado sin informe de sensibilidad."""
+        return entry['status'] == 'Optimal' and 'sensitivity' not in entry and not any(self._integer)
+    
+    def _result_from_cache(self, entry, sensitivity=True):
+        """Reconstruye un resultado desde la caché con los nombres actuales."""
+        self.status = entry['status']
+        result = {
+            'status': entry['status'],
+            'status_code': entry['status_code'],
+            'solution_status': entry['solution_status'],
+            'backend': entry.get('backend'),
+            'cache_hit': True
+        }
+        if 'objective_value' in entry:
+            for var, var_value in zip(self._var_list, entry['values']):
+                var.varValue = var_value
+            result['objective_value'] = entry['objective_value']
+            result['variable_values'] = dict(zip(self._var_names, entry['values']))
+            if sensitivity and 'sensitivity' in entry:
+                result['sensitivity'] = entry['sensitivity']
+            result['message'] = self._format_optimal_solution(result)
+            # La solución guardada sirve de punto de partida (sin base)
+            self._warm = {
+                'backend': None,
+                'shape': (len(self._rows), self.num_variables),
+                'values': list(entry['values']),
+                'basis': None
+            }
+        else:
+            result['message'] = self._format_non_optimal_solution(self.status)
+        return result
+    
+    def cancel(self):
+        """
+        Cancela la resolución en curso, si la hay.
+        Puede llamarse desde un hilo distinto al que ejecuta solve().
+        """
+        solver = self._solver
+        if solver is not None:
+            solver.cancel()
+    
     def _format_optimal_solution(self, result):
         """
         Formatea el mensaje para una solución óptima.
@@ -133,12 +792,47 @@ class LPModel:
         message += "Valores de las Variables:\n"
         
         # Mostrar valores de todas las variables en el orden original
-        for var_name in self.variables.keys():
-            var_value = value(self.variables[var_name])
+        for var_name, var_value in result['variable_values'].items():
             message += f"  {var_name} = {var_value:.4f}\n"
         
+        if 'sensitivity' in result:
+            message += "\n" + self._format_sensitivity(result['sensitivity'])
+        
         return message.strip()
     
+    def _format_sensitivity(self, sensitivity):
+        """
+        Formatea el informe de sensibilidad como dos tablas de texto.
+        
+        Args:
+            sensitivity (dict): Informe de sensibilidad del resultado
+            
+        Returns:
+            str: Tablas de restricciones y de variables
+        """
+        def interval(lower, upper, i):
+            if lower is None:
+                return "-"
+            return f"[{_format_bound(lower[i])}, {_format_bound(upper[i])}]"
+        
+        # Las líneas se unen al final: concatenar fila a fila es cuadrático
+        lines = ["Análisis de Sensibilidad:"]
+        lines.append(f"  {'Restricción':<12} {'Precio sombra':>14} {'Holgura':>10}  Rango del lado derecho")
+        shadow_prices, slacks = sensitivity['shadow_prices'], sensitivity['slacks']
+        lines.extend(
+            f"  {row[4]:<12} {shadow_prices[i]:>14.4f} {slacks[i]:>10.4f}  "
+            f"{interval(sensitivity['rhs_lower'], sensitivity['rhs_upper'], i)}"
+            for i, row in enumerate(self._rows)
+        )
+        lines.append(f"\n  {'Variable':<12} {'Costo reducido':>14}  Rango del coeficiente objetivo")
+        reduced_costs = sensitivity['reduced_costs']
+        lines.extend(
+            f"  {var_name:<12} {reduced_costs[j]:>14.4f}  "
+            f"{interval(sensitivity['objective_lower'], sensitivity['objective_upper'], j)}"
+            for j, var_name in enumerate(self._var_names)
+        )
+        return "\n".join(lines) + "\n"
+    
     def _format_non_optimal_solution(self, status):
         """
         Formatea el mensaje para soluciones no óptimas.
@@ -153,7 +847,121 @@ class LPModel:
             'Infeasible': '✗ El problema es Inviable (Infeasible)\n\nNo existe una solución que satisfaga todas las restricciones.',
             'Unbounded': '✗ El problema es No Acotado (Unbounded)\n\nLa función objetivo puede crecer infinitamente.',
             'Not Solved': '✗ El problema No fue Resuelto (Not Solved)\n\nOcurrió un error durante la resolución.',
-            'Undefined': '✗ Estado Indefinido (Undefined)\n\nEl problema no tiene un estado válido.'
+            'Undefined': '✗ Estado Indefinido (Undefined)\n\nEl problema no tiene un estado válido.',
+            'Cancelled': '✗ Resolución Cancelada (Cancelled)\n\nEl solver se detuvo antes de terminar.'
         }
         
         return status_messages.get(status, f'✗ Estado desconocido: {status}')
+
+
+class _ReducedModel:
+    """
+    Modelo reducido por el presolve, con la parte de la interfaz de LPModel
+    que leen los backends. HiGHS, SciPy y el símplex solo usan to_arrays();
+    el problema de PuLP (para CBC) se construye la primera vez que se pide.
+    """
+    
+    def __init__(self, arrays, initial_values=None):
+        self._arrays = arrays
+        self._initial_values = initial_values
+        self._model = None
+        self._objective = arrays['c'].tolist()
+        self._integer = arrays['integer'].tolist()
+        self.num_variables = len(self._objective)
+    
+    def to_arrays(self):
+        """Modelo reducido en forma matricial."""
+        return self._arrays
+    
+    def __getattr__(self, name):
+        # problem, _var_list y _constraints: solo los pide CBC
+        if name.startswith('__') or '_arrays' not in self.__dict__:
+            raise AttributeError(name)
+        if self._model is None:
+            self._model = LPModel.from_arrays(**project_to_spec(self._arrays))
+            # CBC toma el arranque MIP de los valores actuales de las variables
+            for var, var_value in zip(self._model._var_list, self._initial_values or ()):
+                var.varValue = var_value
+        return getattr(self._model, name)
+
+
+def _bound_list(bounds, count, default, missing):
+    """
+    Cotas como lista de floats: default si no se dieron y missing donde hay None.
+    
+    Raises:
+        ValueError: Si alguna cota no es un número
+    """
+    if bounds is None:
+        return [default] * count
+    values = [missing if bound is None else float(bound) for bound in list(bounds)[:count]]
+    return values + [default] * (count - len(values))
+
+
+def _check_bounds(lower, upper, name):
+    """
+    Comprueba las cotas de una variable.
+    
+    Raises:
+        ValueError: Si alguna es NaN, la inferior es +inf, la superior es -inf
+            o la inferior supera a la superior
+    """
+    if math.isnan(lower) or math.isnan(upper) or lower == math.inf or upper == -math.inf:
+        raise ValueError(f"Las cotas de la variable '{name}' deben ser números o ±infinito.")
+    if lower > upper:
+        raise ValueError(
+            f"La variable '{name}' tiene cota inferior {lower:g} mayor que la superior {upper:g}."
+        )
+
+
+def _pulp_bound(bound):
+    """Cota en el formato de PuLP (None si es infinita)."""
+    return None if math.isinf(bound) else bound
+
+
+def _format_bound(bound):
+    """Formatea un extremo de intervalo (±∞ sin decimales)."""
+    if bound == float('inf'):
+        return "∞"
+    if bound == float('-inf'):
+        return "-∞"
+    return f"{bound:.4f}"
+
+
+def _as_csr_arrays(A, num_rows, num_cols):
+    """
+    Convierte una matriz densa o dispersa a sus arreglos CSR sin ceros explícitos.
+    
+    Args:
+        A (array-like o matriz dispersa de SciPy): Matriz de restricciones
+        num_rows (int): Número de filas esperado
+        num_cols (int): Número de columnas esperado
+        
+    Returns:
+        tuple: (indptr, indices, data) en formato CSR
+        
+    Raises:
+        ValueError: Si la forma de la matriz no coincide
+    """
+    if hasattr(A, 'tocsr'):
+        # Matriz dispersa de SciPy: se copia para no modificar la del usuario
+        csr = A.tocsr(copy=True)
+        if csr.shape != (num_rows, num_cols):
+            raise ValueError(
+                f"La matriz A tiene forma {csr.shape}, se esperaba {(num_rows, num_cols)}."
+            )
+        csr.sum_duplicates()
+        csr.eliminate_zeros()
+        return csr.indptr, csr.indices, np.asarray(csr.data, dtype=float)
+    
+    dense = np.asarray(A, dtype=float)
+    if num_rows == 0:
+        dense = dense.reshape(0, num_cols)
+    if dense.shape != (num_rows, num_cols):
+        raise ValueError(
+            f"La matriz A tiene forma {dense.shape}, se esperaba {(num_rows, num_cols)}."
+        )
+    rows, cols = np.nonzero(dense)
+    indptr = np.zeros(num_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=num_rows), out=indptr[1:])
+    return indptr, cols, dense[rows, cols]
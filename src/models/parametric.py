@@ -0,0 +1,217 @@
+"""
+Análisis paramétrico: resuelve el mismo modelo para una serie de valores de
+un lado derecho o de un coeficiente de la función objetivo.
+
+Cada punto parte de la base o la solución del anterior (arranque en caliente),
+así que un barrido de cientos de valores cuesta poco más que unas pocas
+resoluciones en frío. Con varios procesos, los valores se reparten en tramos
+contiguos para que cada proceso conserve el arranque en caliente.
+"""
+
+import csv
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .lp_model import LPModel
+from .solver_backends import AUTO
+
+
+RHS = 'rhs'
+OBJECTIVE = 'objective'
+PARAMETERS = (RHS, OBJECTIVE)
+
+
+class SweepResult:
+    """
+    Tabla de resultados de un barrido: una fila por valor del parámetro con
+    el estado, el valor objetivo y el valor de cada variable.
+    """
+    
+    def __init__(self, label, variable_names, points):
+        """
+        Inicializa el resultado.
+        
+        Args:
+            label (str): Nombre del parámetro barrido (por ejemplo 'b[R1]')
+            variable_names (list): Nombres de las variables en orden de columna
+            points (list): Registros por punto en orden de valor (ver _sweep_points)
+        """
+        self.label = label
+        self.variable_names = list(variable_names)
+        self.points = points
+    
+    def header(self):
+        """list: Encabezados de la tabla."""
+        return [self.label, 'Estado', 'Objetivo'] + self.variable_names
+    
+    def rows(self):
+        """
+        Filas de la tabla (sin solución, el objetivo y las variables quedan vacíos).
+        
+        Returns:
+            list: Una lista por punto
+        """
+        rows = []
+        for point in self.points:
+            values = point['values'] or [None] * len(self.variable_names)
+            rows.append([point['value'], point['status'], point['objective_value']] + values)
+        return rows
+    
+    def to_csv(self, path):
+        """
+        Escribe la tabla en un archivo CSV.
+        
+        Args:
+            path (str): Ruta del archivo de salida
+        """
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.header())
+            for row in self.rows():
+                writer.writerow(['' if cell is None else cell for cell in row])
+
+
+def sweep_values(start, stop, steps):
+    """
+    Valores equiespaciados entre start y stop, ambos incluidos.
+    
+    Args:
+        start (float): Primer valor
+        stop (float): Último valor
+        steps (int): Número de puntos (al menos 1)
+    
+    Returns:
+        ndarray: Valores del parámetro
+    
+    Raises:
+        ValueError: Si steps es menor que 1
+    """
+    steps = int(steps)
+    if steps < 1:
+        raise ValueError("El número de puntos debe ser al menos 1.")
+    return np.linspace(float(start), float(stop), steps)
+
+
+def parametric_sweep(model, parameter, index, values, backend=AUTO, max_workers=1,
+                     time_limit=None, progress=None, stop_event=None):
+    """
+    Resuelve el modelo para cada valor de un lado derecho o un coeficiente objetivo.
+    
+    Args:
+        model (LPModel): Modelo construido; al terminar el parámetro vuelve a su valor
+        parameter (str): 'rhs' (lado derecho de una fila) u 'objective' (coeficiente
+            de una columna en la función objetivo)
+        index (int): Posición de la restricción o de la variable
+        values (iterable): Valores del parámetro
+        backend (str): Solver a usar (ver solver_backends.py)
+        max_workers (int): Procesos en paralelo; con 1 se resuelve en el proceso actual
+        time_limit (float, optional): Tiempo máximo por punto en segundos
+        progress (callable, optional): Se llama con (puntos resueltos, total)
+        stop_event (threading.Event, optional): Detiene el barrido entre puntos;
+            el resultado incluye solo los puntos resueltos
+    
+    Returns:
+        SweepResult: Tabla con un registro por punto
+    
+    Raises:
+        ValueError: Si el parámetro o la posición no son válidos
+    """
+    if parameter not in PARAMETERS:
+        raise ValueError(f"Parámetro no válido: '{parameter}'. Use 'rhs' u 'objective'.")
+    size = len(model._rows) if parameter == RHS else model.num_variables
+    if not 0 <= index < size:
+        raise ValueError(f"Posición fuera de rango: {index}.")
+    
+    values = [float(v) for v in values]
+    if parameter == RHS:
+        label = f"b[{model._rows[index][4]}]"
+    else:
+        label = f"c[{model._var_names[index]}]"
+    
+    if max_workers <= 1 or len(values) <= 1:
+        points = _sweep_points(
+            model, parameter, index, values, backend, time_limit, progress, stop_event
+        )
+        return SweepResult(label, model._var_names, points)
+    
+    # Tramos contiguos: cada proceso arranca en frío una sola vez
+    spec = _model_spec(model)
+    chunks = [list(chunk) for chunk in np.array_split(values, max_workers) if len(chunk)]
+    points = []
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        futures = [
+            executor.submit(_sweep_chunk, spec, parameter, index, chunk, backend, time_limit)
+            for chunk in chunks
+        ]
+        for future in futures:
+            if stop_event is not None and stop_event.is_set():
+                future.cancel()
+                continue
+            points.extend(future.result())
+            if progress is not None:
+                progress(len(points), len(values))
+    return SweepResult(label, model._var_names, points)
+
+
+def _sweep_points(model, parameter, index, values, backend, time_limit,
+                  progress=None, stop_event=None):
+    """
+    Barre los valores en orden sobre el mismo modelo con arranque en caliente.
+    
+    Returns:
+        list: Registros con value, status, objective_value, values (lista por
+              columna o None), iterations y warm_start
+    """
+    if parameter == RHS:
+        setter, original = model.set_rhs, model._rows[index][3]
+    else:
+        setter, original = model.set_objective_coef, model._objective[index]
+    
+    points = []
+    try:
+        for value in values:
+            if stop_event is not None and stop_event.is_set():
+                break
+            setter(index, value)
+            result = model.solve(time_limit=time_limit, use_cache=False, backend=backend, sensitivity=False)
+            variable_values = result.get('variable_values')
+            points.append({
+                'value': value,
+                'status': result['status'],
+                'objective_value': result.get('objective_value'),
+                'values': list(variable_values.values()) if variable_values else None,
+                'iterations': result.get('iterations'),
+                'warm_start': result.get('warm_start', False)
+            })
+            if progress is not None:
+                progress(len(points), len(values))
+    finally:
+        setter(index, original)
+    return points
+
+
+def _sweep_chunk(spec, parameter, index, values, backend, time_limit):
+    """Tarea de cada proceso trabajador (debe ser de nivel de módulo)."""
+    model = LPModel.from_arrays(**spec)
+    return _sweep_points(model, parameter, index, values, backend, time_limit)
+
+
+def _model_spec(model):
+    """Argumentos de LPModel.from_arrays que reproducen el modelo en otro proceso."""
+    arrays = model.to_arrays()
+    num_rows, num_cols = len(arrays['b']), len(arrays['c'])
+    A = np.zeros((num_rows, num_cols))
+    A[np.repeat(np.arange(num_rows), np.diff(arrays['indptr'])), arrays['indices']] = arrays['data']
+    return {
+        'sense': arrays['sense'],
+        'c': arrays['c'],
+        'A': A,
+        'senses': arrays['senses'],
+        'b': arrays['b'],
+        'variable_names': arrays['variable_names'],
+        'integer_vars': arrays['integer'].tolist(),
+        'constraint_names': arrays['constraint_names'],
+        'lower_bounds': arrays['lower'],
+        'upper_bounds': arrays['upper']
+    }
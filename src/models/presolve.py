@@ -0,0 +1,838 @@
+"""
+Presolve de modelos de PL antes de pasarlos al solver.
+
+run_presolve(arrays) recibe el modelo en forma matricial (LPModel.to_arrays())
+y aplica, hasta que no haya más cambios:
+    
+    empty_rows      Filas sin coeficientes: se comprueba 0 (tipo) b y se quitan
+    singleton_rows  Filas de una sola variable: las '=' la fijan y las
+                    desigualdades pasan a ser cotas de la variable (se queda
+                    la más ajustada de cada lado); la fila se quita
+    empty_columns   Variables sin coeficientes en las filas que quedan: se
+                    fijan en la cota que conviene al objetivo
+    duplicate_rows  Filas proporcionales: se conserva la más ajustada de cada
+                    lado (o la igualdad)
+
+En modelos con variables enteras se aplican además, cuando lo anterior ya no
+cambia nada:
+    
+    tightened_bounds        Propagación de cotas: la actividad mínima y máxima
+                            de cada fila acota cada variable (redondeando en
+                            las enteras); se ajustan sus cotas y se fijan las
+                            variables de cotas iguales
+    redundant_rows          Filas que se cumplen con cualquier valor dentro de
+                            las cotas
+    tightened_coefficients  Coeficientes de binarias (big-M) reducidos a la
+                            holgura de la fila, lo que ajusta la relajación
+                            lineal sin cambiar las soluciones enteras
+    probing_fixed           Sondeo de binarias: si fijar una binaria en 0 (o
+                            en 1) hace inviable la propagación, se fija en el
+                            otro valor; también se fijan las variables que
+                            quedan iguales en ambas ramas
+
+Las cotas deducidas se guardan como cotas propias de las variables del modelo
+reducido, así que las filas que quitan estas reducciones siguen implicadas
+por él.
+
+Las variables fijadas se sustituyen en los lados derechos. El modelo reducido
+tiene el mismo formato, así que cualquier backend lo resuelve sin cambios, y
+Presolve.postsolve() lleva su resultado crudo al modelo original: las
+variables fijadas recuperan su valor y las filas quitadas reciben dual 0,
+salvo las que pasaron a ser una cota activa o fijaron una variable, cuyo dual
+se despeja del costo reducido de la variable (primero las cotas de las
+variables que quedan y luego las fijaciones, en orden inverso).
+"""
+
+import hashlib
+import time
+
+import numpy as np
+from pulp import (
+    LpStatusOptimal, LpStatusInfeasible, LpSolutionOptimal, LpSolutionInfeasible
+)
+
+
+# Tolerancia de factibilidad y de comparación de coeficientes
+TOLERANCE = 1e-9
+
+# Decimales con que se comparan las filas normalizadas en busca de duplicadas
+DUPLICATE_DECIMALS = 12
+
+# Pasadas máximas (cada una quita al menos una fila o una columna)
+MAX_PASSES = 50
+
+# Tolerancia de factibilidad e integralidad de la propagación de cotas
+FEASIBILITY_TOLERANCE = 1e-6
+
+# Rondas de propagación de cotas y mejora relativa mínima para seguir
+PROPAGATION_ROUNDS = 10
+MIN_BOUND_CHANGE = 1e-3
+
+# Rondas de reducciones de MIP y límites del sondeo (binarias y coeficientes
+# recorridos en total, para acotar su costo en modelos grandes)
+MAX_MIP_ROUNDS = 5
+PROBING_ROUNDS = 3
+MAX_PROBED = 200
+PROBING_WORK = 20_000_000
+
+
+class Presolve:
+    """
+    Resultado del presolve de un modelo.
+    
+    Attributes:
+        infeasible (bool): True si el presolve probó que el modelo es inviable
+        arrays (dict): Modelo reducido en el formato de LPModel.to_arrays()
+        rows (numpy.ndarray): Posición original de cada fila del modelo reducido
+        cols (numpy.ndarray): Posición original de cada columna del modelo reducido
+        stats (dict): Reducciones por tipo, filas, columnas y coeficientes quitados
+        seconds (float): Duración del presolve
+    """
+    
+    def __init__(self, original, infeasible, arrays, rows, cols, fixed_values, fix_stack,
+                 bound_stack, stats, seconds):
+        self._original = original
+        self.infeasible = infeasible
+        self.arrays = arrays
+        self.rows = rows
+        self.cols = cols
+        self._fixed_values = fixed_values
+        self._fix_stack = fix_stack
+        self._bound_stack = bound_stack
+        self.stats = stats
+        self.seconds = seconds
+    
+    @property
+    def changed(self):
+        """bool: True si el modelo reducido difiere del original."""
+        return self.infeasible or any(self.stats[key] for key in REDUCTIONS)
+    
+    @property
+    def layout(self):
+        """
+        tuple: Identifica qué filas y columnas se conservaron (dos modelos con
+        el mismo layout pueden compartir la base de un arranque en caliente).
+        """
+        digest = hashlib.sha1(self.rows.tobytes() + b'|' + self.cols.tobytes()).hexdigest()
+        return (len(self.rows), len(self.cols), digest)
+    
+    def raw_result(self):
+        """
+        Resultado crudo cuando el presolve ya decide el modelo, sin solver.
+        
+        Returns:
+            dict o None: Resultado en el formato de solver_backends (inviable, u
+                         óptimo si se fijaron todas las variables); None si hace
+                         falta resolver el modelo reducido
+        """
+        if self.infeasible:
+            codes = (LpStatusInfeasible, LpSolutionInfeasible)
+        elif len(self.cols) == 0 and len(self.rows) == 0:
+            codes = (LpStatusOptimal, LpSolutionOptimal)
+        else:
+            return None
+        optimal = codes[0] == LpStatusOptimal
+        return {
+            'status_code': codes[0],
+            'sol_status': codes[1],
+            'objective_value': 0.0 if optimal else None,
+            'values': [] if optimal else None,
+            'duals': [] if optimal and not self.arrays['integer'].any() else None,
+            'iterations': 0,
+            'nodes': None,
+            'warm_start': False,
+            'basis': None
+        }
+    
+    def postsolve(self, raw):
+        """
+        Lleva el resultado crudo del modelo reducido al modelo original.
+        
+        Args:
+            raw (dict): Resultado del backend (o de raw_result()) para el modelo reducido
+        
+        Returns:
+            dict: El mismo resultado con values, duals y objective_value del
+                  modelo original
+        """
+        if raw['values'] is None:
+            return raw
+        original = self._original
+        x = self._fixed_values.copy()
+        x[self.cols] = raw['values']
+        raw['values'] = x.tolist()
+        raw['objective_value'] = float(original['c'] @ x) if len(x) else 0.0
+        if raw['duals'] is not None and original['integer'].any():
+            # El modelo reducido puede quedar continuo al fijar las enteras
+            raw['duals'] = None
+        if raw['duals'] is not None:
+            raw['duals'] = self._postsolve_duals(np.asarray(raw['duals'], dtype=float)).tolist()
+        return raw
+    
+    def _postsolve_duals(self, reduced_duals):
+        """
+        Duales del modelo original: 0 en las filas quitadas salvo las que son
+        una cota activa de una variable o la fijaron.
+        
+        Cada fila candidata salió del modelo por una sola variable, así que su
+        dual es 0 hasta que esa variable lo recibe y no entra en su costo
+        reducido: basta c_j - yᵀA_j con los duales asignados hasta ese momento.
+        """
+        original = self._original
+        c = np.asarray(original['c'], dtype=float)
+        indptr = np.asarray(original['indptr'], dtype=np.int64)
+        num_rows, num_cols = len(indptr) - 1, len(c)
+        duals = np.zeros(num_rows)
+        duals[self.rows] = reduced_duals
+        if not self._fix_stack and not self._bound_stack:
+            return duals
+        
+        indices = np.asarray(original['indices'], dtype=np.int64)
+        data = np.asarray(original['data'], dtype=float)
+        row_index = np.repeat(np.arange(num_rows), np.diff(indptr))
+        senses = np.asarray(original['senses'], dtype=object)
+        maximize = original['sense'] == 'Maximizar'
+        # Coeficientes ordenados por (fila, columna) para buscar los de las candidatas
+        keys = row_index * num_cols + indices
+        key_order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[key_order]
+        
+        def coefficients(rows, cols):
+            return data[key_order[np.searchsorted(sorted_keys, rows * num_cols + cols)]]
+        
+        # Cotas de las variables que quedan, todas a la vez (son independientes):
+        # la fila recibe el dual solo si la cota está activa (signo válido)
+        if self._bound_stack:
+            cols = np.array([col for col, _ in self._bound_stack], dtype=np.int64)
+            reduced_cost = c[cols] - np.bincount(
+                indices, weights=data * duals[row_index], minlength=num_cols
+            )[cols]
+            pending = np.ones(len(cols), dtype=bool)
+            for k, side in enumerate(('<=', '>=')):
+                rows = np.array([candidates[k][0] for _, candidates in self._bound_stack], dtype=np.int64)
+                own = rows < 0
+                # Cota propia de la variable: se queda con el costo reducido
+                pending &= ~(own & _valid_duals(reduced_cost, np.full(len(cols), side, dtype=object), maximize))
+                assign = np.flatnonzero(pending & ~own)
+                dual = reduced_cost[assign] / coefficients(rows[assign], cols[assign])
+                valid = _valid_duals(dual, senses[rows[assign]], maximize)
+                duals[rows[assign[valid]]] = dual[valid]
+                pending[assign[valid]] = False
+        
+        # Fijaciones en orden inverso (cada una depende de las posteriores); una
+        # fijación necesita el dual en alguna de sus filas
+        steps = [
+            (col, candidates) for col, candidates in reversed(self._fix_stack)
+            if any(row >= 0 for row, _ in candidates)
+        ]
+        if not steps:
+            return duals + 0.0
+        pairs = np.array(
+            [(row, col) for col, candidates in steps for row, _ in candidates if row >= 0], dtype=np.int64
+        )
+        candidate_coefficients = iter(coefficients(pairs[:, 0], pairs[:, 1]).tolist())
+        col_order = np.argsort(indices, kind='stable')
+        col_rows = row_index[col_order]
+        col_values = data[col_order]
+        col_ptr = np.searchsorted(indices[col_order], np.arange(num_cols + 1)).tolist()
+        for col, candidates in steps:
+            start, end = col_ptr[col], col_ptr[col + 1]
+            reduced_cost = c[col] - duals[col_rows[start:end]] @ col_values[start:end]
+            row_coefficients = [
+                (row, side, next(candidate_coefficients) if row >= 0 else None) for row, side in candidates
+            ]
+            for row, side, coefficient in row_coefficients:
+                if row < 0:
+                    if _valid_dual(reduced_cost, side, maximize):
+                        break
+                    continue
+                dual = reduced_cost / coefficient
+                if _valid_dual(dual, senses[row], maximize):
+                    duals[row] = dual
+                    break
+            else:
+                row, _, coefficient = [item for item in row_coefficients if item[0] >= 0][-1]
+                duals[row] = reduced_cost / coefficient
+        return duals + 0.0
+    
+    def report(self):
+        """
+        Resumen de las reducciones para el usuario.
+        
+        Returns:
+            str: Una línea con filas, variables y coeficientes quitados
+        """
+        stats = self.stats
+        if self.infeasible:
+            return "Presolve: el modelo es inviable."
+        singleton = f" ({stats['singleton_rows']} de una variable)" if stats['singleton_rows'] else ""
+        mip = ""
+        if stats['tightened_bounds'] or stats['tightened_coefficients']:
+            mip = f", {stats['tightened_bounds']} cotas y {stats['tightened_coefficients']} coeficientes ajustados"
+        return (
+            f"Presolve: -{stats['rows_removed']} restricciones{singleton}, "
+            f"-{stats['columns_removed']} variables, -{stats['nonzeros_removed']} coeficientes{mip} "
+            f"({self.seconds * 1000:.1f} ms)"
+        )
+
+
+# Tipos de reducción que informa Presolve.stats
+REDUCTIONS = (
+    'empty_rows', 'singleton_rows', 'empty_columns', 'duplicate_rows', 'fixed_variables',
+    'tightened_bounds', 'redundant_rows', 'tightened_coefficients', 'probing_fixed'
+)
+
+
+def _valid_dual(dual, sense, maximize):
+    """True si el dual tiene el signo que corresponde a una fila de ese tipo en el óptimo."""
+    if sense == '=':
+        return True
+    nonnegative = (sense == '<=') == maximize
+    return dual >= -TOLERANCE if nonnegative else dual <= TOLERANCE
+
+
+def _valid_duals(duals, senses, maximize):
+    """_valid_dual() sobre arreglos de duales y tipos de fila."""
+    nonnegative = (senses == '<=') == maximize
+    valid = np.where(nonnegative, duals >= -TOLERANCE, duals <= TOLERANCE)
+    return valid | (senses == '=')
+
+
+def _empty_row_feasible(sense, rhs):
+    """True si la fila vacía 0 (sense) rhs se cumple."""
+    if sense == '<=':
+        return rhs >= -TOLERANCE
+    if sense == '>=':
+        return rhs <= TOLERANCE
+    return abs(rhs) <= TOLERANCE
+
+
+def run_presolve(arrays, mip=True):
+    """
+    Aplica el presolve a un modelo.
+    
+    Args:
+        arrays (dict): Modelo en el formato de LPModel.to_arrays()
+        mip (bool): Aplicar también las reducciones de MIP si hay variables enteras
+    
+    Returns:
+        Presolve: Modelo reducido, datos del postsolve y estadísticas
+    """
+    return _Presolver(arrays, mip).run()
+
+
+class _Presolver:
+    """
+    Estado de trabajo del presolve: filas y columnas vivas, cotas y fijaciones.
+    
+    Las cotas de cada variable guardan la fila de la que salieron (-1 si es
+    la del modelo o una deducida), para llevar después su dual a esa fila.
+    """
+    
+    def __init__(self, arrays, mip=True):
+        self.original = arrays
+        self.start = time.perf_counter()
+        self.c = np.asarray(arrays['c'], dtype=float)
+        self.b = np.array(arrays['b'], dtype=float)
+        self.senses = list(arrays['senses'])
+        self.integer = np.asarray(arrays['integer'], dtype=bool)
+        self.maximize = arrays['sense'] == 'Maximizar'
+        self.mip = mip and bool(self.integer.any())
+        num_rows, num_cols = len(self.b), len(self.c)
+        
+        indptr = np.asarray(arrays['indptr'], dtype=np.int64)
+        self.entry_rows = np.repeat(np.arange(num_rows), np.diff(indptr))
+        self.entry_cols = np.asarray(arrays['indices'], dtype=np.int64)
+        self.entry_values = np.array(arrays['data'], dtype=float)  # Copia: el ajuste de coeficientes la modifica
+        # Entradas de cada columna, para sustituir variables fijadas
+        self.col_order = np.argsort(self.entry_cols, kind='stable')
+        self.col_ptr = np.searchsorted(self.entry_cols[self.col_order], np.arange(num_cols + 1))
+        
+        self.row_alive = np.ones(num_rows, dtype=bool)
+        self.col_alive = np.ones(num_cols, dtype=bool)
+        self.lower = np.array(arrays['lower'], dtype=float)
+        self.upper = np.array(arrays['upper'], dtype=float)
+        self.lower_row = np.full(num_cols, -1)
+        self.upper_row = np.full(num_cols, -1)
+        self.fixed_values = np.zeros(num_cols)
+        self.fix_stack = []  # (columna, cotas (fila, lado) candidatas a recibir su dual)
+        self.stats = dict.fromkeys(REDUCTIONS, 0)
+    
+    def run(self):
+        """Aplica las reducciones hasta que no haya cambios o el modelo resulte inviable."""
+        mip_rounds = 0
+        try:
+            for _ in range(MAX_PASSES):
+                changed = self._empty_rows()
+                changed |= self._singleton_rows()
+                changed |= self._empty_columns()
+                if not changed:
+                    changed = self._duplicate_rows()
+                if not changed and self.mip and mip_rounds < MAX_MIP_ROUNDS:
+                    mip_rounds += 1
+                    changed = self._mip_reductions()
+                if not changed:
+                    break
+        except _Infeasible:
+            return self._result(infeasible=True)
+        return self._result(infeasible=False)
+    
+    def _live_counts(self):
+        """Número de coeficientes vivos por fila y por columna."""
+        live = self.row_alive[self.entry_rows] & self.col_alive[self.entry_cols]
+        num_rows, num_cols = len(self.b), len(self.c)
+        return (
+            live,
+            np.bincount(self.entry_rows[live], minlength=num_rows),
+            np.bincount(self.entry_cols[live], minlength=num_cols)
+        )
+    
+    def _drop_row(self, row):
+        self.row_alive[row] = False
+    
+    def _bound_candidates(self, col):
+        """Cotas de una variable como candidatas a recibir su dual: (fila o -1, lado)."""
+        return [(int(self.upper_row[col]), '<='), (int(self.lower_row[col]), '>=')]
+    
+    def _fix(self, col, value, candidates=()):
+        """Fija una variable y la sustituye en los lados derechos de las filas vivas."""
+        lower, upper = self.lower[col], self.upper[col]
+        if (value < lower - TOLERANCE * max(1.0, abs(lower)) or value > upper + TOLERANCE * max(1.0, abs(upper))
+                or (self.integer[col] and abs(value - round(value)) > TOLERANCE)):
+            raise _Infeasible()
+        value = min(max(value, lower), upper)
+        if self.integer[col]:
+            value = float(round(value))
+        entries = self.col_order[self.col_ptr[col]:self.col_ptr[col + 1]]
+        rows = self.entry_rows[entries]
+        alive = self.row_alive[rows]
+        np.subtract.at(self.b, rows[alive], self.entry_values[entries][alive] * value)
+        self.fixed_values[col] = value
+        self.col_alive[col] = False
+        self.fix_stack.append((col, list(candidates)))
+        self.stats['fixed_variables'] += 1
+    
+    def _empty_rows(self):
+        """Quita las filas sin coeficientes vivos (inviable si no se cumplen)."""
+        _, row_count, _ = self._live_counts()
+        empty = np.flatnonzero(self.row_alive & (row_count == 0))
+        for row in empty.tolist():
+            if not _empty_row_feasible(self.senses[row], self.b[row]):
+                raise _Infeasible()
+            self._drop_row(row)
+        self.stats['empty_rows'] += len(empty)
+        return len(empty) > 0
+    
+    def _singleton_rows(self):
+        """Convierte las filas de una variable en cotas de la variable o en fijaciones."""
+        live, row_count, _ = self._live_counts()
+        singleton = self.row_alive & (row_count == 1)
+        entries = np.flatnonzero(live & singleton[self.entry_rows])
+        for row, col, coef in zip(self.entry_rows[entries].tolist(), self.entry_cols[entries].tolist(),
+                                  self.entry_values[entries].tolist()):
+            if not self.col_alive[col]:
+                # La variable se fijó en esta misma pasada: la fila queda vacía
+                continue
+            self.stats['singleton_rows'] += 1
+            self._drop_row(row)
+            bound = self.b[row] / coef
+            sense = self.senses[row]
+            if sense == '=':
+                if bound < self.lower[col] - TOLERANCE or bound > self.upper[col] + TOLERANCE:
+                    raise _Infeasible()
+                self._fix(col, bound, [(row, '=')])
+                continue
+            
+            # La fila queda como cota solo si ajusta la que ya tiene la variable
+            if (sense == '<=') == (coef > 0):
+                if self.integer[col]:
+                    bound = np.floor(bound + FEASIBILITY_TOLERANCE)
+                if bound < self.upper[col]:
+                    self.upper[col], self.upper_row[col] = bound, row
+            else:
+                if self.integer[col]:
+                    bound = np.ceil(bound - FEASIBILITY_TOLERANCE)
+                if bound > self.lower[col]:
+                    self.lower[col], self.lower_row[col] = bound, row
+            
+            if self.lower[col] > self.upper[col] + TOLERANCE:
+                raise _Infeasible()
+            if self.upper[col] - self.lower[col] <= TOLERANCE:
+                self._fix(col, self.lower[col], self._bound_candidates(col))
+        return len(entries) > 0
+    
+    def _empty_columns(self):
+        """Fija las variables que ya no aparecen en ninguna fila."""
+        _, _, col_count = self._live_counts()
+        changed = False
+        for col in np.flatnonzero(self.col_alive & (col_count == 0)).tolist():
+            gain = self.c[col] if self.maximize else -self.c[col]
+            if gain > 0:
+                value, candidates = self.upper[col], [(int(self.upper_row[col]), '<=')]
+            elif gain < 0:
+                value, candidates = self.lower[col], [(int(self.lower_row[col]), '>=')]
+            else:
+                # Cualquier valor sirve: el más cercano a 0 dentro de las cotas
+                value, candidates = min(max(0.0, self.lower[col]), self.upper[col]), []
+            if np.isinf(value) or (self.integer[col] and abs(value - round(value)) > TOLERANCE):
+                # No acotada o cota fraccionaria de una entera: lo decide el solver
+                continue
+            self._fix(col, value, candidates)
+            self.stats['empty_columns'] += 1
+            changed = True
+        return changed
+    
+    def _duplicate_rows(self):
+        """Quita las filas proporcionales a otra, conservando la más ajustada de cada lado."""
+        live, row_count, _ = self._live_counts()
+        candidates = self.row_alive & (row_count >= 2)
+        live &= candidates[self.entry_rows]
+        if not live.any():
+            return False
+        rows = self.entry_rows[live]
+        cols = self.entry_cols[live]
+        values = self.entry_values[live]
+        
+        # Normalizar cada fila por su primer coeficiente
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        first = np.repeat(values[starts], np.diff(np.r_[starts, len(rows)]))
+        scaled = np.round(values / first, DUPLICATE_DECIMALS)
+        
+        # Firma barata para agrupar candidatas; luego se comparan exactamente
+        num_rows = len(self.b)
+        signature = np.stack([
+            row_count,
+            np.bincount(rows, weights=cols, minlength=num_rows),
+            np.bincount(rows, weights=scaled * (cols + 1), minlength=num_rows)
+        ], axis=1)[candidates]
+        candidate_rows = np.flatnonzero(candidates)
+        _, group, group_size = np.unique(signature, axis=0, return_inverse=True, return_counts=True)
+        repeated = group_size[group.ravel()] > 1
+        if not repeated.any():
+            return False
+        
+        first_by_row = dict(zip(rows[starts].tolist(), values[starts].tolist()))
+        bounds = np.r_[starts, len(rows)]
+        entry_slice = dict(zip(rows[starts].tolist(), zip(bounds[:-1].tolist(), bounds[1:].tolist())))
+        groups = {}
+        for row in candidate_rows[repeated].tolist():
+            begin, end = entry_slice[row]
+            key = (tuple(cols[begin:end].tolist()), tuple(scaled[begin:end].tolist()))
+            groups.setdefault(key, []).append(row)
+        
+        removed = 0
+        for group_rows in groups.values():
+            if len(group_rows) > 1:
+                removed += self._merge_parallel_rows(group_rows, first_by_row)
+        self.stats['duplicate_rows'] += removed
+        return removed > 0
+    
+    def _merge_parallel_rows(self, rows, first_by_row):
+        """
+        Deja una fila '<=' y una '>=' (o una '=') de un grupo de filas proporcionales.
+        
+        Returns:
+            int: Filas quitadas
+        """
+        lower, upper = (-np.inf, None), (np.inf, None)
+        equality = None
+        for row in rows:
+            scale = first_by_row[row]
+            rhs = self.b[row] / scale
+            sense = self.senses[row]
+            if sense != '=' and scale < 0:
+                sense = '>=' if sense == '<=' else '<='
+            if sense == '=':
+                if equality is not None and abs(rhs - equality[0]) > TOLERANCE * max(1.0, abs(rhs)):
+                    raise _Infeasible()
+                equality = equality or (rhs, row)
+            elif sense == '<=':
+                upper = min(upper, (rhs, row), key=lambda bound: bound[0])
+            else:
+                lower = max(lower, (rhs, row), key=lambda bound: bound[0])
+        
+        if equality is not None:
+            # La igualdad queda sola: las desigualdades del grupo deben admitirla
+            rhs = equality[0]
+            if (rhs < lower[0] - TOLERANCE * max(1.0, abs(lower[0]))
+                    or rhs > upper[0] + TOLERANCE * max(1.0, abs(upper[0]))):
+                raise _Infeasible()
+            lower = upper = equality
+        if lower[0] > upper[0] + TOLERANCE * max(1.0, abs(upper[0])):
+            raise _Infeasible()
+        keep = {lower[1], upper[1]} - {None}
+        for row in rows:
+            if row not in keep:
+                self._drop_row(row)
+        return len(rows) - len(keep)
+    
+    def _mip_reductions(self):
+        """Propagación de cotas, filas redundantes, coeficientes de binarias y sondeo."""
+        changed = self._propagate_bounds()
+        changed |= self._redundant_rows()
+        changed |= self._tighten_coefficients()
+        if not changed:
+            changed = self._probe()
+        return changed
+    
+    def _row_entries(self):
+        """Coeficientes vivos: (filas, columnas, valores, posiciones)."""
+        live = self.row_alive[self.entry_rows] & self.col_alive[self.entry_cols]
+        positions = np.flatnonzero(live)
+        return self.entry_rows[positions], self.entry_cols[positions], self.entry_values[positions], positions
+    
+    def _propagate(self, lower, upper, rounds, entries=None):
+        """
+        Ajusta las cotas con la actividad mínima y máxima de cada fila.
+        
+        Args:
+            lower (numpy.ndarray): Cotas inferiores de partida (no se modifican)
+            upper (numpy.ndarray): Cotas superiores de partida (no se modifican)
+            rounds (int): Rondas máximas de propagación
+            entries (tuple, optional): Resultado de _row_entries() ya calculado
+        
+        Returns:
+            tuple o None: (lower, upper) ajustadas; None si alguna fila no se
+                          puede cumplir dentro de las cotas
+        """
+        rows, cols, values, _ = entries or self._row_entries()
+        num_rows = len(self.b)
+        senses = np.asarray(self.senses)[rows]
+        rhs = self.b[rows]
+        slack = FEASIBILITY_TOLERANCE * np.maximum(1.0, np.abs(rhs))
+        has_upper = senses != '>='  # a·x <= b
+        has_lower = senses != '<='  # a·x >= b
+        positive = values > 0
+        for _ in range(rounds):
+            low = np.where(positive, values * lower[cols], values * upper[cols])
+            high = np.where(positive, values * upper[cols], values * lower[cols])
+            low_sum, low_infinite, low_own, low_own_infinite = _activity(rows, low, num_rows)
+            high_sum, high_infinite, high_own, high_own_infinite = _activity(rows, high, num_rows)
+            if ((has_upper & (low_infinite[rows] == 0) & (low_sum[rows] > rhs + slack)).any()
+                    or (has_lower & (high_infinite[rows] == 0) & (high_sum[rows] < rhs - slack)).any()):
+                return None
+            
+            new_lower, new_upper = lower.copy(), upper.copy()
+            # a_j·x_j <= b - actividad mínima del resto de la fila
+            usable = has_upper & (low_infinite[rows] - low_own_infinite == 0)
+            bound = (rhs - (low_sum[rows] - low_own)) / values
+            np.minimum.at(new_upper, cols[usable & positive], bound[usable & positive])
+            np.maximum.at(new_lower, cols[usable & ~positive], bound[usable & ~positive])
+            # a_j·x_j >= b - actividad máxima del resto de la fila
+            usable = has_lower & (high_infinite[rows] - high_own_infinite == 0)
+            bound = (rhs - (high_sum[rows] - high_own)) / values
+            np.maximum.at(new_lower, cols[usable & positive], bound[usable & positive])
+            np.minimum.at(new_upper, cols[usable & ~positive], bound[usable & ~positive])
+            
+            integer = self.integer
+            new_upper[integer] = np.floor(new_upper[integer] + FEASIBILITY_TOLERANCE)
+            new_lower[integer] = np.ceil(new_lower[integer] - FEASIBILITY_TOLERANCE)
+            if (new_lower > new_upper + FEASIBILITY_TOLERANCE).any():
+                return None
+            new_upper = np.maximum(new_upper, new_lower)
+            
+            improved = _improved(new_upper, upper) | _improved(-new_lower, -lower)
+            lower, upper = new_lower, new_upper
+            if not improved.any():
+                break
+        return lower, upper
+    
+    def _propagate_bounds(self):
+        """Fija las variables de cotas iguales y guarda las cotas que mejora la propagación."""
+        bounds = self._propagate(self.lower, self.upper, PROPAGATION_ROUNDS)
+        if bounds is None:
+            raise _Infeasible()
+        lower, upper = bounds
+        fixed = self.col_alive & (upper - lower <= FEASIBILITY_TOLERANCE)
+        for col in np.flatnonzero(fixed).tolist():
+            self._fix(col, lower[col])
+        
+        # La cota deducida reemplaza a la anterior: ya no sale de una fila
+        better_upper = self.col_alive & _improved(upper, self.upper)
+        better_lower = self.col_alive & _improved(-lower, -self.lower)
+        self.upper[better_upper] = upper[better_upper]
+        self.upper_row[better_upper] = -1
+        self.lower[better_lower] = lower[better_lower]
+        self.lower_row[better_lower] = -1
+        tightened = int(better_upper.sum() + better_lower.sum())
+        self.stats['tightened_bounds'] += tightened
+        return bool(fixed.any()) or tightened > 0
+    
+    def _redundant_rows(self):
+        """Quita las filas que se cumplen con cualquier valor dentro de las cotas."""
+        rows, cols, values, _ = self._row_entries()
+        num_rows = len(self.b)
+        positive = values > 0
+        low = np.where(positive, values * self.lower[cols], values * self.upper[cols])
+        high = np.where(positive, values * self.upper[cols], values * self.lower[cols])
+        low_sum, low_infinite, _, _ = _activity(rows, low, num_rows)
+        high_sum, high_infinite, _, _ = _activity(rows, high, num_rows)
+        senses = np.asarray(self.senses)
+        slack = TOLERANCE * np.maximum(1.0, np.abs(self.b))
+        redundant = self.row_alive & np.isin(np.arange(num_rows), rows) & (
+            ((senses == '<=') & (high_infinite == 0) & (high_sum <= self.b + slack))
+            | ((senses == '>=') & (low_infinite == 0) & (low_sum >= self.b - slack))
+        )
+        for row in np.flatnonzero(redundant).tolist():
+            self._drop_row(row)
+        self.stats['redundant_rows'] += int(redundant.sum())
+        return bool(redundant.any())
+    
+    def _binary_columns(self):
+        """Variables enteras vivas con cotas 0 y 1."""
+        return self.integer & self.col_alive & (self.lower == 0) & (np.abs(self.upper - 1) <= TOLERANCE)
+    
+    def _tighten_coefficients(self):
+        """
+        Reduce los coeficientes de binarias mayores que la holgura de su fila.
+        
+        En a·x <= b con actividad máxima M > b, una binaria con a_j > M - b
+        pasa a a_j = M - b (y b baja en lo mismo que a_j), y una con
+        a_j < -(M - b) pasa a a_j = -(M - b): con x_j en 0 o en 1 la fila
+        admite las mismas soluciones, pero la relajación lineal es más ajustada.
+        Las filas '>=' se tratan igual con la actividad mínima.
+        """
+        binary = self._binary_columns()
+        if not binary.any():
+            return False
+        rows, cols, values, positions = self._row_entries()
+        num_rows = len(self.b)
+        positive = values > 0
+        senses = np.asarray(self.senses)[rows]
+        candidate = binary[cols]
+        
+        low = np.where(positive, values * self.lower[cols], values * self.upper[cols])
+        high = np.where(positive, values * self.upper[cols], values * self.lower[cols])
+        low_sum, low_infinite, _, _ = _activity(rows, low, num_rows)
+        high_sum, high_infinite, _, _ = _activity(rows, high, num_rows)
+        
+        # Filas '<=': holgura M - b
+        gap = high_sum[rows] - self.b[rows]
+        usable = candidate & (senses == '<=') & (high_infinite[rows] == 0) & (gap > FEASIBILITY_TOLERANCE)
+        down = usable & (values > gap + FEASIBILITY_TOLERANCE)
+        up = usable & (values < -gap - FEASIBILITY_TOLERANCE)
+        np.subtract.at(self.b, rows[down], values[down] - gap[down])
+        new_values = np.where(down, gap, np.where(up, -gap, values))
+        tightened = down | up
+        
+        # Filas '>=': holgura b - m
+        gap = self.b[rows] - low_sum[rows]
+        usable = candidate & (senses == '>=') & (low_infinite[rows] == 0) & (gap > FEASIBILITY_TOLERANCE)
+        down = usable & (values > gap + FEASIBILITY_TOLERANCE)
+        up = usable & (values < -gap - FEASIBILITY_TOLERANCE)
+        np.subtract.at(self.b, rows[up], values[up] + gap[up])
+        new_values = np.where(down, gap, np.where(up, -gap, new_values))
+        tightened |= down | up
+        
+        self.entry_values[positions[tightened]] = new_values[tightened]
+        self.stats['tightened_coefficients'] += int(tightened.sum())
+        return bool(tightened.any())
+    
+    def _probe(self):
+        """
+        Fija x_j = 0 y x_j = 1 en las binarias con más coeficientes y propaga:
+        si una rama es inviable, la binaria toma el otro valor; si en ambas
+        ramas otra variable queda fija en el mismo valor, se fija.
+        """
+        entries = self._row_entries()
+        binary = self._binary_columns()
+        count = np.bincount(entries[1], minlength=len(self.c))
+        limit = min(MAX_PROBED, PROBING_WORK // max(1, len(entries[0]) * PROBING_ROUNDS * 2))
+        candidates = np.flatnonzero(binary & (count > 0))
+        candidates = candidates[np.argsort(-count[candidates], kind='stable')][:limit]
+        
+        fixes = {}
+        for col in candidates.tolist():
+            branches = []
+            for value in (0.0, 1.0):
+                lower, upper = self.lower.copy(), self.upper.copy()
+                lower[col] = upper[col] = value
+                branches.append(self._propagate(lower, upper, PROBING_ROUNDS, entries))
+            if branches[0] is None and branches[1] is None:
+                raise _Infeasible()
+            if branches[0] is None or branches[1] is None:
+                fixes[col] = 1.0 if branches[0] is None else 0.0
+                continue
+            (lower0, upper0), (lower1, upper1) = branches
+            # Las cotas infinitas dan NaN en las diferencias, que no cuentan como fijas
+            with np.errstate(invalid='ignore'):
+                same = (
+                    self.col_alive & (self.upper - self.lower > FEASIBILITY_TOLERANCE)
+                    & (upper0 - lower0 <= FEASIBILITY_TOLERANCE) & (upper1 - lower1 <= FEASIBILITY_TOLERANCE)
+                    & (np.abs(lower0 - lower1) <= FEASIBILITY_TOLERANCE)
+                )
+            for other in np.flatnonzero(same).tolist():
+                fixes.setdefault(other, lower0[other])
+        
+        for col, value in fixes.items():
+            self._fix(col, value)
+        self.stats['probing_fixed'] += len(fixes)
+        return len(fixes) > 0
+    
+    def _result(self, infeasible):
+        """Arma el modelo reducido con las filas y columnas vivas."""
+        original = self.original
+        rows = np.flatnonzero(self.row_alive)
+        cols = np.flatnonzero(self.col_alive)
+        live = self.row_alive[self.entry_rows] & self.col_alive[self.entry_cols]
+        new_col = np.cumsum(self.col_alive) - 1
+        row_count = np.bincount(self.entry_rows[live], minlength=len(self.b))[rows]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(row_count, out=indptr[1:])
+        
+        arrays = {
+            'sense': original['sense'],
+            'c': self.c[cols],
+            'indptr': indptr,
+            'indices': new_col[self.entry_cols[live]],
+            'data': self.entry_values[live],
+            'senses': [self.senses[i] for i in rows.tolist()],
+            'b': self.b[rows],
+            'integer': self.integer[cols],
+            'lower': self.lower[cols],
+            'upper': self.upper[cols],
+            'variable_names': [original['variable_names'][j] for j in cols.tolist()],
+            'constraint_names': [original['constraint_names'][i] for i in rows.tolist()]
+        }
+        stats = dict(self.stats)
+        stats['rows_removed'] = len(self.b) - len(rows)
+        stats['columns_removed'] = len(self.c) - len(cols)
+        stats['nonzeros_removed'] = len(self.entry_values) - int(live.sum())
+        # Variables que quedan con una cota salida de una fila quitada
+        from_rows = cols[(self.upper_row[cols] >= 0) | (self.lower_row[cols] >= 0)]
+        bound_stack = [(col, self._bound_candidates(col)) for col in from_rows.tolist()]
+        return Presolve(
+            original, infeasible, arrays, rows, cols, self.fixed_values, self.fix_stack,
+            bound_stack, stats, time.perf_counter() - self.start
+        )
+
+
+def _activity(rows, contributions, num_rows):
+    """
+    Suma por fila de las contribuciones finitas y número de infinitas.
+    
+    Returns:
+        tuple: (suma finita por fila, infinitas por fila, contribución finita
+               de cada coeficiente, 1 si la de cada coeficiente es infinita)
+    """
+    infinite = np.isinf(contributions)
+    finite = np.where(infinite, 0.0, contributions)
+    return (
+        np.bincount(rows, weights=finite, minlength=num_rows),
+        np.bincount(rows, weights=infinite, minlength=num_rows),
+        finite,
+        infinite
+    )
+
+
+def _improved(new, old):
+    """True donde la cota superior new mejora (baja) a old en más de MIN_BOUND_CHANGE relativo."""
+    with np.errstate(invalid='ignore'):
+        return np.where(
+            np.isinf(old), np.isfinite(new),
+            new < old - MIN_BOUND_CHANGE * np.maximum(1.0, np.abs(old))
+        )
+
+
+class _Infeasible(Exception):
+    """El presolve encontró una restricción imposible de cumplir."""
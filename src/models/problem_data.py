@@ -0,0 +1,365 @@
+"""
+Datos del problema en arreglos NumPy, independientes de la interfaz.
+
+ProblemData guarda c, b, los tipos de restricción, las variables enteras, las
+cotas de las variables y los nombres, y la matriz A como una base CSR (vacía,
+o los arreglos de un proyecto mapeados en memoria) más un diccionario con los
+coeficientes modificados después. La tabla lo actualiza celda a celda al
+confirmar cada edición, y tanto LPModel como la escritura de archivos lo leen
+en forma matricial sin volver a interpretar texto.
+"""
+
+import numpy as np
+
+from ..utils.project_files import project_to_spec
+
+
+CONSTRAINT_TYPES = ('<=', '>=', '=')
+
+# Tipos de variable: las binarias son enteras con cotas 0 y 1
+VARIABLE_TYPES = ('Continua', 'Entera', 'Binaria')
+
+
+def variable_type(is_integer, lower, upper):
+    """
+    Tipo de una variable según su integralidad y sus cotas.
+    
+    Args:
+        is_integer (bool): True si la variable es entera
+        lower (float): Cota inferior (-inf si no tiene)
+        upper (float): Cota superior (inf si no tiene)
+    
+    Returns:
+        str: 'Continua', 'Entera' o 'Binaria' (entera con cotas 0 y 1)
+    """
+    if not is_integer:
+        return 'Continua'
+    return 'Binaria' if lower == 0 and upper == 1 else 'Entera'
+
+
+class ProblemData:
+    """
+    Problema de PL en forma matricial, editable por celdas.
+    
+    Attributes:
+        sense (str): 'Maximizar' o 'Minimizar'
+        c (numpy.ndarray): Coeficientes de la función objetivo (n)
+        b (numpy.ndarray): Lados derechos (m)
+        senses (list): Tipo de cada restricción: '<=', '>=', '=' (m)
+        integer (numpy.ndarray): Variables enteras (n, booleano)
+        lower (numpy.ndarray): Cotas inferiores de las variables (n, -inf si no hay)
+        upper (numpy.ndarray): Cotas superiores de las variables (n, inf si no hay)
+        variable_names (list): Nombres de las variables (n)
+        constraint_names (list): Nombres de las restricciones (m)
+    """
+    
+    def __init__(self, sense, c, indptr, indices, data, senses, b, integer,
+                 variable_names, constraint_names, lower=None, upper=None):
+        """
+        Crea el problema a partir de sus arreglos; A se da en CSR y no se copia
+        (puede estar mapeada en memoria), c, b y las cotas sí porque son
+        editables. Sin cotas, las variables son no negativas.
+        """
+        self.sense = sense
+        self.c = np.array(c, dtype=float)
+        self.b = np.array(b, dtype=float)
+        self.senses = list(senses)
+        self.integer = np.array(integer, dtype=bool)
+        self.lower = np.zeros(len(self.c)) if lower is None else np.array(lower, dtype=float)
+        self.upper = np.full(len(self.c), np.inf) if upper is None else np.array(upper, dtype=float)
+        self.variable_names = list(variable_names)
+        self.constraint_names = list(constraint_names)
+        self._indptr = indptr
+        self._indices = indices
+        self._data = data
+        self._edits = {}  # fila -> {columna: coeficiente modificado sobre la base}
+    
+    @classmethod
+    def empty(cls, num_vars, num_constraints, sense='Maximizar'):
+        """
+        Problema con todos los coeficientes en cero y restricciones '<='.
+        
+        Args:
+            num_vars (int): Número de variables
+            num_constraints (int): Número de restricciones
+            sense (str): 'Maximizar' o 'Minimizar'
+        
+        Returns:
+            ProblemData: Problema vacío
+        """
+        return cls(
+            sense,
+            np.zeros(num_vars),
+            np.zeros(num_constraints + 1, dtype=np.int64),
+            np.zeros(0, dtype=np.int64),
+            np.zeros(0),
+            ['<='] * num_constraints,
+            np.zeros(num_constraints),
+            np.zeros(num_vars, dtype=bool),
+            [f"X{j+1}" for j in range(num_vars)],
+            [f"R{i+1}" for i in range(num_constraints)]
+        )
+    
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Problema a partir del formato de LPModel.to_arrays() o de load_project.
+        
+        Args:
+            arrays (dict): sense, c, indptr, indices, data, senses, b, integer,
+                           lower, upper y nombres
+        
+        Returns:
+            ProblemData: Problema con A como base (sin copiarla)
+        """
+        return cls(
+            arrays['sense'], arrays['c'], arrays['indptr'], arrays['indices'],
+            arrays['data'], arrays['senses'], arrays['b'], arrays['integer'],
+            arrays['variable_names'], arrays['constraint_names'],
+            arrays['lower'], arrays['upper']
+        )
+    
+    @property
+    def num_vars(self):
+        """Número de variables."""
+        return len(self.c)
+    
+    @property
+    def num_constraints(self):
+        """Número de restricciones."""
+        return len(self.b)
+    
+    def resize(self, num_vars, num_constraints):
+        """
+        Amplía el problema con variables y restricciones nuevas (coeficientes en
+        cero, restricciones '<=', variables continuas no negativas) conservando
+        los datos existentes.
+        
+        Args:
+            num_vars (int): Nuevo número de variables
+            num_constraints (int): Nuevo número de restricciones
+        
+        Raises:
+            ValueError: Si alguna dimensión es menor que la actual
+        """
+        old_vars, old_constraints = self.num_vars, self.num_constraints
+        if num_vars < old_vars or num_constraints < old_constraints:
+            raise ValueError("El problema solo se puede ampliar.")
+        
+        self.c = np.concatenate([self.c, np.zeros(num_vars - old_vars)])
+        self.integer = np.concatenate([self.integer, np.zeros(num_vars - old_vars, dtype=bool)])
+        self.lower = np.concatenate([self.lower, np.zeros(num_vars - old_vars)])
+        self.upper = np.concatenate([self.upper, np.full(num_vars - old_vars, np.inf)])
+        self.variable_names += [f"X{j+1}" for j in range(old_vars, num_vars)]
+        
+        self.b = np.concatenate([self.b, np.zeros(num_constraints - old_constraints)])
+        self.senses += ['<='] * (num_constraints - old_constraints)
+        self.constraint_names += [f"R{i+1}" for i in range(old_constraints, num_constraints)]
+        # Las filas nuevas de la base quedan vacías
+        self._indptr = np.concatenate([
+            self._indptr, np.full(num_constraints - old_constraints, self._indptr[-1], dtype=np.int64)
+        ])
+    
+    def coefficient(self, row, col):
+        """
+        Coeficiente A[row, col].
+        
+        Args:
+            row (int): Posición de la restricción
+            col (int): Posición de la variable
+        
+        Returns:
+            float: El coeficiente (0.0 si no está almacenado)
+        """
+        value = self._edits.get(row, {}).get(col)
+        if value is not None:
+            return value
+        start, end = int(self._indptr[row]), int(self._indptr[row + 1])
+        columns = self._indices[start:end]
+        k = int(np.searchsorted(columns, col))
+        if k < len(columns) and columns[k] == col:
+            return float(self._data[start + k])
+        return 0.0
+    
+    def row(self, index):
+        """
+        Coeficientes no nulos de una restricción, con las modificaciones aplicadas.
+        
+        Args:
+            index (int): Posición de la restricción
+        
+        Returns:
+            tuple: (columnas, valores) como arreglos NumPy ordenados por columna
+        """
+        start, end = int(self._indptr[index]), int(self._indptr[index + 1])
+        cols = np.asarray(self._indices[start:end], dtype=np.int64)
+        values = np.asarray(self._data[start:end], dtype=float)
+        edits = self._edits.get(index)
+        if edits:
+            edit_cols = np.fromiter(edits, dtype=np.int64, count=len(edits))
+            keep = ~np.isin(cols, edit_cols)
+            cols = np.concatenate([cols[keep], edit_cols])
+            values = np.concatenate([values[keep], np.fromiter(edits.values(), dtype=float, count=len(edits))])
+            order = np.argsort(cols, kind='stable')
+            cols, values = cols[order], values[order]
+        nonzero = values != 0
+        return cols[nonzero], values[nonzero]
+    
+    def set_coefficient(self, row, col, value):
+        """Cambia A[row, col]."""
+        self._edits.setdefault(row, {})[col] = float(value)
+    
+    def set_coefficients(self, rows, cols, values):
+        """
+        Cambia varios coeficientes de A a la vez.
+        
+        Args:
+            rows (sequence): Posiciones de las restricciones
+            cols (sequence): Posiciones de las variables
+            values (sequence): Nuevos coeficientes
+        """
+        edits = self._edits
+        for row, col, value in zip(np.asarray(rows).tolist(), np.asarray(cols).tolist(),
+                                   np.asarray(values, dtype=float).tolist()):
+            edits.setdefault(row, {})[col] = value
+    
+    def set_objective(self, col, value):
+        """Cambia el coeficiente objetivo de una variable."""
+        self.c[col] = value
+    
+    def set_rhs(self, row, value):
+        """Cambia el lado derecho de una restricción."""
+        self.b[row] = value
+    
+    def set_constraint_type(self, row, constraint_type):
+        """
+        Cambia el tipo de una restricción.
+        
+        Raises:
+            ValueError: Si el tipo no es válido
+        """
+        if constraint_type not in CONSTRAINT_TYPES:
+            raise ValueError(f"Tipo de restricción no válido: '{constraint_type}'")
+        self.senses[row] = constraint_type
+    
+    def set_integer(self, col, is_integer):
+        """Marca o desmarca una variable como entera."""
+        self.integer[col] = bool(is_integer)
+    
+    def set_bounds(self, col, lower, upper):
+        """
+        Cambia las cotas de una variable.
+        
+        Args:
+            col (int): Posición de la variable
+            lower (float): Cota inferior (-inf si no tiene)
+            upper (float): Cota superior (inf si no tiene)
+        
+        Raises:
+            ValueError: Si la cota inferior es mayor que la superior
+        """
+        if lower > upper:
+            raise ValueError(
+                f"La cota inferior de '{self.variable_names[col]}' es mayor que la superior."
+            )
+        self.lower[col] = lower
+        self.upper[col] = upper
+    
+    def variable_type(self, col):
+        """Tipo de una variable: 'Continua', 'Entera' o 'Binaria'."""
+        return variable_type(self.integer[col], self.lower[col], self.upper[col])
+    
+    def set_variable_type(self, col, var_type):
+        """
+        Cambia el tipo de una variable. 'Binaria' la hace entera con cotas 0 y
+        1; 'Continua' y 'Entera' solo cambian la integralidad y conservan las
+        cotas.
+        
+        Raises:
+            ValueError: Si el tipo no es válido
+        """
+        if var_type not in VARIABLE_TYPES:
+            raise ValueError(f"Tipo de variable no válido: '{var_type}'")
+        self.integer[col] = var_type != 'Continua'
+        if var_type == 'Binaria':
+            self.lower[col], self.upper[col] = 0.0, 1.0
+    
+    def set_variable_name(self, col, name):
+        """Cambia el nombre de una variable."""
+        self.variable_names[col] = name
+    
+    def csr(self):
+        """
+        Matriz A en CSR con las modificaciones aplicadas, sin ceros y con las
+        columnas de cada fila ordenadas.
+        
+        Returns:
+            tuple: (indptr, indices, data)
+        """
+        num_rows, num_cols = self.num_constraints, self.num_vars
+        if not self._edits:
+            return self._indptr, self._indices, self._data
+        
+        rows = np.repeat(np.arange(num_rows, dtype=np.int64), np.diff(self._indptr))
+        cols = np.asarray(self._indices, dtype=np.int64)
+        values = np.asarray(self._data, dtype=float)
+        
+        count = sum(len(edits) for edits in self._edits.values())
+        edit_rows = np.fromiter(
+            (row for row, edits in self._edits.items() for _ in edits), dtype=np.int64, count=count
+        )
+        edit_cols = np.fromiter(
+            (col for edits in self._edits.values() for col in edits), dtype=np.int64, count=count
+        )
+        edit_values = np.fromiter(
+            (value for edits in self._edits.values() for value in edits.values()), dtype=float, count=count
+        )
+        
+        # Las posiciones modificadas reemplazan a las de la base
+        keep = ~np.isin(rows * num_cols + cols, edit_rows * num_cols + edit_cols)
+        rows = np.concatenate([rows[keep], edit_rows])
+        cols = np.concatenate([cols[keep], edit_cols])
+        values = np.concatenate([values[keep], edit_values])
+        nonzero = values != 0
+        rows, cols, values = rows[nonzero], cols[nonzero], values[nonzero]
+        
+        order = np.lexsort((cols, rows))
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_rows), out=indptr[1:])
+        return indptr, cols[order], values[order]
+    
+    def to_arrays(self):
+        """
+        Problema en el formato de LPModel.to_arrays() (sirve para save_project,
+        write_mps y write_lp).
+        
+        Returns:
+            dict: sense, c, indptr, indices, data, senses, b, integer, lower,
+                  upper y nombres
+        """
+        indptr, indices, data = self.csr()
+        return {
+            'sense': self.sense,
+            'c': self.c.copy(),
+            'indptr': indptr,
+            'indices': indices,
+            'data': data,
+            'senses': list(self.senses),
+            'b': self.b.copy(),
+            'integer': self.integer.copy(),
+            'lower': self.lower.copy(),
+            'upper': self.upper.copy(),
+            'variable_names': list(self.variable_names),
+            'constraint_names': list(self.constraint_names)
+        }
+    
+    def to_spec(self):
+        """
+        Argumentos de LPModel.from_arrays.
+        
+        Returns:
+            dict: sense, c, A (dispersa si SciPy está instalado), senses, b,
+                  variable_names, integer_vars, lower_bounds, upper_bounds y
+                  constraint_names
+        """
+        return project_to_spec(self.to_arrays())
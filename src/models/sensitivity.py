@@ -0,0 +1,262 @@
+"""
+Análisis de sensibilidad de una solución óptima de PL continua.
+
+A partir de la solución y de los duales que devuelve cualquier backend se
+reconstruye una base óptima y se calculan, sin volver a resolver:
+    
+    shadow_prices   Variación del objetivo por unidad de aumento de cada b_i
+    slacks          Holgura de cada fila (b − a·x en '<=' y '=', a·x − b en '>=')
+    reduced_costs   c_j − yᵀA_j de cada variable
+    objective_lower / objective_upper
+                    Intervalo de cada c_j en el que la base sigue siendo óptima
+    rhs_lower / rhs_upper
+                    Intervalo de cada b_i en el que la base sigue siendo factible
+                    (dentro de él los precios sombra no cambian)
+
+Los intervalos usan una factorización densa de la base, por lo que solo se
+calculan hasta SENSITIVITY_MAX_ROWS filas; con más filas quedan en None. En
+soluciones degeneradas la base se completa con QR con pivoteo de SciPy (sin
+SciPy, por eliminación columna a columna, mucho más lenta).
+"""
+
+import numpy as np
+
+try:
+    from scipy.linalg import qr
+except ImportError:  # SciPy es opcional
+    qr = None
+
+
+# Filas máximas para calcular los intervalos (B⁻¹ denso de m × m)
+SENSITIVITY_MAX_ROWS = 500
+
+# Tolerancia para decidir si un valor está en su cota o un costo reducido es cero
+TOLERANCE = 1e-7
+
+# Pivote mínimo para considerar una columna independiente de las ya elegidas
+PIVOT_TOLERANCE = 1e-9
+
+
+def analyze(arrays, x, duals):
+    """
+    Calcula el informe de sensibilidad de una solución óptima.
+    
+    Args:
+        arrays (dict): Modelo en forma matricial (LPModel.to_arrays())
+        x (array-like): Valores óptimos por columna
+        duals (array-like): Duales por fila en el sentido del modelo
+    
+    Returns:
+        dict: Arreglos de NumPy shadow_prices, slacks, reduced_costs (por fila o
+              columna) y objective_lower/upper, rhs_lower/upper (None si el
+              modelo supera SENSITIVITY_MAX_ROWS filas)
+    """
+    c = arrays['c']
+    b = arrays['b']
+    num_rows, num_cols = len(b), len(c)
+    senses = np.asarray(arrays['senses'], dtype=object)
+    x = np.asarray(x, dtype=float)
+    duals = np.asarray(duals, dtype=float)
+    
+    row_index = np.repeat(np.arange(num_rows), np.diff(arrays['indptr']))
+    activity = np.bincount(
+        row_index, weights=arrays['data'] * x[arrays['indices']], minlength=num_rows
+    )
+    reduced_costs = c - np.bincount(
+        arrays['indices'], weights=arrays['data'] * duals[row_index], minlength=num_cols
+    )
+    slacks = np.where(senses == '>=', activity - b, b - activity)
+    
+    report = {
+        'shadow_prices': duals + 0.0,
+        'slacks': slacks + 0.0,
+        'reduced_costs': reduced_costs + 0.0,
+        'objective_lower': None,
+        'objective_upper': None,
+        'rhs_lower': None,
+        'rhs_upper': None
+    }
+    if num_rows > SENSITIVITY_MAX_ROWS:
+        return report
+    
+    A = np.zeros((num_rows, num_cols))
+    A[row_index, arrays['indices']] = arrays['data']
+    ranges = _ranging(
+        A, c, b, senses, arrays['lower'], arrays['upper'], x, activity, duals,
+        arrays['sense'] == 'Maximizar'
+    )
+    if ranges is not None:
+        report.update(ranges)
+    return report
+
+
+def _ranging(A, c, b, senses, col_lower, col_upper, x, activity, duals, maximize):
+    """
+    Intervalos de costos y lados derechos para la base óptima reconstruida.
+    
+    Se trabaja en forma de minimización con columnas [A | I]: las variables
+    tienen sus cotas [col_lower, col_upper] y la holgura s_i = b_i − a_i·x
+    vale >= 0 en '<=', <= 0 en '>=' y 0 en '='.
+    
+    Returns:
+        dict o None: Intervalos por columna y por fila (None si la base es singular)
+    """
+    num_rows, num_cols = A.shape
+    M = np.hstack([A, np.eye(num_rows)])
+    cost = np.concatenate([-c if maximize else c, np.zeros(num_rows)])
+    y = -duals if maximize else duals
+    d = cost - y @ M
+    z = np.concatenate([x, b - activity])
+    lower = np.concatenate([col_lower, np.where(senses == '>=', -np.inf, 0.0)])
+    upper = np.concatenate([col_upper, np.where(senses == '<=', np.inf, 0.0)])
+    
+    scale = 1.0 + np.abs(z)
+    at_lower = np.abs(z - lower) <= TOLERANCE * scale
+    at_upper = np.abs(upper - z) <= TOLERANCE * scale
+    basic = _choose_basis(M, ~at_lower & ~at_upper, np.abs(d), TOLERANCE * (1.0 + np.abs(cost)))
+    if basic is None:
+        return None
+    
+    try:
+        B_inv = np.linalg.inv(M[:, basic])
+    except np.linalg.LinAlgError:
+        return None
+    nonbasic = np.ones(num_cols + num_rows, dtype=bool)
+    nonbasic[basic] = False
+    z_basic = B_inv @ b - B_inv @ (M[:, nonbasic] @ z[nonbasic])
+    
+    # Lados derechos: z_B + δ·B⁻¹e_i debe quedar entre las cotas de las básicas
+    rhs_down, rhs_up = _step_limits(B_inv, z_basic, lower[basic], upper[basic])
+    
+    # Costos: d se recalcula con la base para que los intervalos sean coherentes
+    y_basis = cost[basic] @ B_inv
+    d = cost - y_basis @ M
+    fixed = lower == upper
+    lower_side = nonbasic & ~fixed & at_lower
+    upper_side = nonbasic & ~fixed & ~at_lower & at_upper
+    free_side = nonbasic & ~fixed & ~at_lower & ~at_upper
+    d = np.where(lower_side, np.maximum(d, 0.0), np.where(upper_side, np.minimum(d, 0.0), d))
+    
+    cost_down = np.full(num_cols + num_rows, -np.inf)
+    cost_up = np.full(num_cols + num_rows, np.inf)
+    # No básicas: solo su propio costo reducido puede cambiar de signo
+    cost_down[lower_side] = -d[lower_side]
+    cost_up[upper_side] = -d[upper_side]
+    cost_down[free_side] = cost_up[free_side] = -d[free_side]
+    # Básicas: el cambio δ en c_p altera los costos reducidos en −δ·(B⁻¹N)_p
+    alpha = B_inv @ M[:, nonbasic]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = d[nonbasic] / alpha
+    tiny = np.abs(alpha) <= 1e-12
+    # En la cota inferior hace falta d_k − δ·α >= 0; en la superior, <= 0
+    bounded_above = (lower_side[nonbasic] & (alpha > 0)) | (upper_side[nonbasic] & (alpha < 0))
+    bounded_below = (lower_side[nonbasic] & (alpha < 0)) | (upper_side[nonbasic] & (alpha > 0))
+    bounded_above |= free_side[nonbasic] & ~tiny
+    bounded_below |= free_side[nonbasic] & ~tiny
+    bounded_above &= ~tiny
+    bounded_below &= ~tiny
+    cost_up[basic] = np.where(bounded_above, ratios, np.inf).min(axis=1, initial=np.inf)
+    cost_down[basic] = np.where(bounded_below, ratios, -np.inf).max(axis=1, initial=-np.inf)
+    np.minimum(cost_down, 0.0, out=cost_down)
+    np.maximum(cost_up, 0.0, out=cost_up)
+    
+    cost_down, cost_up = cost_down[:num_cols], cost_up[:num_cols]
+    if maximize:
+        # c = −c_min: el intervalo se refleja
+        cost_down, cost_up = -cost_up, -cost_down
+    return {
+        'objective_lower': c + cost_down,
+        'objective_upper': c + cost_up,
+        'rhs_lower': b + rhs_down,
+        'rhs_upper': b + rhs_up
+    }
+
+
+def _choose_basis(M, must_basic, reduced_cost_size, zero_cost_tolerance):
+    """
+    Elige m columnas linealmente independientes de M como base.
+    
+    Primero las que están estrictamente entre sus cotas; después las de costo
+    reducido cero (completan una base óptima en soluciones degeneradas) y por
+    último el resto.
+    
+    Returns:
+        ndarray o None: Índices de las columnas básicas
+    """
+    num_rows = M.shape[0]
+    order = np.lexsort((reduced_cost_size, ~must_basic))
+    if not num_rows:
+        return order[:0]
+    # Caso habitual (sin degeneración): las m primeras ya forman una base
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if np.linalg.cond(M[:, order[:num_rows]], 1) < 1e12:
+            return order[:num_rows]
+    if qr is None:
+        return _greedy_basis(M, order)
+    
+    zero_cost = reduced_cost_size <= zero_cost_tolerance
+    chosen = np.zeros(0, dtype=np.int64)
+    for tier in (must_basic, ~must_basic & zero_cost, ~must_basic & ~zero_cost):
+        candidates = np.flatnonzero(tier)
+        if not len(candidates):
+            continue
+        # Parte de cada candidata fuera del espacio de las ya elegidas
+        columns = M[:, candidates]
+        if len(chosen):
+            Q = np.linalg.qr(M[:, chosen])[0]
+            columns = columns - Q @ (Q.T @ columns)
+        _, R, pivots = qr(columns, mode='economic', pivoting=True)
+        rank = int(np.count_nonzero(np.abs(np.diag(R)) > PIVOT_TOLERANCE))
+        chosen = np.concatenate([chosen, candidates[pivots[:min(rank, num_rows - len(chosen))]]])
+        if len(chosen) == num_rows:
+            return chosen
+    return None
+
+
+def _greedy_basis(M, order):
+    """
+    Base con las primeras columnas independientes de M en el orden dado, por
+    eliminación gaussiana columna a columna (solo si falta SciPy).
+    
+    Returns:
+        ndarray o None: Índices de las columnas básicas
+    """
+    num_rows = M.shape[0]
+    W = M[:, order].copy()
+    chosen = []
+    free_rows = np.ones(num_rows, dtype=bool)
+    for k in range(W.shape[1]):
+        if len(chosen) == num_rows:
+            break
+        column = np.where(free_rows, W[:, k], 0.0)
+        r = int(np.argmax(np.abs(column)))
+        if abs(column[r]) <= PIVOT_TOLERANCE:
+            continue
+        # Eliminación gaussiana de la fila pivote en las columnas restantes
+        factors = W[:, k] / W[r, k]
+        factors[r] = 0.0
+        W[:, k + 1:] -= np.outer(factors, W[r, k + 1:])
+        free_rows[r] = False
+        chosen.append(order[k])
+    if len(chosen) < num_rows:
+        return None
+    return np.array(chosen)
+
+
+def _step_limits(B_inv, z_basic, lower, upper):
+    """
+    Para cada fila i, el rango [δ⁻, δ⁺] de cambios de b_i que mantiene
+    z_B + δ·B⁻¹e_i dentro de las cotas de las variables básicas.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        to_upper = (upper - z_basic)[:, None] / B_inv
+        to_lower = (lower - z_basic)[:, None] / B_inv
+    positive = B_inv > 1e-12
+    negative = B_inv < -1e-12
+    up = np.where(positive, to_upper, np.where(negative, to_lower, np.inf))
+    down = np.where(positive, to_lower, np.where(negative, to_upper, -np.inf))
+    up[np.isnan(up)] = np.inf
+    down[np.isnan(down)] = -np.inf
+    step_up = np.maximum(up.min(axis=0, initial=np.inf), 0.0)
+    step_down = np.minimum(down.max(axis=0, initial=-np.inf), 0.0)
+    return step_down, step_up
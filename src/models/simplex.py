@@ -0,0 +1,402 @@
+"""
+Motor símplex denso en NumPy para modelos continuos pequeños.
+
+Resuelve  min/max c·x  sujeto a  A x (<=, >=, =) b,  lower <= x <= upper
+con un símplex acotado de tableau completo. Si la base inicial de holguras
+es factible se aplica el símplex primal; si solo es dual factible (por
+ejemplo, minimizar costos positivos con restricciones '>='), el dual; en
+otro caso, una fase 1 con variables artificiales seguida del primal.
+
+Sin archivos temporales ni subprocesos, un modelo de la interfaz (hasta
+100 × 100) se resuelve en fracciones de milisegundo. Los estados usan los
+códigos de pulp.LpStatus.
+"""
+
+import numpy as np
+from pulp import LpStatusOptimal, LpStatusNotSolved, LpStatusInfeasible, LpStatusUnbounded
+
+
+PRIMAL_TOL = 1e-9
+DUAL_TOL = 1e-9
+PIVOT_TOL = 1e-11
+
+# Pivotes degenerados seguidos antes de pasar a la regla de Bland (evita ciclos)
+BLAND_AFTER = 50
+
+
+def solve_dense(c, A, senses, b, lower=None, upper=None, maximize=False,
+                max_iterations=None, basis=None):
+    """
+    Resuelve un problema de PL continuo con el símplex acotado.
+    
+    Args:
+        c (array-like): Coeficientes de la función objetivo (n)
+        A (array-like): Matriz de restricciones densa (m × n)
+        senses (list): Tipo de cada restricción: '<=', '>=', '=' (m)
+        b (array-like): Lados derechos (m)
+        lower (array-like, optional): Cotas inferiores (por defecto 0; -inf = sin cota)
+        upper (array-like, optional): Cotas superiores (por defecto +inf)
+        maximize (bool): Maximizar en lugar de minimizar
+        max_iterations (int, optional): Límite de pivotes (por defecto 50·(m + n))
+        basis (dict, optional): Base devuelta por una resolución anterior de un
+            problema con las mismas dimensiones (arranque en caliente). Si ya no
+            es primal ni dual factible se ignora.
+    
+    Returns:
+        dict: status (código de pulp.LpStatus), x (ndarray o None),
+              objective_value (float o None), duals (ndarray con la variación
+              del objetivo por unidad de b, o None), iterations (int),
+              method ('primal', 'dual' o 'phase1'), warm_start (bool) y
+              basis (dict reutilizable o None)
+    """
+    c = np.asarray(c, dtype=float).ravel()
+    b = np.asarray(b, dtype=float).ravel()
+    num_rows, num_cols = len(b), len(c)
+    A = np.asarray(A, dtype=float).reshape(num_rows, num_cols)
+    senses = np.asarray(senses, dtype=object)
+    lower = np.zeros(num_cols) if lower is None else np.asarray(lower, dtype=float)
+    upper = np.full(num_cols, np.inf) if upper is None else np.asarray(upper, dtype=float)
+    if max_iterations is None:
+        max_iterations = 50 * (num_rows + num_cols) + 100
+    
+    result = {
+        'status': None, 'x': None, 'objective_value': None, 'duals': None, 'iterations': 0,
+        'method': 'primal', 'warm_start': False, 'basis': None
+    }
+    if np.any(lower > upper):
+        result['status'] = LpStatusInfeasible
+        return result
+    
+    cost = -c if maximize else c
+    A_std, cost_std, b_std, bound, recover = _standardize(cost, A, b, lower, upper)
+    tableau = _Tableau(A_std, cost_std, b_std, bound, senses, basis)
+    status = tableau.run(max_iterations)
+    
+    result['status'] = status
+    result['iterations'] = tableau.iterations
+    result['method'] = tableau.method
+    result['warm_start'] = tableau.warm_start
+    if status == LpStatusOptimal:
+        x = recover(tableau.values()[:A_std.shape[1]])
+        result['x'] = x
+        result['objective_value'] = float(c @ x)
+        duals = tableau.duals()
+        result['duals'] = -duals if maximize else duals
+        result['basis'] = tableau.final_basis()
+    return result
+
+
+def _standardize(cost, A, b, lower, upper):
+    """
+    Cambia variables para que todas queden en 0 <= x' <= U.
+    
+    Con cota inferior finita x = l + x'; sin cota inferior pero con superior
+    x = u − x'; las variables libres se separan en x = x⁺ − x⁻.
+    
+    Returns:
+        tuple: (A, cost, b, U) transformados y una función que recupera x
+    """
+    finite_lower = np.isfinite(lower)
+    only_upper = ~finite_lower & np.isfinite(upper)
+    free = ~finite_lower & ~np.isfinite(upper)
+    
+    sign = np.where(only_upper, -1.0, 1.0)
+    offset = np.where(finite_lower, lower, np.where(only_upper, upper, 0.0))
+    with np.errstate(invalid='ignore'):
+        bound = np.where(finite_lower, upper - lower, np.inf)
+    A_std = A * sign
+    cost_std = cost * sign
+    b_std = b - A @ offset
+    free_columns = np.flatnonzero(free)
+    if len(free_columns):
+        A_std = np.hstack([A_std, -A[:, free_columns]])
+        cost_std = np.concatenate([cost_std, -cost[free_columns]])
+        bound = np.concatenate([bound, np.full(len(free_columns), np.inf)])
+    
+    num_cols = len(cost)
+    
+    def recover(z):
+        x = offset + sign * z[:num_cols]
+        x[free_columns] -= z[num_cols:]
+        return x
+    
+    return A_std, cost_std, b_std, bound, recover
+
+
+class _Tableau:
+    """
+    Tableau completo B⁻¹[A | holguras | artificiales] con variables acotadas.
+    
+    Cada fila i de A tiene una holgura s_i con columna σ_i·e_i (σ = −1 para
+    '>=') y cota [0, ∞), o [0, 0] si la fila es '='. Las no básicas están en
+    su cota inferior (0) o superior (at_upper).
+    """
+    
+    def __init__(self, A, cost, b, bound, senses, basis=None):
+        num_rows, num_cols = A.shape
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.iterations = 0
+        self.warm_start = False
+        
+        sigma = np.where(senses == '>=', -1.0, 1.0)
+        self.sigma = sigma
+        slack_bound = np.where(senses == '=', 0.0, np.inf)
+        if basis is None or not self._init_from_basis(A, cost, b, bound, sigma, slack_bound, basis):
+            self._init_cold(A, cost, b, bound, sigma, slack_bound)
+    
+    def _init_cold(self, A, cost, b, bound, sigma, slack_bound):
+        """Arranca desde la base de holguras (con artificiales si hace falta)."""
+        num_rows, num_cols = A.shape
+        
+        # Costos negativos con cota finita empiezan en la cota superior (dual factible)
+        at_upper_cols = (cost < 0) & np.isfinite(bound)
+        residual = b - A[:, at_upper_cols] @ bound[at_upper_cols]
+        slack_value = sigma * residual
+        infeasible = (slack_value < -PRIMAL_TOL) | (slack_value > slack_bound + PRIMAL_TOL)
+        dual_feasible = not np.any((cost < -DUAL_TOL) & ~np.isfinite(bound))
+        
+        if not infeasible.any():
+            self.method = 'primal'
+        elif dual_feasible:
+            self.method = 'dual'
+        else:
+            self.method = 'phase1'
+        needs_phase1 = self.method == 'phase1'
+        artificial_rows = np.flatnonzero(infeasible) if needs_phase1 else np.array([], int)
+        num_art = len(artificial_rows)
+        total = num_cols + num_rows + num_art
+        
+        # Escala de cada fila: σ_i si la holgura es básica, ρ_i = signo del residuo si
+        # la fila arranca con una artificial (así la artificial vale |residuo| >= 0)
+        scale = sigma.copy()
+        scale[artificial_rows] = np.where(residual[artificial_rows] < 0, -1.0, 1.0)
+        
+        T = np.zeros((num_rows, total))
+        T[:, :num_cols] = A * scale[:, None]
+        rows = np.arange(num_rows)
+        T[rows, num_cols + rows] = scale * sigma
+        art_columns = num_cols + num_rows + np.arange(num_art)
+        T[artificial_rows, art_columns] = 1.0
+        
+        self.T = T
+        self.beta = scale * residual
+        self.upper = np.concatenate([bound, slack_bound, np.full(num_art, np.inf)])
+        self.at_upper = np.zeros(total, dtype=bool)
+        self.at_upper[:num_cols] = at_upper_cols
+        self.basis = num_cols + rows
+        self.basis[artificial_rows] = art_columns
+        self.nonbasic = np.ones(total, dtype=bool)
+        self.nonbasic[self.basis] = False
+        
+        self.cost = np.zeros(total)
+        self.cost[:num_cols] = cost
+        self.art_columns = art_columns
+    
+    def _init_from_basis(self, A, cost, b, bound, sigma, slack_bound, basis):
+        """
+        Arranca desde la base de una resolución anterior (arranque en caliente).
+        
+        Tras cambiar costos la base sigue siendo primal factible y basta el
+        primal; tras cambiar lados derechos sigue siendo dual factible y basta
+        el dual. Devuelve False si no es ninguna de las dos o es singular.
+        """
+        num_rows, num_cols = A.shape
+        total = num_cols + num_rows
+        basic = np.asarray(basis['basic'], dtype=int)
+        at_upper = np.array(basis['at_upper'], dtype=bool)
+        if (not num_rows or basic.shape != (num_rows,) or at_upper.shape != (total,)
+                or basic.max() >= total or len(np.unique(basic)) != num_rows):
+            return False
+        
+        M = np.hstack([A, np.diag(sigma)])
+        upper = np.concatenate([bound, slack_bound])
+        at_upper &= np.isfinite(upper)
+        at_upper[basic] = False
+        nonbasic_values = np.where(at_upper, upper, 0.0)
+        try:
+            solved = np.linalg.solve(M[:, basic], np.column_stack([M, b - M @ nonbasic_values]))
+        except np.linalg.LinAlgError:
+            return False
+        if not np.isfinite(solved).all():
+            return False
+        T = solved[:, :total]
+        T[:, basic] = np.eye(num_rows)
+        beta = solved[:, total]
+        
+        full_cost = np.concatenate([cost, np.zeros(num_rows)])
+        d = full_cost - full_cost[basic] @ T
+        nonbasic = np.ones(total, dtype=bool)
+        nonbasic[basic] = False
+        movable = nonbasic & (upper > 0)
+        if np.all(beta >= -PRIMAL_TOL) and np.all(beta <= upper[basic] + PRIMAL_TOL):
+            self.method = 'primal'
+        elif not np.any(movable & np.where(at_upper, d > DUAL_TOL, d < -DUAL_TOL)):
+            self.method = 'dual'
+        else:
+            return False
+        
+        self.T = T
+        self.beta = beta
+        self.upper = upper
+        self.at_upper = at_upper
+        self.basis = basic.copy()
+        self.nonbasic = nonbasic
+        self.cost = full_cost
+        self.art_columns = np.array([], dtype=int)
+        self.warm_start = True
+        return True
+    
+    def run(self, max_iterations):
+        """Resuelve con el método elegido según la factibilidad de la base inicial."""
+        self.max_iterations = max_iterations
+        if self.method == 'primal':
+            return self._primal(self.cost)
+        if self.method == 'dual':
+            return self._dual(self.cost)
+        
+        phase1_cost = np.zeros_like(self.cost)
+        phase1_cost[self.art_columns] = 1.0
+        status = self._primal(phase1_cost)
+        if status != LpStatusOptimal:
+            return status
+        if phase1_cost[self.basis] @ self.beta > PRIMAL_TOL * (1 + self.num_rows):
+            return LpStatusInfeasible
+        # Las artificiales quedan fijas en 0: no vuelven a entrar a la base
+        self.upper[self.art_columns] = 0.0
+        self.at_upper[self.art_columns] = False
+        return self._primal(self.cost)
+    
+    def final_basis(self):
+        """Base actual para un arranque en caliente (None si quedó una artificial básica)."""
+        total = self.num_cols + self.num_rows
+        if np.any(self.basis >= total):
+            return None
+        return {'basic': self.basis.copy(), 'at_upper': self.at_upper[:total].copy()}
+    
+    def duals(self):
+        """
+        Precios duales y = c_B·B⁻¹ del problema de minimización.
+        
+        Las columnas de holgura del tableau son B⁻¹·σ_i·e_i (con el escalado de
+        filas incluido), así que B⁻¹ se lee de ellas sin refactorizar.
+        """
+        slack_columns = self.T[:, self.num_cols:self.num_cols + self.num_rows]
+        return self.cost[self.basis] @ (slack_columns / self.sigma) + 0.0
+    
+    def values(self):
+        """Valores de todas las columnas en la base actual."""
+        z = np.where(self.at_upper, self.upper, 0.0)
+        z[self.basis] = self.beta
+        z = np.clip(z, 0.0, self.upper)
+        # Sumar 0.0 normaliza -0.0 a 0.0
+        z[np.abs(z) < PRIMAL_TOL] = 0.0
+        z += 0.0
+        return z
+    
+    def _pivot(self, r, j, entering_value, leaving_to_upper):
+        """Intercambia la básica de la fila r por la columna j."""
+        T = self.T
+        pivot_row = T[r] / T[r, j]
+        T -= np.outer(T[:, j], pivot_row)
+        T[r] = pivot_row
+        leaving = self.basis[r]
+        self.basis[r] = j
+        self.nonbasic[leaving] = True
+        self.nonbasic[j] = False
+        self.at_upper[leaving] = leaving_to_upper
+        self.at_upper[j] = False
+        self.beta[r] = entering_value
+        self.iterations += 1
+    
+    def _primal(self, cost):
+        """Símplex primal acotado desde una base factible."""
+        T = self.T
+        d = cost - cost[self.basis] @ T
+        degenerate = 0
+        while True:
+            if self.iterations >= self.max_iterations:
+                return LpStatusNotSolved
+            
+            # Mejora posible: d < 0 en la cota inferior o d > 0 en la superior
+            score = np.where(self.at_upper, d, -d)
+            score[~self.nonbasic | (self.upper <= 0)] = 0.0
+            if degenerate < BLAND_AFTER:
+                j = int(np.argmax(score))
+                if score[j] <= DUAL_TOL:
+                    return LpStatusOptimal
+            else:
+                candidates = np.flatnonzero(score > DUAL_TOL)
+                if not len(candidates):
+                    return LpStatusOptimal
+                j = int(candidates[0])
+            
+            direction = -1.0 if self.at_upper[j] else 1.0
+            alpha = direction * T[:, j]
+            basic_upper = self.upper[self.basis]
+            ratios = np.full(self.num_rows, np.inf)
+            decreasing = alpha > PIVOT_TOL
+            increasing = alpha < -PIVOT_TOL
+            ratios[decreasing] = self.beta[decreasing] / alpha[decreasing]
+            ratios[increasing] = (basic_upper[increasing] - self.beta[increasing]) / -alpha[increasing]
+            np.maximum(ratios, 0.0, out=ratios)
+            r = int(np.argmin(ratios)) if self.num_rows else 0
+            step = ratios[r] if self.num_rows else np.inf
+            
+            if step >= self.upper[j]:
+                # La entrante llega antes a su otra cota: solo cambia de cota
+                step = self.upper[j]
+                if not np.isfinite(step):
+                    return LpStatusUnbounded
+                self.beta -= step * alpha
+                self.at_upper[j] = not self.at_upper[j]
+                self.iterations += 1
+                degenerate = 0
+                continue
+            
+            start = self.upper[j] if self.at_upper[j] else 0.0
+            self.beta -= step * alpha
+            self._pivot(r, j, start + direction * step, alpha[r] < 0)
+            d -= d[j] * T[r]
+            degenerate = degenerate + 1 if step <= PRIMAL_TOL else 0
+    
+    def _dual(self, cost):
+        """Símplex dual acotado desde una base dual factible."""
+        T = self.T
+        d = cost - cost[self.basis] @ T
+        while True:
+            if self.iterations >= self.max_iterations:
+                return LpStatusNotSolved
+            
+            basic_upper = self.upper[self.basis]
+            below = -self.beta
+            above = self.beta - basic_upper
+            violation = np.maximum(below, above)
+            r = int(np.argmax(violation))
+            if violation[r] <= PRIMAL_TOL:
+                return LpStatusOptimal
+            
+            row = T[r]
+            going_up = below[r] >= above[r]
+            if going_up:
+                allowed = np.where(self.at_upper, row > PIVOT_TOL, row < -PIVOT_TOL)
+                target = 0.0
+            else:
+                allowed = np.where(self.at_upper, row < -PIVOT_TOL, row > PIVOT_TOL)
+                target = basic_upper[r]
+            allowed &= self.nonbasic & (self.upper > 0)
+            candidates = np.flatnonzero(allowed)
+            if not len(candidates):
+                return LpStatusInfeasible
+            
+            # Razón mínima |d_j / α_rj|; en empates, el pivote más grande
+            pivots = np.abs(row[candidates])
+            ratios = np.abs(d[candidates]) / pivots
+            best = ratios <= ratios.min() + DUAL_TOL
+            j = int(candidates[best][np.argmax(pivots[best])])
+            
+            delta = (self.beta[r] - target) / row[j]
+            start = self.upper[j] if self.at_upper[j] else 0.0
+            self.beta -= delta * T[:, j]
+            self._pivot(r, j, start + delta, not going_up)
+            d -= d[j] * T[r]
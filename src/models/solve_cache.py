@@ -0,0 +1,238 @@
+"""
+Caché de resultados de resolución direccionada por contenido.
+Una LRU en memoria funciona delante de un almacén persistente en disco; la
+clave es el hash canónico del problema (LPModel.problem_hash) junto con el
+backend, su versión y el modo de presolve (LPModel._cache_key).
+
+Variables de entorno:
+    LP_SOLVER_CACHE=off        Desactiva la caché
+    LP_SOLVER_CACHE_DIR=<dir>  Directorio del almacén en disco (vacío = sin disco)
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_DISK_BYTES = 64 * 1024 * 1024
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "lp_solver")
+
+
+class SolveCache:
+    """
+    Caché de dos niveles para resultados de LPModel.solve().
+    
+    Los resultados deben ser serializables a JSON. El nivel en memoria se
+    limita por número de entradas y el de disco por tamaño total en bytes;
+    en ambos se desaloja primero lo usado hace más tiempo.
+    """
+    
+    def __init__(self, max_entries=DEFAULT_MEMORY_ENTRIES, directory=None,
+                 max_disk_bytes=DEFAULT_DISK_BYTES):
+        """
+        Inicializa la caché.
+        
+        Args:
+            max_entries (int): Número máximo de resultados en memoria
+            directory (str, optional): Directorio del almacén en disco (None = solo memoria)
+            max_disk_bytes (int): Tamaño máximo del almacén en disco
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+    
+    def get(self, key):
+        """
+        Busca un resultado por clave, primero en memoria y luego en disco.
+        
+        Args:
+            key (str): Hash canónico del problema
+        
+        Returns:
+            dict o None: Resultado guardado, o None si no existe
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return entry
+        
+        entry = self._disk_get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._memory_put(key, entry)
+        return entry
+    
+    def put(self, key, entry):
+        """
+        Guarda un resultado en memoria y en disco.
+        
+        Args:
+            key (str): Hash canónico del problema
+            entry (dict): Resultado serializable a JSON
+        """
+        with self._lock:
+            self._memory_put(key, entry)
+        self._disk_put(key, entry)
+    
+    def clear(self):
+        """Vacía ambos niveles y reinicia los contadores."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.memory_hits = self.disk_hits = self.misses = 0
+        for path, _, _ in self._disk_entries():
+            self._remove(path)
+        self._disk_bytes = 0
+    
+    def stats(self):
+        """
+        Devuelve los contadores de la caché.
+        
+        Returns:
+            dict: hits, memory_hits, disk_hits, misses, entradas en memoria y bytes en disco
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'memory_entries': len(self._memory),
+                'disk_bytes': self._disk_bytes
+            }
+    
+    def _memory_put(self, key, entry):
+        """Inserta en la LRU en memoria (debe llamarse con el lock tomado)."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+    
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def _disk_get(self, key):
+        """Lee una entrada del disco y marca su uso actualizando la fecha."""
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+            return entry
+        except (OSError, ValueError):
+            return None
+    
+    def _disk_put(self, key, entry):
+        """Escribe una entrada de forma atómica y desaloja si se supera el tamaño."""
+        if not self.directory:
+            return
+        path = self._path(key)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+            self._disk_bytes += os.path.getsize(path) - previous
+        except OSError:
+            return
+        if self._disk_bytes > self.max_disk_bytes:
+            self._evict_disk()
+    
+    def _disk_entries(self):
+        """Lista (ruta, tamaño, fecha de uso) de las entradas en disco."""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, st.st_size, st.st_mtime))
+        return entries
+    
+    def _evict_disk(self):
+        """Borra las entradas menos usadas hasta quedar bajo el 90% del límite."""
+        entries = sorted(self._disk_entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_disk_bytes * 0.9
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            if self._remove(path):
+                total -= size
+        self._disk_bytes = total
+    
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache():
+    """
+    Devuelve la caché compartida del proceso, creándola según el entorno.
+    
+    Returns:
+        SolveCache o None: None si la caché está desactivada
+    """
+    global _default_cache
+    if os.environ.get("LP_SOLVER_CACHE", "").lower() in ("0", "off", "false", "no"):
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            directory = os.environ.get("LP_SOLVER_CACHE_DIR", DEFAULT_CACHE_DIR)
+            try:
+                _default_cache = SolveCache(directory=directory or None)
+            except OSError:
+                # Sin permisos de escritura: solo memoria
+                _default_cache = SolveCache()
+        return _default_cache
+
+
+def set_default_cache(cache):
+    """
+    Reemplaza la caché compartida del proceso (None la desactiva hasta la próxima llamada
+    a get_default_cache, que la vuelve a crear).
+    
+    Args:
+        cache (SolveCache o None): Nueva caché
+    """
+    global _default_cache
+    with _default_lock:
+        _default_cache = cache
@@ -0,0 +1,672 @@
+"""
+Registro de solvers intercambiables para LPModel.
+
+Cada backend recibe el modelo ya construido y devuelve un resultado crudo
+normalizado a los códigos de PuLP, que LPModel.solve() convierte al
+diccionario que consume la interfaz:
+    
+    {
+        'status_code': int,         # clave de pulp.LpStatus
+        'sol_status': int,          # clave de pulp.LpSolution
+        'objective_value': float,   # None si no hay solución
+        'values': list,             # valores por posición de columna (o None)
+        'duals': list,              # precio dual por fila en PL óptimos (o None)
+        'iterations': int,          # iteraciones del símplex (None si no se conocen)
+        'nodes': int,               # nodos de ramificación en MIP (o None)
+        'warm_start': bool,         # True si se aprovechó el punto de partida
+        'basis': object             # base final reutilizable por el mismo backend (o None)
+    }
+
+El punto de partida (warm_start) es un diccionario con 'values' (solución
+anterior por columna, con None en variables nuevas) y 'basis' (base anterior
+de este mismo backend para un problema de iguales dimensiones, o None).
+
+Los duales siguen el sentido del modelo: la variación del objetivo por unidad
+de aumento del lado derecho de cada fila.
+
+Backends incluidos:
+    cbc     CBC de PuLP como subproceso (siempre disponible)
+    highs   HiGHS en el mismo proceso mediante highspy (opcional)
+    scipy   scipy.optimize.linprog / milp (opcional)
+    simplex Símplex denso de NumPy en el mismo proceso (solo modelos continuos)
+"""
+
+import threading
+
+import numpy as np
+from pulp import (
+    value, LpStatusOptimal, LpStatusNotSolved, LpStatusInfeasible,
+    LpStatusUnbounded, LpStatusUndefined, LpSolutionNoSolutionFound,
+    LpSolutionOptimal, LpSolutionIntegerFeasible, LpSolutionInfeasible,
+    LpSolutionUnbounded, __version__ as pulp_version
+)
+
+from .cbc_solver import CancellableCBC, SolveCancelled
+from .simplex import solve_dense
+from ..utils.timing import PhaseTimer
+
+try:
+    import highspy
+except ImportError:  # highspy es opcional
+    highspy = None
+
+try:
+    from scipy.optimize import linprog, milp, LinearConstraint, Bounds
+    from scipy.sparse import csr_matrix
+    from scipy import __version__ as scipy_version
+except ImportError:  # SciPy es opcional
+    linprog = None
+
+
+AUTO = 'auto'
+
+# Un MIP con más coeficientes que esto puede tardar: se evita SciPy, que no
+# puede interrumpirse, y se prefiere un solver cancelable
+AUTO_LARGE_MIP_NONZEROS = 5000
+
+# Tamaño máximo (filas y columnas) de un modelo continuo para el símplex denso
+AUTO_SIMPLEX_MAX_SIZE = 100
+
+
+class SolverBackend:
+    """
+    Interfaz común de los backends. Las subclases implementan solve() y,
+    si pueden detenerse a mitad de camino, _interrupt().
+    """
+    
+    name = None
+    supports_integer = True
+    
+    def __init__(self):
+        """Inicializa el estado de cancelación y los tiempos por fase."""
+        self._cancelled = False
+        self._lock = threading.Lock()
+        # Fases 'write' (pasar el modelo al solver), 'solve' y 'parse' (leer la solución)
+        self.timer = PhaseTimer()
+    
+    @classmethod
+    def available(cls):
+        """bool: True si las dependencias del backend están instaladas."""
+        return True
+    
+    @classmethod
+    def version(cls):
+        """
+        str: Versión del solver externo (None si es código propio), parte
+        de la clave de la caché de resultados.
+        """
+        return None
+    
+    @property
+    def cancelled(self):
+        """bool: True si se solicitó la cancelación."""
+        return self._cancelled
+    
+    def cancel(self):
+        """
+        Solicita detener la resolución en curso.
+        Es seguro llamarlo desde cualquier hilo, antes o durante la resolución.
+        """
+        with self._lock:
+            self._cancelled = True
+        self._interrupt()
+    
+    def _interrupt(self):
+        """Detiene el solver en ejecución (por defecto no es posible)."""
+    
+    def solve(self, model, time_limit=None, warm_start=None):
+        """
+        Resuelve el modelo.
+        
+        Args:
+            model (LPModel): Modelo construido
+            time_limit (float, optional): Tiempo máximo en segundos
+            warm_start (dict, optional): Punto de partida de la resolución anterior
+        
+        Returns:
+            dict: Resultado crudo normalizado (ver docstring del módulo)
+        
+        Raises:
+            SolveCancelled: Si se llamó a cancel() antes de terminar
+        """
+        raise NotImplementedError
+
+
+class CbcBackend(SolverBackend):
+    """
+    CBC como subproceso, el solver por defecto de PuLP.
+    
+    Sin arranque MIP por defecto: con -mips CBC puede devolver la solución
+    inicial (o una peor que el óptimo) como óptima, sin iteraciones ni nodos.
+    """
+    
+    name = 'cbc'
+    mip_start = False
+    
+    @classmethod
+    def version(cls):
+        # CBC viene incluido en PuLP
+        return f"pulp {pulp_version}"
+    
+    def __init__(self):
+        super().__init__()
+        self._solver = None
+    
+    def _interrupt(self):
+        solver = self._solver
+        if solver is not None:
+            solver.cancel()
+    
+    def solve(self, model, time_limit=None, warm_start=None):
+        arrays = model.to_arrays()
+        if len(arrays['b']) == 0:
+            # CBC falla con un modelo sin filas (el presolve puede dejarlo así)
+            if self._cancelled:
+                raise SolveCancelled()
+            self.timer.restart()
+            result = _solve_without_rows(arrays)
+            self.timer.lap('solve')
+            return result
+        
+        # Arranque MIP: PuLP escribe los valores actuales de las variables (los
+        # de la resolución anterior) y CBC los recibe con -mips
+        warm = (
+            self.mip_start and warm_start is not None and any(model._integer)
+            and any(v is not None for v in warm_start['values'])
+        )
+        solver = CancellableCBC(msg=False, timeLimit=time_limit, warmStart=warm)
+        solver.timer = self.timer
+        self.timer.restart()
+        with self._lock:
+            if self._cancelled:
+                raise SolveCancelled()
+            self._solver = solver
+        try:
+            model.problem.solve(solver)
+        finally:
+            self._solver = None
+        
+        problem = model.problem
+        codes = (problem.status, problem.sol_status)
+        if problem.status == LpStatusOptimal and _has_unbounded_column(arrays):
+            # CBC da por óptima una variable libre que no aparece en ninguna fila
+            codes = (LpStatusUnbounded, LpSolutionUnbounded)
+        result = _raw_result(codes, model._objective, None)
+        if codes[0] == LpStatusOptimal:
+            result['objective_value'] = value(problem.objective)
+            result['values'] = [var.varValue for var in model._var_list]
+            if not any(model._integer):
+                result['duals'] = [constraint.pi for constraint in model._constraints]
+        result['iterations'] = solver.iterations
+        result['nodes'] = solver.nodes
+        result['warm_start'] = warm
+        self.timer.lap('parse')
+        return result
+
+
+class HighsBackend(SolverBackend):
+    """HiGHS en el mismo proceso: sin archivos temporales ni subprocesos."""
+    
+    name = 'highs'
+    
+    def __init__(self):
+        super().__init__()
+        self._highs = None
+    
+    @classmethod
+    def available(cls):
+        return highspy is not None
+    
+    @classmethod
+    def version(cls):
+        return f"highs {highspy.Highs().version()}"
+    
+    def _interrupt(self):
+        highs = self._highs
+        if highs is not None:
+            highs.cancelSolve()
+    
+    def solve(self, model, time_limit=None, warm_start=None):
+        self.timer.restart()
+        arrays = model.to_arrays()
+        c = arrays['c']
+        num_cols, num_rows = len(c), len(arrays['b'])
+        row_lower, row_upper = _row_bounds(arrays['senses'], arrays['b'])
+        
+        lp = highspy.HighsLp()
+        lp.num_col_ = num_cols
+        lp.num_row_ = num_rows
+        lp.col_cost_ = c
+        lp.col_lower_ = arrays['lower']
+        lp.col_upper_ = arrays['upper']
+        lp.row_lower_ = row_lower
+        lp.row_upper_ = row_upper
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.num_col_ = num_cols
+        lp.a_matrix_.num_row_ = num_rows
+        lp.a_matrix_.start_ = arrays['indptr']
+        lp.a_matrix_.index_ = arrays['indices']
+        lp.a_matrix_.value_ = arrays['data']
+        if arrays['sense'] == 'Maximizar':
+            lp.sense_ = highspy.ObjSense.kMaximize
+        is_mip = bool(arrays['integer'].any())
+        if is_mip:
+            lp.integrality_ = [
+                highspy.HighsVarType.kInteger if is_int else highspy.HighsVarType.kContinuous
+                for is_int in arrays['integer']
+            ]
+        
+        highs = highspy.Highs()
+        highs.setOptionValue('output_flag', False)
+        if time_limit is not None:
+            highs.setOptionValue('time_limit', float(time_limit))
+        highs.HandleUserInterrupt = True
+        highs.passModel(lp)
+        
+        # MIP: la solución anterior como incumbente inicial; LP: la base anterior
+        warm = False
+        if warm_start is not None:
+            values = warm_start['values']
+            if is_mip and None not in values:
+                solution = highspy.HighsSolution()
+                solution.col_value = values
+                solution.value_valid = True
+                warm = highs.setSolution(solution) == highspy.HighsStatus.kOk
+            elif not is_mip and warm_start['basis'] is not None:
+                warm = highs.setBasis(warm_start['basis']) == highspy.HighsStatus.kOk
+        
+        with self._lock:
+            if self._cancelled:
+                raise SolveCancelled()
+            self._highs = highs
+        self.timer.lap('write')
+        try:
+            highs.run()
+            status = highs.getModelStatus()
+            if status == highspy.HighsModelStatus.kUnboundedOrInfeasible:
+                # El presolve no distingue ambos casos; se repite sin él
+                highs.setOptionValue('presolve', 'off')
+                highs.run()
+                status = highs.getModelStatus()
+        finally:
+            self._highs = None
+        
+        if self._cancelled:
+            raise SolveCancelled()
+        self.timer.lap('solve')
+        
+        info = highs.getInfo()
+        has_solution = info.primal_solution_status == highspy.kSolutionStatusFeasible
+        if status in (highspy.HighsModelStatus.kOptimal, highspy.HighsModelStatus.kModelEmpty):
+            codes = (LpStatusOptimal, LpSolutionOptimal)
+        elif status == highspy.HighsModelStatus.kInfeasible:
+            codes = (LpStatusInfeasible, LpSolutionInfeasible)
+        elif status == highspy.HighsModelStatus.kUnbounded:
+            codes = (LpStatusUnbounded, LpSolutionUnbounded)
+        elif has_solution and is_mip:
+            # Límite alcanzado con una solución entera: mismo criterio que CBC
+            codes = (LpStatusOptimal, LpSolutionIntegerFeasible)
+        elif status in (highspy.HighsModelStatus.kTimeLimit,
+                        highspy.HighsModelStatus.kIterationLimit):
+            codes = (LpStatusNotSolved, LpSolutionNoSolutionFound)
+        else:
+            codes = (LpStatusUndefined, LpSolutionNoSolutionFound)
+        
+        values = None
+        if codes[0] == LpStatusOptimal:
+            values = np.asarray(highs.getSolution().col_value, dtype=float)
+        result = _raw_result(codes, c, values)
+        result['iterations'] = info.simplex_iteration_count
+        result['nodes'] = info.mip_node_count if is_mip else None
+        result['warm_start'] = warm
+        if codes == (LpStatusOptimal, LpSolutionOptimal) and not is_mip:
+            result['basis'] = highs.getBasis()
+            result['duals'] = list(highs.getSolution().row_dual)
+        self.timer.lap('parse')
+        return result
+
+
+class ScipyBackend(SolverBackend):
+    """
+    scipy.optimize: linprog para modelos continuos y milp si hay enteras.
+    No admite puntos de partida.
+    """
+    
+    name = 'scipy'
+    
+    @classmethod
+    def available(cls):
+        return linprog is not None
+    
+    @classmethod
+    def version(cls):
+        return f"scipy {scipy_version}"
+    
+    def solve(self, model, time_limit=None, warm_start=None):
+        if self._cancelled:
+            raise SolveCancelled()
+        
+        self.timer.restart()
+        arrays = model.to_arrays()
+        c = arrays['c']
+        integer = arrays['integer']
+        lower, upper = arrays['lower'], arrays['upper']
+        num_cols, num_rows = len(c), len(arrays['b'])
+        A = csr_matrix(
+            (arrays['data'], arrays['indices'], arrays['indptr']), shape=(num_rows, num_cols)
+        )
+        # SciPy siempre minimiza
+        sign = -1.0 if arrays['sense'] == 'Maximizar' else 1.0
+        options = {'disp': False}
+        if time_limit is not None:
+            options['time_limit'] = float(time_limit)
+        self.timer.lap('write')
+        
+        if integer.any():
+            row_lower, row_upper = _row_bounds(arrays['senses'], arrays['b'])
+            constraints = [LinearConstraint(A, row_lower, row_upper)] if num_rows else []
+            res = milp(
+                sign * c, constraints=constraints, integrality=integer.astype(int),
+                bounds=Bounds(lower, upper), options=options
+            )
+            if res.status == 4:
+                # HiGHS no distinguió inviable de no acotado: se decide con la relajación
+                relaxed = _linprog(sign * c, A, arrays['senses'], arrays['b'], lower, upper, options)
+                if relaxed.status in (2, 3):
+                    res = relaxed
+        else:
+            res = _linprog(sign * c, A, arrays['senses'], arrays['b'], lower, upper, options)
+        
+        if self._cancelled:
+            raise SolveCancelled()
+        self.timer.lap('solve')
+        
+        if res.status == 0:
+            codes = (LpStatusOptimal, LpSolutionOptimal)
+        elif res.status == 2:
+            codes = (LpStatusInfeasible, LpSolutionInfeasible)
+        elif res.status == 3:
+            codes = (LpStatusUnbounded, LpSolutionUnbounded)
+        elif res.status == 1 and integer.any() and res.x is not None:
+            codes = (LpStatusOptimal, LpSolutionIntegerFeasible)
+        elif res.status == 1:
+            codes = (LpStatusNotSolved, LpSolutionNoSolutionFound)
+        else:
+            codes = (LpStatusUndefined, LpSolutionNoSolutionFound)
+        
+        values = res.x if codes[0] == LpStatusOptimal else None
+        result = _raw_result(codes, c, values)
+        result['iterations'] = getattr(res, 'nit', None)
+        result['nodes'] = getattr(res, 'mip_node_count', None)
+        if codes == (LpStatusOptimal, LpSolutionOptimal) and not integer.any():
+            result['duals'] = _linprog_duals(res, arrays['senses'], sign)
+        self.timer.lap('parse')
+        return result
+
+
+class SimplexBackend(SolverBackend):
+    """
+    Símplex denso de simplex.py. Para modelos continuos pequeños evita todo
+    costo fijo de un solver externo; ignora time_limit (el tamaño lo acota).
+    """
+    
+    name = 'simplex'
+    supports_integer = False
+    
+    def solve(self, model, time_limit=None, warm_start=None):
+        if self._cancelled:
+            raise SolveCancelled()
+        
+        self.timer.restart()
+        arrays = model.to_arrays()
+        c = arrays['c']
+        indptr = arrays['indptr']
+        A = np.zeros((len(arrays['b']), len(c)))
+        A[np.repeat(np.arange(len(indptr) - 1), np.diff(indptr)), arrays['indices']] = arrays['data']
+        self.timer.lap('write')
+        res = solve_dense(
+            c, A, arrays['senses'], arrays['b'], arrays['lower'], arrays['upper'],
+            maximize=arrays['sense'] == 'Maximizar', basis=warm_start['basis'] if warm_start is not None else None
+        )
+        
+        if self._cancelled:
+            raise SolveCancelled()
+        self.timer.lap('solve')
+        
+        solution_codes = {
+            LpStatusOptimal: LpSolutionOptimal,
+            LpStatusInfeasible: LpSolutionInfeasible,
+            LpStatusUnbounded: LpSolutionUnbounded
+        }
+        codes = (res['status'], solution_codes.get(res['status'], LpSolutionNoSolutionFound))
+        result = _raw_result(codes, c, res['x'])
+        if res['duals'] is not None:
+            result['duals'] = res['duals'].tolist()
+        result['iterations'] = res['iterations']
+        result['warm_start'] = res['warm_start']
+        result['basis'] = res['basis']
+        self.timer.lap('parse')
+        return result
+
+
+def _linprog(c, A, senses, b, lower, upper, options):
+    """
+    Llama a scipy.optimize.linprog separando las filas de desigualdad e igualdad.
+    
+    Args:
+        c (ndarray): Costos (siempre se minimiza)
+        A (csr_matrix): Matriz de restricciones
+        senses (list): Tipo de cada restricción: '<=', '>=', '='
+        b (ndarray): Lados derechos
+        lower (ndarray): Cotas inferiores de las variables (-inf si no tienen)
+        upper (ndarray): Cotas superiores de las variables (inf si no tienen)
+        options (dict): Opciones de linprog
+    
+    Returns:
+        OptimizeResult: Resultado de linprog
+    """
+    senses = np.asarray(senses, dtype=object)
+    ineq = senses != '='
+    eq = ~ineq
+    # Las filas '>=' se expresan como '<=' cambiando el signo
+    flip = np.where(senses[ineq] == '>=', -1.0, 1.0)
+    A_ub = A[ineq].multiply(flip[:, None]).tocsr() if ineq.any() else None
+    return linprog(
+        c,
+        A_ub=A_ub,
+        b_ub=b[ineq] * flip if ineq.any() else None,
+        A_eq=A[eq] if eq.any() else None,
+        b_eq=b[eq] if eq.any() else None,
+        bounds=np.column_stack([lower, upper]), method='highs', options=options
+    )
+
+
+def _linprog_duals(res, senses, sign):
+    """
+    Convierte los multiplicadores de linprog a duales por fila en el sentido del modelo.
+    
+    Args:
+        res (OptimizeResult): Resultado óptimo de _linprog
+        senses (list): Tipo de cada restricción: '<=', '>=', '='
+        sign (float): -1 si el modelo maximiza (linprog minimizó -c)
+    
+    Returns:
+        list: Dual de cada fila
+    """
+    senses = np.asarray(senses, dtype=object)
+    ineq = senses != '='
+    duals = np.zeros(len(senses))
+    if ineq.any():
+        flip = np.where(senses[ineq] == '>=', -1.0, 1.0)
+        duals[ineq] = res.ineqlin.marginals * flip
+    if (~ineq).any():
+        duals[~ineq] = res.eqlin.marginals
+    return (sign * duals + 0.0).tolist()
+
+
+def _row_bounds(senses, b):
+    """
+    Convierte tipos de restricción y lados derechos a límites inferior/superior por fila.
+    
+    Args:
+        senses (list): Tipo de cada restricción: '<=', '>=', '='
+        b (ndarray): Lados derechos
+    
+    Returns:
+        tuple: (lower, upper) como arreglos de NumPy
+    """
+    senses = np.asarray(senses, dtype=object)
+    lower = np.where(senses == '<=', -np.inf, b)
+    upper = np.where(senses == '>=', np.inf, b)
+    return lower.astype(float), upper.astype(float)
+
+
+def _has_unbounded_column(arrays):
+    """
+    True si alguna variable no aparece en ninguna fila y mejora el objetivo
+    sin límite; si el resto del modelo es factible, el modelo no está acotado.
+    """
+    used = np.zeros(len(arrays['c']), dtype=bool)
+    used[arrays['indices']] = True
+    gain = arrays['c'] if arrays['sense'] == 'Maximizar' else -arrays['c']
+    unbounded = ((gain > 0) & np.isinf(arrays['upper'])) | ((gain < 0) & np.isinf(arrays['lower']))
+    return bool((unbounded & ~used).any())
+
+
+def _solve_without_rows(arrays):
+    """
+    Resuelve un modelo sin restricciones: cada variable toma la cota que
+    conviene al objetivo (la más cercana a 0 si no influye).
+    
+    Args:
+        arrays (dict): Modelo en el formato de LPModel.to_arrays(), sin filas
+    
+    Returns:
+        dict: Resultado crudo normalizado
+    """
+    c, integer = arrays['c'], arrays['integer']
+    if _has_unbounded_column(arrays):
+        return _raw_result((LpStatusUnbounded, LpSolutionUnbounded), c, None)
+    lower = np.where(integer, np.ceil(arrays['lower']), arrays['lower'])
+    upper = np.where(integer, np.floor(arrays['upper']), arrays['upper'])
+    if (lower > upper).any():
+        # Entera sin ningún valor entero entre sus cotas
+        return _raw_result((LpStatusInfeasible, LpSolutionInfeasible), c, None)
+    gain = c if arrays['sense'] == 'Maximizar' else -c
+    values = np.where(gain > 0, upper, np.where(gain < 0, lower, np.clip(0.0, lower, upper)))
+    result = _raw_result((LpStatusOptimal, LpSolutionOptimal), c, values)
+    if not integer.any():
+        result['duals'] = []
+    result['iterations'] = 0
+    result['nodes'] = 0 if integer.any() else None
+    return result
+
+
+def _raw_result(codes, c, values):
+    """Arma el resultado crudo calculando el objetivo como c·x."""
+    result = {
+        'status_code': codes[0],
+        'sol_status': codes[1],
+        'objective_value': None,
+        'values': None,
+        'duals': None,
+        'iterations': None,
+        'nodes': None,
+        'warm_start': False,
+        'basis': None
+    }
+    if values is not None:
+        values = np.asarray(values, dtype=float)
+        result['objective_value'] = float(c @ values) if len(c) else 0.0
+        result['values'] = values.tolist()
+    return result
+
+
+BACKENDS = {}
+
+
+def register_backend(backend_class):
+    """
+    Registra un backend bajo su atributo 'name' (reemplaza uno existente).
+    
+    Args:
+        backend_class (type): Subclase de SolverBackend
+    
+    Returns:
+        type: La misma clase, para poder usarse como decorador
+    """
+    BACKENDS[backend_class.name] = backend_class
+    return backend_class
+
+
+for _backend_class in (CbcBackend, HighsBackend, ScipyBackend, SimplexBackend):
+    register_backend(_backend_class)
+
+
+def available_backends():
+    """
+    Devuelve los nombres de los backends que pueden usarse en este entorno.
+    
+    Returns:
+        list: Nombres en orden de registro
+    """
+    return [name for name, cls in BACKENDS.items() if cls.available()]
+
+
+def auto_backend_name(model):
+    """
+    Elige un backend según el tamaño y la integralidad del modelo.
+    
+    Los solvers en proceso evitan el costo fijo de archivos temporales y del
+    subproceso de CBC, que domina en modelos pequeños; los continuos de hasta
+    AUTO_SIMPLEX_MAX_SIZE filas y columnas van al símplex denso. En MIP
+    grandes se descarta SciPy porque no puede cancelarse.
+    
+    Args:
+        model (LPModel): Modelo construido
+    
+    Returns:
+        str: Nombre del backend elegido
+    """
+    is_mip = any(model._integer)
+    nonzeros = sum(len(row[0]) for row in model._rows)
+    if (not is_mip and len(model._rows) <= AUTO_SIMPLEX_MAX_SIZE
+            and model.num_variables <= AUTO_SIMPLEX_MAX_SIZE):
+        return 'simplex'
+    if is_mip and nonzeros > AUTO_LARGE_MIP_NONZEROS:
+        preference = ('highs', 'cbc')
+    else:
+        preference = ('highs', 'scipy', 'cbc')
+    for name in preference:
+        if name in BACKENDS and BACKENDS[name].available():
+            return name
+    return 'cbc'
+
+
+def create_backend(name=AUTO, model=None):
+    """
+    Crea una instancia del backend pedido.
+    
+    Args:
+        name (str): Nombre registrado o 'auto'
+        model (LPModel, optional): Modelo a resolver (necesario con 'auto')
+    
+    Returns:
+        SolverBackend: Instancia nueva (cada resolución usa la suya)
+    
+    Raises:
+        ValueError: Si el backend no existe, no está disponible o no admite
+            variables enteras y el modelo las tiene
+    """
+    if name == AUTO:
+        name = auto_backend_name(model)
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Backend desconocido: '{name}'. Opciones: {', '.join([AUTO] + list(BACKENDS))}"
+        )
+    backend_class = BACKENDS[name]
+    if not backend_class.available():
+        raise ValueError(f"El backend '{name}' no está disponible (falta su dependencia).")
+    if model is not None and not backend_class.supports_integer and any(model._integer):
+        raise ValueError(f"El backend '{name}' solo resuelve modelos continuos.")
+    return backend_class()
@@ -3,10 +3,53 @@ Ventana principal de la aplicación con interfaz Tkinter.
 Diseño tipo tabla Excel según especificación del usuario.
 """
 
+import itertools
+import queue
+import threading
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+
+import numpy as np
+
 from ..models.lp_model import LPModel
-from ..utils.validators import validate_float
+from ..models.problem_data import ProblemData
+from ..models.solver_backends import AUTO, available_backends
+from ..utils.validators import validate_bound, validate_float_array
+from ..utils.project_files import (
+    PROJECT_EXTENSION, load_project, save_project
+)
+from ..utils.timing import PhaseTimer, format_timings, log_timings
+from .spreadsheet_grid import (
+    SpreadsheetGrid, HEADER_ROWS, OBJECTIVE_ROW, FIRST_CONSTRAINT_ROW, CONSTRAINT_TYPES
+)
+from .sweep_dialog import SweepDialog
+
+
+# Límites de la vista del modelo: restricciones (y variables) listadas y
+# términos no nulos por línea; el resto se resume
+MAX_PREVIEW_LINES = 200
+MAX_PREVIEW_TERMS = 40
+
+# Espera sin ediciones antes de actualizar la vista del modelo (ms)
+PREVIEW_DELAY_MS = 300
+
+# Resolución automática: espera sin ediciones (ms) y tamaño máximo del modelo
+# (variables × restricciones) para el que se activa
+AUTO_SOLVE_DELAY_MS = 500
+AUTO_SOLVE_MAX_CELLS = 10000
+
+# Mensajes de celdas inválidas que se muestran al resolver (el resto se resume)
+MAX_REPORTED_ERRORS = 10
+
+# Etiquetas de las filas fijas y filas fijas que se pueden editar
+HEADER_LABELS = {
+    'names': "Nombres:",
+    'var_type': "Tipo variable:",
+    'lower': "Cota inferior:",
+    'upper': "Cota superior:"
+}
+EDITABLE_HEADER_ROWS = [HEADER_ROWS.index(header) for header in HEADER_LABELS]
 
 
 class LPSolverGUI:
@@ -25,25 +68,49 @@ class LPSolverGUI:
         self.sense_var = tk.StringVar(value="Maximizar")
         self.num_vars = tk.IntVar(value=12)
         self.num_constraints = tk.IntVar(value=10)
+        self.backend_var = tk.StringVar(value=AUTO)
+        self.auto_solve_var = tk.BooleanVar(value=False)
         
         # Nombres de variables personalizables
         self.variable_names = []
         self.use_custom_names = tk.BooleanVar(value=False)
         
-        # Variables enteras
-        self.integer_vars = []  # Lista de booleanos para cada variable
+        # Texto escrito en la tabla: {(fila, columna): texto}, solo celdas editadas
+        self.cell_values = {}
         
-        # Referencias a widgets
-        self.objective_entries = []
-        self.constraint_entries = []
-        self.variable_labels = []
-        self.variable_name_entries = []
-        self.integer_checkboxes = []
+        # Datos numéricos del problema (también tipo y cotas de cada variable),
+        # actualizados al confirmar cada celda, y celdas cuyo texto no es un
+        # número: {(fila, columna): mensaje de error}
+        self.problem_data = None
+        self._invalid_cells = {}
         self.current_focus_row = None
         
+        # Estado de la resolución en segundo plano
+        self._active_model = None  # LPModel que se está resolviendo
+        self._solve_job = 0  # Identificador del trabajo vigente (descarta resultados obsoletos)
+        self._solve_start = None
+        self._solve_queue = queue.Queue()
+        
+        # Modelo que se conserva entre resoluciones y celdas editadas desde la última
+        self._lp_model = None
+        self._dirty_cells = set()
+        
+        # Tiempos por fase de la interfaz en la resolución vigente
+        self._gui_timings = {}
+        
+        # Vista del modelo: líneas mostradas y actualización pendiente (root.after)
+        self._preview_lines = []
+        self._preview_job = None
+        
+        # Resolución automática pendiente (root.after)
+        self._auto_solve_job = None
+        
         # Crear interfaz
         self._create_widgets()
         
+        # Cancelar cualquier resolución pendiente al cerrar la ventana
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
     def _create_widgets(self):
         """Crea la interfaz completa con sistema de pestañas."""
         # Crear notebook (pestañas)
@@ -412,14 +479,16 @@ Configuración: 12 variables, 8 restricciones
             config_frame,
             text="Maximizar",
             variable=self.sense_var,
-            value="Maximizar"
+            value="Maximizar",
+            command=self._model_changed
         ).pack(side=tk.LEFT, padx=5)
         
         ttk.Radiobutton(
             config_frame,
             text="Minimizar",
             variable=self.sense_var,
-            value="Minimizar"
+            value="Minimizar",
+            command=self._model_changed
         ).pack(side=tk.LEFT, padx=5)
         
         tk.Label(config_frame, text="  Variables:", font=("Arial", 10), bg="white").pack(side=tk.LEFT, padx=(20, 5))
@@ -456,34 +525,44 @@ Configuración: 12 variables, 8 restricciones
             cursor="hand2"
         ).pack(side=tk.LEFT, padx=10)
         
-        # Frame para la tabla con scroll
-        table_container = tk.Frame(parent, bg="white")
-        table_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Canvas y scrollbars
-        self.canvas = tk.Canvas(table_container, bg="white", highlightthickness=0)
-        v_scrollbar = tk.Scrollbar(table_container, orient="vertical", command=self.canvas.yview)
-        h_scrollbar = tk.Scrollbar(table_container, orient="horizontal", command=self.canvas.xview)
-        
-        self.table_frame = tk.Frame(self.canvas, bg="white")
-        
-        self.canvas.create_window((0, 0), window=self.table_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        tk.Button(
+            config_frame,
+            text="Abrir...",
+            font=("Arial", 9),
+            command=self._open_project,
+            cursor="hand2"
+        ).pack(side=tk.LEFT, padx=2)
         
-        # Pack scrollbars y canvas
-        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        tk.Button(
+            config_frame,
+            text="Guardar...",
+            font=("Arial", 9),
+            command=self._save_project,
+            cursor="hand2"
+        ).pack(side=tk.LEFT, padx=2)
         
-        # Actualizar región de scroll
-        self.table_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        # Tabla virtual: solo dibuja las celdas visibles
+        self.table_grid = SpreadsheetGrid(
+            parent,
+            get_text=self._grid_text,
+            commit=self._grid_commit,
+            navigate=self._grid_navigate,
+            on_focus=self._grid_focus,
+            on_blur=self._unhighlight_row,
+            paste=self._grid_paste
+        )
+        self.table_grid.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.table_grid.set_invalid_cells(self._invalid_cells)
         
         # Construir tabla inicial
         self._build_table()
         
-        # Botón de resolver
-        tk.Button(
-            parent,
+        # Botones de resolver y cancelar
+        solve_frame = tk.Frame(parent, bg="white")
+        solve_frame.pack(pady=10)
+        
+        self.solve_button = tk.Button(
+            solve_frame,
             text="Resolver Problema",
             font=("Arial", 12, "bold"),
             bg="#4CAF50",
@@ -492,7 +571,64 @@ Configuración: 12 variables, 8 restricciones
             pady=10,
             command=self._solve_problem,
             cursor="hand2"
-        ).pack(pady=10)
+        )
+        self.solve_button.pack(side=tk.LEFT, padx=5)
+        
+        self.cancel_button = tk.Button(
+            solve_frame,
+            text="Cancelar",
+            font=("Arial", 12, "bold"),
+            bg="#E53935",
+            fg="white",
+            padx=20,
+            pady=10,
+            command=self._cancel_solve,
+            cursor="hand2",
+            state=tk.DISABLED
+        )
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(
+            solve_frame,
+            text="Barrido...",
+            font=("Arial", 10),
+            bg="#2196F3",
+            fg="white",
+            command=self._open_sweep_dialog,
+            cursor="hand2"
+        ).pack(side=tk.LEFT, padx=5)
+        
+        # Selector de solver
+        tk.Label(solve_frame, text="Solver:", font=("Arial", 10), bg="white").pack(side=tk.LEFT, padx=(15, 5))
+        
+        ttk.Combobox(
+            solve_frame,
+            textvariable=self.backend_var,
+            values=[AUTO] + available_backends(),
+            state="readonly",
+            width=7
+        ).pack(side=tk.LEFT, padx=5)
+        
+        tk.Checkbutton(
+            solve_frame,
+            text="Auto",
+            variable=self.auto_solve_var,
+            command=self._schedule_auto_solve,
+            font=("Arial", 10),
+            bg="white"
+        ).pack(side=tk.LEFT, padx=5)
+        
+        # Indicador de tiempo transcurrido
+        self.solve_status_label = tk.Label(
+            solve_frame,
+            text="",
+            font=("Arial", 10),
+            bg="white",
+            fg="#666",
+            width=22,
+            anchor="w"
+        )
+        self.solve_status_label.pack(side=tk.LEFT, padx=10)
         
     def _create_right_panel(self, parent):
         """Crea el panel derecho con el modelo y resultados."""
@@ -520,7 +656,8 @@ Configuración: 12 variables, 8 restricciones
             height=15,
             font=("Courier New", 9),
             wrap="word",
-            bg="#f5f5f5"
+            bg="#f5f5f5",
+            state=tk.DISABLED
         )
         self.model_text.pack(fill=tk.BOTH, expand=True)
         
@@ -544,449 +681,949 @@ Configuración: 12 variables, 8 restricciones
         )
         self.results_text.pack(fill=tk.BOTH, expand=True)
         
-    def _build_table(self):
-        """Construye la tabla tipo Excel."""
-        # Limpiar tabla existente
-        for widget in self.table_frame.winfo_children():
-            widget.destroy()
-        self.objective_entries.clear()
-        self.constraint_entries.clear()
-        self.variable_labels.clear()
-        self.variable_name_entries.clear()
-        self.integer_checkboxes.clear()
+        # Sección plegable con los tiempos por fase de la última resolución
+        self.timings_button = tk.Button(
+            results_frame,
+            text="▸ Tiempos por fase",
+            font=("Arial", 9),
+            bg="white",
+            relief=tk.FLAT,
+            anchor="w",
+            command=self._toggle_timings,
+            cursor="hand2"
+        )
+        self.timings_button.pack(fill=tk.X)
         
+        self.timings_label = tk.Label(
+            results_frame,
+            text="",
+            font=("Courier New", 9),
+            bg="white",
+            justify=tk.LEFT,
+            anchor="w"
+        )
+        self._timings_visible = False
+        
+    def _build_table(self):
+        """Configura la tabla tipo Excel con las dimensiones actuales."""
         num_vars = self.num_vars.get()
         num_constraints = self.num_constraints.get()
         
         # Inicializar listas
         if len(self.variable_names) != num_vars:
             self.variable_names = [f"X{i+1}" for i in range(num_vars)]
-        if len(self.integer_vars) != num_vars:
-            self.integer_vars = [tk.BooleanVar(value=False) for _ in range(num_vars)]
         
-        # Estilo de celdas
-        header_bg = "#4472C4"
-        header_fg = "white"
-        cell_width = 8
-        
-        # Fila -1: Nombres de variables editables
-        tk.Label(
-            self.table_frame,
-            text="Nombres:",
-            width=15,
-            bg="#E7E6E6",
-            font=("Arial", 8, "bold"),
-            relief=tk.RAISED,
-            borderwidth=1
-        ).grid(row=0, column=0, sticky="nsew", padx=1, pady=1)
-        
-        for i in range(num_vars):
-            name_entry = tk.Entry(
-                self.table_frame,
-                width=cell_width,
-                font=("Arial", 8),
-                justify="center",
-                relief=tk.SOLID,
-                borderwidth=1,
-                bg="#F0F0F0"
-            )
-            name_entry.grid(row=0, column=i+1, sticky="nsew", padx=1, pady=1)
-            name_entry.insert(0, self.variable_names[i])
-            name_entry.bind('<FocusOut>', lambda e, idx=i: self._update_variable_name(idx, e.widget.get()))
-            name_entry.bind('<Return>', lambda e, idx=i: self._update_variable_name(idx, e.widget.get()))
-            self.variable_name_entries.append(name_entry)
-        
-        # Columnas vacías para tipo y valor en fila de nombres
-        tk.Label(self.table_frame, text="", bg="white").grid(row=0, column=num_vars+1, sticky="nsew")
-        tk.Label(self.table_frame, text="", bg="white").grid(row=0, column=num_vars+2, sticky="nsew")
-        
-        # Fila 0: Encabezados con nombres de variables
-        tk.Label(self.table_frame, text="", width=15, bg="white").grid(row=1, column=0, sticky="nsew")
-        
-        for i in range(num_vars):
-            var_label = tk.Label(
-                self.table_frame,
-                text=self.variable_names[i],
-                width=cell_width,
-                bg=header_bg,
-                fg=header_fg,
-                font=("Arial", 9, "bold"),
-                relief=tk.RAISED,
-                borderwidth=1
-            )
-            var_label.grid(row=1, column=i+1, sticky="nsew", padx=1, pady=1)
-            self.variable_labels.append(var_label)
-        
-        # Columnas de restricción
-        tk.Label(
-            self.table_frame,
-            text="Tipo",
-            width=cell_width,
-            bg=header_bg,
-            fg=header_fg,
-            font=("Arial", 9, "bold"),
-            relief=tk.RAISED,
-            borderwidth=1
-        ).grid(row=1, column=num_vars+1, sticky="nsew", padx=1, pady=1)
-        
-        tk.Label(
-            self.table_frame,
-            text="Valor",
-            width=cell_width+2,
-            bg=header_bg,
-            fg=header_fg,
-            font=("Arial", 9, "bold"),
-            relief=tk.RAISED,
-            borderwidth=1
-        ).grid(row=1, column=num_vars+2, sticky="nsew", padx=1, pady=1)
-        
-        # Fila 1.5: Checkboxes para variables enteras
-        tk.Label(
-            self.table_frame,
-            text="Entera:",
-            width=15,
-            bg="#E7E6E6",
-            font=("Arial", 8, "bold"),
-            relief=tk.RAISED,
-            borderwidth=1
-        ).grid(row=2, column=0, sticky="nsew", padx=1, pady=1)
-        
-        for i in range(num_vars):
-            check_frame = tk.Frame(self.table_frame, bg="#F0F0F0")
-            check_frame.grid(row=2, column=i+1, sticky="nsew", padx=1, pady=1)
-            
-            chk = tk.Checkbutton(
-                check_frame,
-                variable=self.integer_vars[i],
-                bg="#F0F0F0",
-                activebackground="#F0F0F0"
-            )
-            chk.pack()
-            self.integer_checkboxes.append(chk)
-        
-        # Columnas vacías para tipo y valor en fila de enteros
-        tk.Label(self.table_frame, text="", bg="white").grid(row=2, column=num_vars+1, sticky="nsew")
-        tk.Label(self.table_frame, text="", bg="white").grid(row=2, column=num_vars+2, sticky="nsew")
-        
-        # Fila 3: Objetivo
-        obj_label = tk.Label(
-            self.table_frame,
-            text="Objetivo",
-            width=15,
-            bg="#70AD47",
-            fg="white",
-            font=("Arial", 9, "bold"),
-            relief=tk.RAISED,
-            borderwidth=1
-        )
-        obj_label.grid(row=3, column=0, sticky="nsew", padx=1, pady=1)
-        
-        for i in range(num_vars):
-            entry = tk.Entry(
-                self.table_frame,
-                width=cell_width,
-                font=("Arial", 10),
-                justify="center",
-                relief=tk.SOLID,
-                borderwidth=1
-            )
-            entry.grid(row=3, column=i+1, sticky="nsew", padx=1, pady=1)
-            entry.insert(0, "0")
-            
-            # Resaltar fila al hacer foco
-            entry.bind('<FocusIn>', lambda e, row=3: self._highlight_row(row))
-            entry.bind('<FocusOut>', lambda e: self._unhighlight_row())
-            
-            # Navegación con teclado
-            entry.bind('<Return>', lambda e, idx=i: self._navigate_objective(e, idx))
-            entry.bind('<Down>', lambda e: self._focus_constraint(0, 0))
-            entry.bind('<Right>', lambda e, idx=i: self._nav_obj_right(e, idx))
-            entry.bind('<Left>', lambda e, idx=i: self._nav_obj_left(e, idx))
-            
-            self.objective_entries.append(entry)
-        
-        # Celdas vacías en objetivo para tipo y valor
-        tk.Label(self.table_frame, text="", bg="white").grid(row=3, column=num_vars+1, sticky="nsew")
-        tk.Label(self.table_frame, text="", bg="white").grid(row=3, column=num_vars+2, sticky="nsew")
-        
-        # Filas 4+: Restricciones
-        for r in range(num_constraints):
-            # Etiqueta de restricción
-            tk.Label(
-                self.table_frame,
-                text=f"Restricción {r+1}",
-                width=15,
-                bg="#FFC000" if r < 5 else "#92D050",
-                fg="black",
-                font=("Arial", 9, "bold"),
-                relief=tk.RAISED,
-                borderwidth=1
-            ).grid(row=r+4, column=0, sticky="nsew", padx=1, pady=1)
-            
-            # Coeficientes
-            coef_entries = []
-            for c in range(num_vars):
-                entry = tk.Entry(
-                    self.table_frame,
-                    width=cell_width,
-                    font=("Arial", 10),
-                    justify="center",
-                    relief=tk.SOLID,
-                    borderwidth=1
-                )
-                entry.grid(row=r+4, column=c+1, sticky="nsew", padx=1, pady=1)
-                entry.insert(0, "0")
-                
-                # Resaltar fila al hacer foco
-                entry.bind('<FocusIn>', lambda e, row=r+4: self._highlight_row(row))
-                entry.bind('<FocusOut>', lambda e: self._unhighlight_row())
-                
-                # Navegación
-                entry.bind('<Return>', lambda e, row=r, col=c: self._nav_const_down(e, row, col))
-                entry.bind('<Down>', lambda e, row=r, col=c: self._nav_const_down(e, row, col))
-                entry.bind('<Up>', lambda e, row=r, col=c: self._nav_const_up(e, row, col))
-                entry.bind('<Right>', lambda e, row=r, col=c: self._nav_const_right(e, row, col))
-                entry.bind('<Left>', lambda e, row=r, col=c: self._nav_const_left(e, row, col))
-                
-                coef_entries.append(entry)
-            
-            # Tipo de restricción (cambiado a <=, >=, =)
-            type_combo = ttk.Combobox(
-                self.table_frame,
-                values=["<=", ">=", "="],
-                state="readonly",
-                width=cell_width-2,
-                font=("Arial", 10),
-                justify="center"
-            )
-            type_combo.grid(row=r+4, column=num_vars+1, sticky="nsew", padx=1, pady=1)
-            type_combo.current(0)
-            type_combo.bind('<Return>', lambda e, row=r: self._nav_to_value(e, row))
-            
-            # Valor RHS
-            value_entry = tk.Entry(
-                self.table_frame,
-                width=cell_width+2,
-                font=("Arial", 10),
-                justify="center",
-                relief=tk.SOLID,
-                borderwidth=1,
-                bg="#FFFF99"
-            )
-            value_entry.grid(row=r+4, column=num_vars+2, sticky="nsew", padx=1, pady=1)
-            value_entry.insert(0, "0")
-            
-            # Resaltar fila al hacer foco
-            value_entry.bind('<FocusIn>', lambda e, row=r+4: self._highlight_row(row))
-            value_entry.bind('<FocusOut>', lambda e: self._unhighlight_row())
-            
-            value_entry.bind('<Return>', lambda e, row=r: self._nav_from_value(e, row))
-            value_entry.bind('<Up>', lambda e, row=r: self._nav_value_up(e, row))
-            value_entry.bind('<Down>', lambda e, row=r: self._nav_value_down(e, row))
-            
-            self.constraint_entries.append({
-                'coefficients': coef_entries,
-                'type': type_combo,
-                'value': value_entry
-            })
+        # El texto se guarda solo para las celdas editadas (el resto vale "0")
+        self.cell_values.clear()
+        self._invalid_cells.clear()
+        previous = self.problem_data
+        self.problem_data = ProblemData.empty(num_vars, num_constraints, self.sense_var.get())
+        self.problem_data.variable_names = list(self.variable_names)
+        if previous is not None and previous.num_vars == num_vars:
+            # Con el mismo número de variables se conservan sus tipos y cotas
+            self.problem_data.integer[:] = previous.integer
+            self.problem_data.lower[:] = previous.lower
+            self.problem_data.upper[:] = previous.upper
+        self._lp_model = None  # La tabla cambió por completo: reconstruir al resolver
+        self._dirty_cells.clear()
+        self.current_focus_row = None
+        self.table_grid.set_size(num_vars, num_constraints)
     
     def _rebuild_table(self):
         """Reconstruye la tabla cuando cambia la configuración."""
         self._build_table()
         self._update_model_display()
     
+    def _cell_text(self, row, col):
+        """Texto de una celda de datos (objetivo, coeficiente, tipo o valor)."""
+        text = self.cell_values.get((row, col))
+        if text is not None:
+            return text
+        value = self._cell_value(row, col)
+        return value if isinstance(value, str) else _format_number(value)
+    
+    def _cell_value(self, row, col):
+        """Valor de una celda de datos tomado de problem_data (número o tipo de restricción)."""
+        data = self.problem_data
+        num_vars = self.table_grid.num_vars
+        if row == OBJECTIVE_ROW:
+            return data.c[col - 1]
+        index = row - FIRST_CONSTRAINT_ROW
+        if col == num_vars + 1:
+            return data.senses[index]
+        if col == num_vars + 2:
+            return data.b[index]
+        return data.coefficient(index, col - 1)
+    
+    def _set_cell(self, row, col, text):
+        """Guarda el texto de una celda de datos y, si es válido, su valor en problem_data."""
+        self._set_block(row, col, [[text]])
+    
+    def _set_block(self, top, left, texts):
+        """
+        Escribe un bloque rectangular de textos en la tabla y en problem_data.
+        
+        Las celdas numéricas se validan todas juntas (validate_float_array):
+        las que no son números quedan en _invalid_cells (marcadas en rojo) y
+        no modifican problem_data hasta que se corrijan. No redibuja la tabla.
+        
+        Args:
+            top (int): Fila de la primera celda del bloque
+            left (int): Columna de la primera celda del bloque
+            texts (list): Filas de textos, todas del mismo largo
+        """
+        texts = np.atleast_2d(np.asarray(texts, dtype=str))
+        num_vars = self.table_grid.num_vars
+        type_col = num_vars + 1
+        bottom, right = top + texts.shape[0], left + texts.shape[1]
+        rows, cols = np.meshgrid(np.arange(top, bottom), np.arange(left, right), indexing='ij')
+        
+        self.cell_values.update(zip(
+            itertools.product(range(top, bottom), range(left, right)), texts.ravel().tolist()
+        ))
+        for cell in [cell for cell in self._invalid_cells
+                     if top <= cell[0] < bottom and left <= cell[1] < right]:
+            del self._invalid_cells[cell]
+        
+        values, errors = validate_float_array(
+            texts, lambda i, j: self._cell_label(top + i, left + j)
+        )
+        valid = cols != type_col
+        for i, j, message in errors:
+            if left + j != type_col:
+                self._invalid_cells[(top + i, left + j)] = message
+                valid[i, j] = False
+        
+        data = self.problem_data
+        is_var = cols <= num_vars
+        objective = valid & is_var & (rows == OBJECTIVE_ROW)
+        data.c[cols[objective] - 1] = values[objective]
+        
+        constraint = valid & (rows >= FIRST_CONSTRAINT_ROW)
+        coefs = constraint & is_var
+        data.set_coefficients(rows[coefs] - FIRST_CONSTRAINT_ROW, cols[coefs] - 1, values[coefs])
+        rhs = constraint & (cols == num_vars + 2)
+        data.b[rows[rhs] - FIRST_CONSTRAINT_ROW] = values[rhs]
+        
+        types = (rows >= FIRST_CONSTRAINT_ROW) & (cols == type_col)
+        for row, constraint_type in zip(rows[types].tolist(), texts[types].tolist()):
+            if constraint_type not in ["<=", ">=", "="]:
+                constraint_type = "<="  # Default fallback
+            data.set_constraint_type(row - FIRST_CONSTRAINT_ROW, constraint_type)
+    
+    def _grid_text(self, row, col):
+        """Proporciona a la tabla virtual el texto de cada celda visible."""
+        num_vars = self.table_grid.num_vars
+        if col == 0:
+            if row < OBJECTIVE_ROW:
+                return HEADER_LABELS.get(HEADER_ROWS[row], "")
+            if row == OBJECTIVE_ROW:
+                return "Objetivo"
+            return f"Restricción {row - FIRST_CONSTRAINT_ROW + 1}"
+        if row < OBJECTIVE_ROW:
+            header = HEADER_ROWS[row]
+            if col > num_vars:
+                return "Tipo" if col == num_vars + 1 else "Valor"
+            if header == 'var_type':
+                return self.problem_data.variable_type(col - 1)
+            if header in ('lower', 'upper'):
+                return self._bound_text(row, col)
+            return self.variable_names[col - 1]
+        return self._cell_text(row, col)
+    
+    def _bound_text(self, row, col):
+        """Texto de una celda de cota: el escrito por el usuario o la cota actual."""
+        text = self.cell_values.get((row, col))
+        if text is not None:
+            return text
+        if HEADER_ROWS[row] == 'lower':
+            bound = self.problem_data.lower[col - 1]
+        else:
+            bound = self.problem_data.upper[col - 1]
+        if np.isinf(bound):
+            return "∞" if bound > 0 else "-∞"
+        return _format_number(bound)
+    
+    def _grid_commit(self, row, col, text):
+        """Guarda el texto confirmado en una celda de la tabla."""
+        if row < OBJECTIVE_ROW:
+            header = HEADER_ROWS[row]
+            if header == 'names':
+                self._update_variable_name(col - 1, text)
+            elif header == 'var_type':
+                self._set_variable_type(col, text)
+            elif text.strip() != self._bound_text(row, col):
+                self._set_bound(row, col, text.strip())
+        elif text.strip() != self._cell_text(row, col):
+            self._set_cell(row, col, text.strip())
+            self._dirty_cells.add((row, col))
+            self._model_changed()
+    
+    def _set_variable_type(self, col, var_type):
+        """
+        Cambia el tipo de una variable (Continua, Entera o Binaria).
+        
+        Las binarias toman las cotas 0 y 1; al cambiar el tipo se descarta
+        el texto escrito en las celdas de cota de la columna.
+        """
+        j = col - 1
+        if var_type == self._grid_text(HEADER_ROWS.index('var_type'), col):
+            return
+        self.problem_data.set_variable_type(j, var_type)
+        for header in ('lower', 'upper'):
+            cell = (HEADER_ROWS.index(header), col)
+            self.cell_values.pop(cell, None)
+            self._invalid_cells.pop(cell, None)
+        self._dirty_cells.add((HEADER_ROWS.index('var_type'), col))
+        self._model_changed()
+    
+    def _set_bound(self, row, col, text):
+        """
+        Guarda el texto de una celda de cota y, si el par de cotas de la
+        variable es válido, lo aplica a problem_data.
+        
+        Las dos celdas de la columna se validan juntas: una cota inferior
+        mayor que la superior marca en rojo la celda editada.
+        """
+        j = col - 1
+        lower_row = HEADER_ROWS.index('lower')
+        upper_row = HEADER_ROWS.index('upper')
+        self.cell_values[(row, col)] = text
+        
+        bounds = {}
+        for cell_row in (lower_row, upper_row):
+            self._invalid_cells.pop((cell_row, col), None)
+            try:
+                bounds[cell_row] = validate_bound(
+                    self._bound_text(cell_row, col), self._cell_label(cell_row, col),
+                    upper=cell_row == upper_row
+                )
+            except ValueError as e:
+                self._invalid_cells[(cell_row, col)] = str(e)
+        
+        if len(bounds) == 2:
+            lower, upper = bounds[lower_row], bounds[upper_row]
+            if lower > upper:
+                self._invalid_cells[(row, col)] = (
+                    f"La cota inferior de {self.variable_names[j]} ({_format_number(lower)}) "
+                    f"es mayor que la superior ({_format_number(upper)})."
+                )
+            else:
+                self.problem_data.set_bounds(j, lower, upper)
+        self._dirty_cells.add((row, col))
+        self._model_changed()
+    
+    def _grid_paste(self, row, col, rows):
+        """
+        Pega un bloque de celdas (por ejemplo, copiado de una hoja de cálculo)
+        a partir de la celda indicada, ampliando la tabla si no cabe.
+        
+        Si las dos últimas columnas del bloque son tipos de restricción y
+        valores, van a las columnas Tipo y Valor; el resto son coeficientes.
+        Los datos se escriben en bloque y la tabla se redibuja una sola vez.
+        
+        Args:
+            row (int): Fila de la celda activa
+            col (int): Columna de la celda activa
+            rows (list): Filas de textos, todas del mismo largo
+        """
+        if row < OBJECTIVE_ROW or not rows:
+            return
+        num_vars = self.table_grid.num_vars
+        constraint_rows = rows[1:] if row == OBJECTIVE_ROW else rows
+        width = len(rows[0])
+        
+        has_types = (
+            col <= num_vars and width >= 3 and constraint_rows
+            and all(line[-2] in CONSTRAINT_TYPES for line in constraint_rows)
+        )
+        if col <= num_vars:
+            num_vars = max(num_vars, col - 1 + width - (2 if has_types else 0))
+        num_constraints = max(self.table_grid.num_constraints, row - FIRST_CONSTRAINT_ROW + len(rows))
+        if (num_vars, num_constraints) != (self.table_grid.num_vars, self.table_grid.num_constraints):
+            self._grow_table(num_vars, num_constraints)
+        
+        if row == OBJECTIVE_ROW:
+            objective = rows[0][:max(0, num_vars + 1 - col)]
+            if objective:
+                self._set_block(OBJECTIVE_ROW, col, [objective])
+        if constraint_rows:
+            first = FIRST_CONSTRAINT_ROW if row == OBJECTIVE_ROW else row
+            if has_types:
+                self._set_block(first, col, [line[:-2] for line in constraint_rows])
+                self._set_block(first, num_vars + 1, [line[-2:] for line in constraint_rows])
+            else:
+                self._set_block(first, col, [line[:num_vars + 3 - col] for line in constraint_rows])
+        
+        # Cambió un bloque entero: se reconstruye desde problem_data al resolver
+        self._lp_model = None
+        self._dirty_cells.clear()
+        self._update_model_display()
+        self._schedule_auto_solve()
+    
+    def _grow_table(self, num_vars, num_constraints):
+        """
+        Amplía la tabla conservando sus datos (a diferencia de _build_table).
+        
+        Args:
+            num_vars (int): Nuevo número de variables (no menor que el actual)
+            num_constraints (int): Nuevo número de restricciones (no menor que el actual)
+        """
+        old_vars = self.table_grid.num_vars
+        shift = num_vars - old_vars
+        
+        # Las columnas Tipo y Valor se desplazan a la derecha de las variables nuevas
+        def moved(cell):
+            return (cell[0], cell[1] + shift) if cell[1] > old_vars else cell
+        for cells in (self.cell_values, self._invalid_cells):
+            items = [(moved(cell), value) for cell, value in cells.items()]
+            cells.clear()
+            cells.update(items)
+        
+        self.variable_names += [f"X{j+1}" for j in range(old_vars, num_vars)]
+        self.problem_data.resize(num_vars, num_constraints)
+        self.num_vars.set(num_vars)
+        self.num_constraints.set(num_constraints)
+        self._lp_model = None
+        self._dirty_cells.clear()
+        self.current_focus_row = None
+        self.table_grid.set_size(num_vars, num_constraints)
+    
+    def _grid_focus(self, row, col):
+        """Resalta la fila de datos que recibe el foco."""
+        if row >= OBJECTIVE_ROW:
+            self._highlight_row(row)
+        else:
+            self._unhighlight_row()
+    
+    def _grid_navigate(self, event, row, col):
+        """Despacha las teclas del editor a los métodos de navegación."""
+        key = event.keysym
+        num_vars = self.table_grid.num_vars
+        
+        if row < OBJECTIVE_ROW:
+            # Filas de nombres, tipos y cotas: moverse en la fila o entre filas
+            index = EDITABLE_HEADER_ROWS.index(row)
+            if key in ('Right', 'Tab') and col < num_vars:
+                self.table_grid.focus_cell(row, col + 1)
+            elif key == 'Left' and col > 1:
+                self.table_grid.focus_cell(row, col - 1)
+            elif key == 'Up' and index > 0:
+                self.table_grid.focus_cell(EDITABLE_HEADER_ROWS[index - 1], col)
+            elif key in ('Down', 'Return'):
+                if index < len(EDITABLE_HEADER_ROWS) - 1:
+                    self.table_grid.focus_cell(EDITABLE_HEADER_ROWS[index + 1], col)
+                elif key == 'Down':
+                    self.table_grid.focus_cell(OBJECTIVE_ROW, col)
+            return 'break'
+        
+        if row == OBJECTIVE_ROW:
+            idx = col - 1
+            if key == 'Return':
+                return self._navigate_objective(event, idx)
+            if key in ('Right', 'Tab'):
+                return self._nav_obj_right(event, idx)
+            if key == 'Left':
+                return self._nav_obj_left(event, idx)
+            if key == 'Down':
+                return self._focus_constraint(0, idx)
+            if key == 'Up':
+                self.table_grid.focus_cell(EDITABLE_HEADER_ROWS[-1], col)
+            return 'break'
+        
+        r = row - FIRST_CONSTRAINT_ROW
+        if col <= num_vars:
+            c = col - 1
+            handlers = {
+                'Return': self._nav_const_down,
+                'Down': self._nav_const_down,
+                'Up': self._nav_const_up,
+                'Right': self._nav_const_right,
+                'Tab': self._nav_const_right,
+                'Left': self._nav_const_left
+            }
+            return handlers[key](event, r, c) if key in handlers else 'break'
+        
+        if col == num_vars + 1:
+            # Columna Tipo
+            if key in ('Return', 'Tab', 'Right'):
+                return self._nav_to_value(event, r)
+            return 'break'
+        
+        # Columna Valor
+        if key in ('Return', 'Tab'):
+            return self._nav_from_value(event, r)
+        if key == 'Up':
+            return self._nav_value_up(event, r)
+        if key == 'Down':
+            return self._nav_value_down(event, r)
+        if key == 'Left':
+            self.table_grid.focus_cell(row, num_vars + 1)
+        return 'break'
+    
     # Métodos de navegación
     def _navigate_objective(self, event, idx):
-        num_vars = len(self.objective_entries)
+        num_vars = self.table_grid.num_vars
         if idx < num_vars - 1:
-            self.objective_entries[idx + 1].focus()
-            self.objective_entries[idx + 1].select_range(0, tk.END)
+            self.table_grid.focus_cell(OBJECTIVE_ROW, idx + 2)
         return 'break'
     
     def _nav_obj_right(self, event, idx):
-        num_vars = len(self.objective_entries)
+        num_vars = self.table_grid.num_vars
         if idx < num_vars - 1:
-            self.objective_entries[idx + 1].focus()
-            self.objective_entries[idx + 1].select_range(0, tk.END)
+            self.table_grid.focus_cell(OBJECTIVE_ROW, idx + 2)
         return 'break'
     
     def _nav_obj_left(self, event, idx):
         if idx > 0:
-            self.objective_entries[idx - 1].focus()
-            self.objective_entries[idx - 1].select_range(0, tk.END)
+            self.table_grid.focus_cell(OBJECTIVE_ROW, idx)
         return 'break'
     
     def _focus_constraint(self, row, col):
-        if self.constraint_entries and self.constraint_entries[row]['coefficients']:
-            self.constraint_entries[row]['coefficients'][col].focus()
-            self.constraint_entries[row]['coefficients'][col].select_range(0, tk.END)
+        if self.table_grid.num_constraints > row:
+            self.table_grid.focus_cell(FIRST_CONSTRAINT_ROW + row, col + 1)
         return 'break'
     
     def _nav_const_down(self, event, row, col):
-        if row < len(self.constraint_entries) - 1:
-            self.constraint_entries[row + 1]['coefficients'][col].focus()
-            self.constraint_entries[row + 1]['coefficients'][col].select_range(0, tk.END)
+        if row < self.table_grid.num_constraints - 1:
+            self.table_grid.focus_cell(FIRST_CONSTRAINT_ROW + row + 1, col + 1)
         return 'break'
     
     def _nav_const_up(self, event, row, col):
         if row > 0:
-            self.constraint_entries[row - 1]['coefficients'][col].focus()
-            self.constraint_entries[row - 1]['coefficients'][col].select_range(0, tk.END)
+            self.table_grid.focus_cell(FIRST_CONSTRAINT_ROW + row - 1, col + 1)
         else:
-            if col < len(self.objective_entries):
-                self.objective_entries[col].focus()
-                self.objective_entries[col].select_range(0, tk.END)
+            self.table_grid.focus_cell(OBJECTIVE_ROW, col + 1)
         return 'break'
     
     def _nav_const_right(self, event, row, col):
-        num_vars = len(self.constraint_entries[0]['coefficients'])
-        if col < num_vars - 1:
-            self.constraint_entries[row]['coefficients'][col + 1].focus()
-            self.constraint_entries[row]['coefficients'][col + 1].select_range(0, tk.END)
-        else:
-            self.constraint_entries[row]['type'].focus()
+        # Al final de los coeficientes se pasa a la columna Tipo
+        self.table_grid.focus_cell(FIRST_CONSTRAINT_ROW + row, col + 2)
         return 'break'
     
     def _nav_const_left(self, event, row, col):
         if col > 0:
-            self.constraint_entries[row]['coefficients'][col - 1].focus()
-            self.constraint_entries[row]['coefficients'][col - 1].select_range(0, tk.END)
+            self.table_grid.focus_cell(FIRST_CONSTRAINT_ROW + row, col)
         return 'break'
     
     def _nav_to_value(self, event, row):
-        self.constraint_entries[row]['value'].focus()
-        self.constraint_entries[row]['value'].select_range(0, tk.END)
+        self.table_grid.focus_cell(FIRST_CONSTRAINT_ROW + row, self.table_grid.num_vars + 2)
         return 'break'
     
     def _nav_from_value(self, event, row):
-        if row < len(self.constraint_entries) - 1:
-            self.constraint_entries[row + 1]['coefficients'][0].focus()
-            self.constraint_entries[row + 1]['coefficients'][0].select_range(0, tk.END)
+        if row < self.table_grid.num_constraints - 1:
+            self.table_grid.focus_cell(FIRST_CONSTRAINT_ROW + row + 1, 1)
         return 'break'
     
     def _nav_value_up(self, event, row):
         if row > 0:
-            self.constraint_entries[row - 1]['value'].focus()
-            self.constraint_entries[row - 1]['value'].select_range(0, tk.END)
+            self.table_grid.focus_cell(FIRST_CONSTRAINT_ROW + row - 1, self.table_grid.num_vars + 2)
         return 'break'
     
     def _nav_value_down(self, event, row):
-        if row < len(self.constraint_entries) - 1:
-            self.constraint_entries[row + 1]['value'].focus()
-            self.constraint_entries[row + 1]['value'].select_range(0, tk.END)
+        if row < self.table_grid.num_constraints - 1:
+            self.table_grid.focus_cell(FIRST_CONSTRAINT_ROW + row + 1, self.table_grid.num_vars + 2)
         return 'break'
     
+    def _model_changed(self):
+        """Programa la actualización de la vista y, si está activa, la resolución automática."""
+        self._schedule_model_display()
+        self._schedule_auto_solve()
+    
+    def _schedule_auto_solve(self):
+        """Resuelve automáticamente cuando pasan AUTO_SOLVE_DELAY_MS sin ediciones."""
+        if self._auto_solve_job is not None:
+            self.root.after_cancel(self._auto_solve_job)
+            self._auto_solve_job = None
+        if self.auto_solve_var.get():
+            self._auto_solve_job = self.root.after(AUTO_SOLVE_DELAY_MS, self._auto_solve)
+    
+    def _auto_solve(self):
+        """
+        Resuelve la versión actual del modelo. Una resolución en curso ya es
+        obsoleta: se cancela y su resultado se descarta.
+        """
+        self._auto_solve_job = None
+        if not self.auto_solve_var.get():
+            return
+        if self.table_grid.num_vars * self.table_grid.num_constraints > AUTO_SOLVE_MAX_CELLS:
+            self.solve_status_label.config(text="Auto: modelo demasiado grande")
+            return
+        
+        if self._active_model is not None:
+            self._active_model.cancel()
+            # El hilo puede seguir usando el modelo un instante: se reconstruye
+            self._lp_model = None
+            self._solve_job += 1
+            self._reset_solve_controls()
+        self._solve_problem(interactive=False)
+    
+    def _schedule_model_display(self):
+        """Actualiza la vista del modelo cuando pasan PREVIEW_DELAY_MS sin ediciones."""
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+        self._preview_job = self.root.after(PREVIEW_DELAY_MS, self._update_model_display)
+    
     def _update_model_display(self):
-        """Actualiza la visualización del modelo."""
-        self.model_text.delete(1.0, tk.END)
-        
-        sense = self.sense_var.get()
-        self.model_text.insert(tk.END, f"{sense}:\n", "bold")
-        self.model_text.insert(tk.END, "Z = ")
-        
-        # Mostrar función objetivo con nombres personalizados
-        num_vars = len(self.objective_entries)
-        for i in range(num_vars):
-            coef = self.objective_entries[i].get()
-            if i > 0:
-                self.model_text.insert(tk.END, " + ")
-            var_name = self.variable_names[i] if i < len(self.variable_names) else f"X{i+1}"
-            self.model_text.insert(tk.END, f"{coef}·{var_name}")
-        
-        self.model_text.insert(tk.END, "\n\nSujeto a:\n")
-        
-        # Mostrar restricciones
-        for i, constraint in enumerate(self.constraint_entries):
-            self.model_text.insert(tk.END, f"R{i+1}: ")
-            for j, entry in enumerate(constraint['coefficients']):
-                coef = entry.get()
-                if j > 0:
-                    self.model_text.insert(tk.END, " + ")
-                var_name = self.variable_names[j] if j < len(self.variable_names) else f"X{j+1}"
-                self.model_text.insert(tk.END, f"{coef}·{var_name}")
-            
-            tipo = constraint['type'].get()
-            valor = constraint['value'].get()
-            tipo_map = {"<": "≤", "<=": "≤", ">": "≥", ">=": "≥", "=": "="}
-            self.model_text.insert(tk.END, f" {tipo_map.get(tipo, tipo)} {valor}\n")
-        
-        # Mostrar restricciones de no negatividad y enteras
-        self.model_text.insert(tk.END, "\nRestricciones adicionales:\n")
-        for i, var_name in enumerate(self.variable_names):
-            if i < len(self.integer_vars) and self.integer_vars[i].get():
-                self.model_text.insert(tk.END, f"  {var_name} ≥ 0 y entera\n")
+        """
+        Actualiza la visualización del modelo.
+        
+        El texto se arma desde problem_data y solo se reemplazan en el widget
+        las líneas que cambiaron desde la última vez.
+        """
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+            self._preview_job = None
+        
+        lines = self._model_preview_lines()
+        text = self.model_text
+        text.config(state=tk.NORMAL)
+        if len(lines) != len(self._preview_lines):
+            text.delete(1.0, tk.END)
+            text.insert(tk.END, "\n".join(lines) + "\n")
+        else:
+            for number, (line, previous) in enumerate(zip(lines, self._preview_lines), start=1):
+                if line != previous:
+                    text.delete(f"{number}.0", f"{number}.end")
+                    text.insert(f"{number}.0", line)
+        text.tag_add("bold", "1.0", "1.end")
+        text.config(state=tk.DISABLED)
+        self._preview_lines = lines
+    
+    def _model_preview_lines(self):
+        """
+        Líneas de la vista del modelo, sin términos nulos.
+        
+        Se listan como mucho MAX_PREVIEW_LINES restricciones y variables y
+        MAX_PREVIEW_TERMS términos por línea, así que el costo no depende del
+        tamaño del modelo.
+        
+        Returns:
+            list: Líneas de texto (la primera es el sentido de optimización)
+        """
+        data = self.problem_data
+        num_vars = data.num_vars
+        num_constraints = data.num_constraints
+        
+        objective = np.flatnonzero(data.c)
+        lines = [
+            f"{self.sense_var.get()}:",
+            "Z = " + self._preview_terms(objective, data.c[objective]),
+            "",
+            "Sujeto a:"
+        ]
+        tipo_map = {"<=": "≤", ">=": "≥", "=": "="}
+        for i in range(min(num_constraints, MAX_PREVIEW_LINES)):
+            cols, values = data.row(i)
+            lines.append(
+                f"{data.constraint_names[i]}: {self._preview_terms(cols, values)} "
+                f"{tipo_map[data.senses[i]]} {_format_number(data.b[i])}"
+            )
+        if num_constraints > MAX_PREVIEW_LINES:
+            lines.append(f"… y {num_constraints - MAX_PREVIEW_LINES} restricciones más")
+        
+        # Mostrar las cotas y el tipo de cada variable
+        lines += ["", "Restricciones adicionales:"]
+        for j, var_name in enumerate(self.variable_names[:MAX_PREVIEW_LINES]):
+            lines.append("  " + _bound_description(
+                var_name, data.lower[j], data.upper[j], bool(data.integer[j])
+            ))
+        if num_vars > MAX_PREVIEW_LINES:
+            lines.append(f"  … y {num_vars - MAX_PREVIEW_LINES} variables más")
+        return lines
+    
+    def _preview_terms(self, cols, values):
+        """
+        Texto 'coef·nombre + ...' de los términos de una fila del modelo.
+        
+        Args:
+            cols (numpy.ndarray): Posiciones de las variables con coeficiente no nulo
+            values (numpy.ndarray): Coeficientes correspondientes
+        
+        Returns:
+            str: Los primeros MAX_PREVIEW_TERMS términos ("0" si no hay ninguno)
+        """
+        if len(cols) == 0:
+            return "0"
+        terms = []
+        for k, (j, value) in enumerate(zip(cols[:MAX_PREVIEW_TERMS].tolist(),
+                                           values[:MAX_PREVIEW_TERMS].tolist())):
+            if k == 0:
+                sign = "-" if value < 0 else ""
             else:
-                self.model_text.insert(tk.END, f"  {var_name} ≥ 0\n")
+                sign = " - " if value < 0 else " + "
+            terms.append(f"{sign}{_format_number(abs(value))}·{self.variable_names[j]}")
+        if len(cols) > MAX_PREVIEW_TERMS:
+            terms.append(f" + … ({len(cols) - MAX_PREVIEW_TERMS} términos más)")
+        return "".join(terms)
     
-    def _solve_problem(self):
-        """Resuelve el problema de PL."""
+    def _solve_problem(self, interactive=True):
+        """
+        Valida los datos, construye el modelo y lo resuelve en segundo plano.
+        
+        Args:
+            interactive (bool): Resolución pedida por el usuario: confirma la celda
+                                en edición y muestra los errores de validación en
+                                un cuadro de diálogo. La resolución automática usa
+                                False: resuelve lo ya confirmado y muestra el error
+                                en el indicador de estado
+        """
+        if self._active_model is not None:
+            # Ya hay una resolución en curso
+            return
+        
+        # Confirmar la celda que se está editando
+        if interactive:
+            self.table_grid.commit_edit()
+        
+        timer = PhaseTimer()
         try:
             # Actualizar visualización del modelo
-            self._update_model_display()
-            
-            # Validar y obtener función objetivo
-            objective_coefficients = []
-            for i, entry in enumerate(self.objective_entries):
-                var_name = self.variable_names[i] if i < len(self.variable_names) else f"X{i+1}"
-                coef = validate_float(entry.get(), f"Coeficiente {var_name} de función objetivo")
-                objective_coefficients.append(coef)
-            
-            # Validar y obtener restricciones
-            constraints_data = []
-            for i, constraint in enumerate(self.constraint_entries):
-                coefficients = []
-                for j, entry in enumerate(constraint['coefficients']):
-                    var_name = self.variable_names[j] if j < len(self.variable_names) else f"X{j+1}"
-                    coef = validate_float(entry.get(), f"Coeficiente {var_name} de R{i+1}")
-                    coefficients.append(coef)
-                
-                rhs = validate_float(constraint['value'].get(), f"Valor de R{i+1}")
-                constraint_type = constraint['type'].get()
-                
-                # Los símbolos ya están correctos (<=, >=, =)
-                if constraint_type not in ["<=", ">=", "="]:
-                    constraint_type = "<="  # Default fallback
-                
-                constraints_data.append({
-                    'coefficients': coefficients,
-                    'type': constraint_type,
-                    'rhs': rhs,
-                    'name': f"R{i+1}"
-                })
-            
-            # Crear y resolver el problema
-            lp_model = LPModel()
+            with timer.phase('preview'):
+                self._update_model_display()
             
-            # Obtener flags de variables enteras
-            integer_flags = [var.get() for var in self.integer_vars[:len(objective_coefficients)]]
-            
-            lp_model.create_problem(
-                self.sense_var.get(), 
-                objective_coefficients,
-                variable_names=self.variable_names[:len(objective_coefficients)],
-                integer_vars=integer_flags
-            )
-            
-            # Añadir restricciones
-            for constraint in constraints_data:
-                lp_model.add_constraint(
-                    constraint['coefficients'],
-                    constraint['type'],
-                    constraint['rhs'],
-                    constraint['name']
-                )
-            
-            # Resolver
-            result = lp_model.solve()
+            # Reutilizar el modelo anterior aplicando solo las celdas editadas
+            if self._lp_model is None:
+                lp_model = self._build_model(timer)
+            else:
+                lp_model = self._patch_model(timer)
+            self._lp_model = lp_model
+            self._dirty_cells.clear()
             
-            # Mostrar resultado
-            self._display_result(result['message'])
+            # Resolver fuera del hilo de Tk
+            self._gui_timings = timer.as_dict()
+            self._start_solve(lp_model)
             
         except ValueError as e:
-            messagebox.showerror("Error de Validación", str(e))
+            if interactive:
+                messagebox.showerror("Error de Validación", str(e))
+            else:
+                self.solve_status_label.config(text="⚠ Hay celdas no válidas")
         except Exception as e:
+            # El modelo pudo quedar a medio actualizar: se reconstruye la próxima vez
+            self._lp_model = None
             messagebox.showerror("Error", f"Ocurrió un error inesperado:\n{str(e)}")
     
+    def _open_sweep_dialog(self):
+        """Abre el análisis paramétrico con una copia del modelo de la tabla."""
+        self.table_grid.commit_edit()
+        try:
+            # Modelo propio: el barrido no interfiere con el que se conserva entre resoluciones
+            lp_model = self._build_model()
+        except ValueError as e:
+            messagebox.showerror("Error de Validación", str(e))
+            return
+        SweepDialog(
+            self.root,
+            lp_model,
+            [f"R{i+1}" for i in range(self.table_grid.num_constraints)],
+            lp_model._var_names,
+            self.backend_var.get()
+        )
+    
+    def _open_project(self):
+        """Abre un archivo de proyecto; las celdas se leen del archivo al dibujarlas."""
+        path = filedialog.askopenfilename(
+            parent=self.root,
+            title="Abrir proyecto",
+            filetypes=[("Proyecto", f"*{PROJECT_EXTENSION}"), ("Todos los archivos", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            project = load_project(path)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        
+        self.sense_var.set(project['sense'])
+        self.num_vars.set(len(project['c']))
+        self.num_constraints.set(len(project['b']))
+        self._build_table()
+        self.variable_names = list(project['variable_names'])
+        # Las celdas no editadas se leen de los arreglos mapeados al dibujarlas
+        self.problem_data = ProblemData.from_arrays(project)
+        self.table_grid.redraw()
+        self._update_model_display()
+    
+    def _save_project(self):
+        """Guarda la tabla actual (incluidas las celdas editadas) como proyecto."""
+        self.table_grid.commit_edit()
+        path = filedialog.asksaveasfilename(
+            parent=self.root,
+            title="Guardar proyecto",
+            defaultextension=PROJECT_EXTENSION,
+            filetypes=[("Proyecto", f"*{PROJECT_EXTENSION}")]
+        )
+        if not path:
+            return
+        try:
+            save_project(path, self._checked_problem_data().to_arrays())
+        except ValueError as e:
+            messagebox.showerror("Error de Validación", str(e))
+        except OSError as e:
+            messagebox.showerror("Error", f"No se pudo guardar el proyecto:\n{str(e)}")
+    
+    def _build_model(self, timer=None):
+        """
+        Construye un LPModel nuevo directamente desde los arreglos de problem_data.
+        
+        Args:
+            timer (PhaseTimer, optional): Acumula las fases 'validate' y 'build'
+        
+        Returns:
+            LPModel: Modelo listo para resolver
+        
+        Raises:
+            ValueError: Si alguna celda no contiene un número válido
+        """
+        timer = timer or PhaseTimer()
+        timer.restart()
+        problem_data = self._checked_problem_data()
+        timer.lap('validate')
+        
+        lp_model = LPModel.from_arrays(**problem_data.to_spec())
+        timer.lap('build')
+        return lp_model
+        
+    def _checked_problem_data(self):
+        """
+        Datos del problema de la tabla, con el sentido de optimización actual.
+        
+        Returns:
+            ProblemData: Los datos de la tabla
+        
+        Raises:
+            ValueError: Si alguna celda no contiene un número válido (se informan
+                        todas, en orden de filas)
+        """
+        if self._invalid_cells:
+            raise self._invalid_cells_error(self._invalid_cells)
+        self.problem_data.sense = self.sense_var.get()
+        return self.problem_data
+    
+    def _patch_model(self, timer=None):
+        """
+        Aplica al modelo existente solo las celdas editadas desde la última resolución.
+        
+        Args:
+            timer (PhaseTimer, optional): Acumula las fases 'read', 'validate' y 'build'
+        
+        Returns:
+            LPModel: El mismo modelo, actualizado
+        
+        Raises:
+            ValueError: Si alguna celda editada no contiene un número válido
+        """
+        return self._apply_cells(self._lp_model, sorted(self._dirty_cells), timer or PhaseTimer())
+    
+    def _apply_cells(self, lp_model, cells, timer):
+        """
+        Aplica al modelo los valores de problem_data en las celdas indicadas.
+        
+        Args:
+            lp_model (LPModel): Modelo a actualizar
+            cells (list): Posiciones (fila, columna) de las celdas
+            timer (PhaseTimer): Acumula las fases 'read', 'validate' y 'build'
+        
+        Returns:
+            LPModel: El mismo modelo, actualizado
+        
+        Raises:
+            ValueError: Si alguna celda no contiene un número válido
+        """
+        timer.restart()
+        num_vars = self.table_grid.num_vars
+        names_row = HEADER_ROWS.index('names')
+        
+        # Comprobar todas las celdas antes de modificar para no dejar el modelo a medias
+        invalid = [cell for cell in cells if cell in self._invalid_cells]
+        if invalid:
+            raise self._invalid_cells_error(invalid)
+        timer.lap('validate')
+        
+        updates = [
+            (row, col, None if row < OBJECTIVE_ROW else self._cell_value(row, col))
+            for row, col in cells
+        ]
+        timer.lap('read')
+        
+        for row, col, cell_value in updates:
+            index = row - FIRST_CONSTRAINT_ROW
+            if row == names_row:
+                lp_model.set_variable_name(col - 1, self.variable_names[col - 1])
+            elif row < OBJECTIVE_ROW:
+                # Tipo y cotas se aplican juntos: la columna queda como en la tabla
+                j = col - 1
+                lp_model.set_integer(j, self.problem_data.integer[j])
+                lp_model.set_bounds(j, self.problem_data.lower[j], self.problem_data.upper[j])
+            elif row == OBJECTIVE_ROW:
+                lp_model.set_objective_coef(col - 1, cell_value)
+            elif col == num_vars + 1:
+                lp_model.set_constraint_type(index, cell_value)
+            elif col == num_vars + 2:
+                lp_model.set_rhs(index, cell_value)
+            else:
+                lp_model.set_constraint_coef(index, col - 1, cell_value)
+        
+        lp_model.set_sense(self.sense_var.get())
+        timer.lap('build')
+        return lp_model
+    
+    def _invalid_cells_error(self, cells):
+        """
+        Error de validación con los mensajes de las celdas inválidas indicadas.
+        
+        Args:
+            cells (collection): Celdas (fila, columna) presentes en _invalid_cells
+        
+        Returns:
+            ValueError: Error con los primeros MAX_REPORTED_ERRORS mensajes
+        """
+        cells = sorted(cells)
+        if len(cells) == 1:
+            return ValueError(self._invalid_cells[cells[0]])
+        messages = [self._invalid_cells[cell].replace("\n", " ") for cell in cells[:MAX_REPORTED_ERRORS]]
+        if len(cells) > MAX_REPORTED_ERRORS:
+            messages.append(f"... y {len(cells) - MAX_REPORTED_ERRORS} más.")
+        return ValueError(
+            f"Hay {len(cells)} celdas con valores no válidos (marcadas en rojo):\n\n"
+            + "\n".join(messages)
+        )
+    
+    def _cell_label(self, row, col):
+        """Descripción de una celda numérica para los mensajes de validación."""
+        num_vars = self.table_grid.num_vars
+        if col == num_vars + 2:
+            return f"Valor de R{row - FIRST_CONSTRAINT_ROW + 1}"
+        var_name = self.variable_names[col - 1] if col - 1 < len(self.variable_names) else f"X{col}"
+        if row < OBJECTIVE_ROW:
+            return f"{HEADER_LABELS[HEADER_ROWS[row]].rstrip(':')} de {var_name}"
+        if row == OBJECTIVE_ROW:
+            return f"Coeficiente {var_name} de función objetivo"
+        return f"Coeficiente {var_name} de R{row - FIRST_CONSTRAINT_ROW + 1}"
+    
+    def _start_solve(self, lp_model):
+        """Lanza la resolución del modelo en un hilo de trabajo."""
+        self._solve_job += 1
+        self._active_model = lp_model
+        self._solve_start = time.perf_counter()
+        
+        self.solve_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        
+        worker = threading.Thread(
+            target=self._solve_worker,
+            args=(self._solve_job, lp_model, self.backend_var.get()),
+            daemon=True
+        )
+        worker.start()
+        self._poll_solve()
+    
+    def _solve_worker(self, job_id, lp_model, backend):
+        """Ejecuta solve() en segundo plano y deja el resultado en la cola."""
+        try:
+            result = lp_model.solve(backend=backend)
+        except Exception as e:
+            result = e
+        self._solve_queue.put((job_id, result))
+    
+    def _poll_solve(self):
+        """Actualiza el tiempo transcurrido y recoge el resultado desde el hilo de Tk."""
+        while True:
+            try:
+                job_id, result = self._solve_queue.get_nowait()
+            except queue.Empty:
+                break
+            if job_id == self._solve_job and self._active_model is not None:
+                self._finish_solve(result)
+                return
+        
+        if self._active_model is None:
+            return
+        
+        elapsed = time.perf_counter() - self._solve_start
+        self.solve_status_label.config(text=f"⏱ Resolviendo... {elapsed:.1f} s")
+        self.root.after(100, self._poll_solve)
+    
+    def _finish_solve(self, result):
+        """Muestra el resultado de la resolución y restablece los controles."""
+        elapsed = time.perf_counter() - self._solve_start
+        self._reset_solve_controls()
+        if isinstance(result, dict) and result.get('cache_hit'):
+            self.solve_status_label.config(text="✓ Resultado en caché")
+        elif isinstance(result, dict) and result.get('backend'):
+            detail = result['backend']
+            if result.get('warm_start'):
+                detail += ", arranque en caliente"
+            self.solve_status_label.config(
+                text=f"✓ Terminado en {elapsed:.2f} s ({detail})"
+            )
+        else:
+            self.solve_status_label.config(text=f"✓ Terminado en {elapsed:.2f} s")
+        
+        if isinstance(result, Exception):
+            messagebox.showerror("Error", f"Ocurrió un error inesperado:\n{str(result)}")
+        else:
+            timer = PhaseTimer()
+            with timer.phase('display'):
+                self._display_result(result['message'])
+            self._show_timings(result.get('timings', {}), timer.as_dict())
+    
+    def _show_timings(self, solve_timings, display_timings):
+        """
+        Combina los tiempos de la interfaz con los de LPModel.solve() y los muestra.
+        
+        Args:
+            solve_timings (dict): Tiempos del resultado de solve()
+            display_timings (dict): Tiempo de presentar el resultado
+        """
+        gui_timings = dict(self._gui_timings)
+        gui_timings.update(display_timings)
+        log_timings(gui_timings, 'interfaz')
+        
+        timings = dict(gui_timings)
+        for name, seconds in solve_timings.items():
+            if name != 'total':
+                timings[name] = timings.get(name, 0.0) + seconds
+        timings['total'] = sum(gui_timings.values()) + solve_timings.get('total', 0.0)
+        self.timings_label.config(text=format_timings(timings))
+    
+    def _toggle_timings(self):
+        """Muestra u oculta la sección de tiempos por fase."""
+        self._timings_visible = not self._timings_visible
+        if self._timings_visible:
+            self.timings_button.config(text="▾ Tiempos por fase")
+            self.timings_label.pack(fill=tk.X)
+        else:
+            self.timings_button.config(text="▸ Tiempos por fase")
+            self.timings_label.pack_forget()
+    
+    def _cancel_solve(self):
+        """Cancela la resolución en curso deteniendo el solver."""
+        if self._active_model is None:
+            return
+        self._active_model.cancel()
+        # El hilo puede seguir usando el modelo un instante: la próxima vez se reconstruye
+        self._lp_model = None
+        # Cualquier resultado que llegue de este trabajo se descarta
+        self._solve_job += 1
+        self._reset_solve_controls()
+        self.solve_status_label.config(text="✗ Cancelado")
+        self._display_result("✗ Resolución cancelada por el usuario.")
+    
+    def _reset_solve_controls(self):
+        """Vuelve los botones al estado inactivo."""
+        self._active_model = None
+        self.solve_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+    
+    def _on_close(self):
+        """Cierra la ventana deteniendo antes el solver, si está corriendo."""
+        if self._active_model is not None:
+            self._active_model.cancel()
+        self.root.destroy()
+    
     def _display_result(self, message):
         """Muestra el resultado en el área de resultados."""
         self.results_text.delete(1.0, tk.END)
@@ -997,41 +1634,49 @@ Configuración: 12 variables, 8 restricciones
         value = value.strip()
         if value and value != self.variable_names[idx]:
             self.variable_names[idx] = value
-            # Actualizar el label del encabezado
-            if idx < len(self.variable_name_entries):
-                # Encontrar y actualizar el label de la fila 1
-                for widget in self.table_frame.grid_slaves(row=1, column=idx+1):
-                    if isinstance(widget, tk.Label):
-                        widget.config(text=value)
+            self.problem_data.set_variable_name(idx, value)
+            self._dirty_cells.add((HEADER_ROWS.index('names'), idx + 1))
+            self._model_changed()
+            # La fila de encabezados lee los nombres al redibujarse
+            self.table_grid.redraw()
     
     def _highlight_row(self, row):
         """Resalta la fila actualmente seleccionada."""
         self.current_focus_row = row
-        # Aplicar color de fondo sutil a todos los widgets de la fila
-        for widget in self.table_frame.grid_slaves(row=row):
-            if isinstance(widget, tk.Entry):
-                if widget.cget('bg') == '#FFFF99':  # Mantener color amarillo de valores
-                    widget.config(bg='#FFEB9C')
-                else:
-                    widget.config(bg='#E8F5E9')
+        self.table_grid.set_highlight_row(row)
     
     def _unhighlight_row(self):
         """Quita el resaltado de la fila anterior."""
         if self.current_focus_row is not None:
-            row = self.current_focus_row
-            for widget in self.table_frame.grid_slaves(row=row):
-                if isinstance(widget, tk.Entry):
-                    if widget.cget('bg') in ['#FFEB9C', '#E8F5E9']:
-                        # Restaurar color original
-                        if row >= 4:  # Restricciones - verificar si es columna de valor
-                            grid_info = widget.grid_info()
-                            if grid_info and grid_info.get('column') == len(self.objective_entries) + 2:
-                                widget.config(bg='#FFFF99')
-                            else:
-                                widget.config(bg='white')
-                        else:
-                            widget.config(bg='white')
             self.current_focus_row = None
+            self.table_grid.set_highlight_row(None)
+    
+    def _fill_table(self, nombres, obj_coefs, constraints_data):
+        """
+        Escribe los datos de un ejemplo directamente en la tabla y la redibuja una vez.
+        
+        Args:
+            nombres (list): Nombres de las variables
+            obj_coefs (list): Coeficientes de la función objetivo (texto)
+            constraints_data (list): Tuplas (coeficientes, tipo, valor) por restricción
+        """
+        num_vars = self.table_grid.num_vars
+        
+        for i, nombre in enumerate(nombres[:num_vars]):
+            self.variable_names[i] = nombre
+            self.problem_data.set_variable_name(i, nombre)
+        
+        if obj_coefs:
+            self._set_block(OBJECTIVE_ROW, 1, [obj_coefs[:num_vars]])
+        
+        rows = [
+            list(coefs[:num_vars]) + [tipo, valor]
+            for coefs, tipo, valor in constraints_data[:self.table_grid.num_constraints]
+        ]
+        if rows:
+            self._set_block(FIRST_CONSTRAINT_ROW, 1, rows)
+        
+        self.table_grid.redraw()
     
     def _load_example_1(self):
         """Carga el Ejemplo 1: Mezcla Dietética."""
@@ -1041,25 +1686,13 @@ Configuración: 12 variables, 8 restricciones
         self.num_constraints.set(4)
         
         # Reconstruir tabla
-        self._rebuild_table()
-        
-        # Esperar a que la tabla se construya
-        self.root.update_idletasks()
+        self._build_table()
         
         # Nombres de variables
         nombres = ["Alim_1", "Alim_2", "Alim_3"]
-        for i, nombre in enumerate(nombres):
-            if i < len(self.variable_name_entries):
-                self.variable_name_entries[i].delete(0, tk.END)
-                self.variable_name_entries[i].insert(0, nombre)
-                self._update_variable_name(i, nombre)
         
         # Función objetivo: 0.10, 0.15, 0.12
         obj_coefs = ["0.10", "0.15", "0.12"]
-        for i, coef in enumerate(obj_coefs):
-            if i < len(self.objective_entries):
-                self.objective_entries[i].delete(0, tk.END)
-                self.objective_entries[i].insert(0, coef)
         
         # Restricciones
         # R1: 50, 30, 20 >= 290 (Vitamina 1)
@@ -1073,20 +1706,7 @@ Configuración: 12 variables, 8 restricciones
             (["1", "1", "1"], ">=", "9")
         ]
         
-        for r, (coefs, tipo, valor) in enumerate(constraints_data):
-            if r < len(self.constraint_entries):
-                # Coeficientes
-                for c, coef in enumerate(coefs):
-                    if c < len(self.constraint_entries[r]['coefficients']):
-                        self.constraint_entries[r]['coefficients'][c].delete(0, tk.END)
-                        self.constraint_entries[r]['coefficients'][c].insert(0, coef)
-                
-                # Tipo
-                self.constraint_entries[r]['type'].set(tipo)
-                
-                # Valor
-                self.constraint_entries[r]['value'].delete(0, tk.END)
-                self.constraint_entries[r]['value'].insert(0, valor)
+        self._fill_table(nombres, obj_coefs, constraints_data)
         
         # Cambiar a pestaña Solver
         self.notebook.select(0)
@@ -1108,25 +1728,13 @@ Configuración: 12 variables, 8 restricciones
         self.num_constraints.set(6)
         
         # Reconstruir tabla
-        self._rebuild_table()
-        
-        # Esperar a que la tabla se construya
-        self.root.update_idletasks()
+        self._build_table()
         
         # Nombres de variables
         nombres = ["X11", "X12", "X13", "X14", "X21", "X22", "X23", "X24"]
-        for i, nombre in enumerate(nombres):
-            if i < len(self.variable_name_entries):
-                self.variable_name_entries[i].delete(0, tk.END)
-                self.variable_name_entries[i].insert(0, nombre)
-                self._update_variable_name(i, nombre)
         
         # Función objetivo: 2.00, 3.00, 1.50, 2.50, 4.00, 3.50, 2.50, 3.00
         obj_coefs = ["2.00", "3.00", "1.50", "2.50", "4.00", "3.50", "2.50", "3.00"]
-        for i, coef in enumerate(obj_coefs):
-            if i < len(self.objective_entries):
-                self.objective_entries[i].delete(0, tk.END)
-                self.objective_entries[i].insert(0, coef)
         
         # Restricciones
         # R1: 1,1,1,1,0,0,0,0 <= 900 (Reserva 1)
@@ -1144,20 +1752,7 @@ Configuración: 12 variables, 8 restricciones
             (["0", "0", "0", "1", "0", "0", "0", "1"], ">=", "350")
         ]
         
-        for r, (coefs, tipo, valor) in enumerate(constraints_data):
-            if r < len(self.constraint_entries):
-                # Coeficientes
-                for c, coef in enumerate(coefs):
-                    if c < len(self.constraint_entries[r]['coefficients']):
-                        self.constraint_entries[r]['coefficients'][c].delete(0, tk.END)
-                        self.constraint_entries[r]['coefficients'][c].insert(0, coef)
-                
-                # Tipo
-                self.constraint_entries[r]['type'].set(tipo)
-                
-                # Valor
-                self.constraint_entries[r]['value'].delete(0, tk.END)
-                self.constraint_entries[r]['value'].insert(0, valor)
+        self._fill_table(nombres, obj_coefs, constraints_data)
         
         # Cambiar a pestaña Solver
         self.notebook.select(0)
@@ -1179,25 +1774,13 @@ Configuración: 12 variables, 8 restricciones
         self.num_constraints.set(9)
         
         # Reconstruir tabla
-        self._rebuild_table()
-        
-        # Esperar a que la tabla se construya
-        self.root.update_idletasks()
+        self._build_table()
         
         # Nombres de variables
         nombres = ["Solar1", "Solar2", "Sintet", "Carbon", "Nuclear", "Geoter"]
-        for i, nombre in enumerate(nombres):
-            if i < len(self.variable_name_entries):
-                self.variable_name_entries[i].delete(0, tk.END)
-                self.variable_name_entries[i].insert(0, nombre)
-                self._update_variable_name(i, nombre)
         
         # Función objetivo: 4.4, 3.8, 4.1, 3.5, 5.1, 3.2
         obj_coefs = ["4.4", "3.8", "4.1", "3.5", "5.1", "3.2"]
-        for i, coef in enumerate(obj_coefs):
-            if i < len(self.objective_entries):
-                self.objective_entries[i].delete(0, tk.END)
-                self.objective_entries[i].insert(0, coef)
         
         # Restricciones
         # R1: 1,1,1,1,1,1 <= 1000 (Presupuesto total)
@@ -1221,20 +1804,7 @@ Configuración: 12 variables, 8 restricciones
             (["1", "1", "0", "0", "0", "0"], ">=", "300")
         ]
         
-        for r, (coefs, tipo, valor) in enumerate(constraints_data):
-            if r < len(self.constraint_entries):
-                # Coeficientes
-                for c, coef in enumerate(coefs):
-                    if c < len(self.constraint_entries[r]['coefficients']):
-                        self.constraint_entries[r]['coefficients'][c].delete(0, tk.END)
-                        self.constraint_entries[r]['coefficients'][c].insert(0, coef)
-                
-                # Tipo
-                self.constraint_entries[r]['type'].set(tipo)
-                
-                # Valor
-                self.constraint_entries[r]['value'].delete(0, tk.END)
-                self.constraint_entries[r]['value'].insert(0, valor)
+        self._fill_table(nombres, obj_coefs, constraints_data)
         
         # Cambiar a pestaña Solver
         self.notebook.select(0)
@@ -1256,25 +1826,13 @@ Configuración: 12 variables, 8 restricciones
         self.num_constraints.set(8)
         
         # Reconstruir tabla
-        self._rebuild_table()
-        
-        # Esperar a que la tabla se construya
-        self.root.update_idletasks()
+        self._build_table()
         
         # Nombres de variables
         nombres = ["X11", "X12", "X13", "X21", "X22", "X23", "X31", "X32", "X33", "X41", "X42", "X43"]
-        for i, nombre in enumerate(nombres):
-            if i < len(self.variable_name_entries):
-                self.variable_name_entries[i].delete(0, tk.END)
-                self.variable_name_entries[i].insert(0, nombre)
-                self._update_variable_name(i, nombre)
         
         # Función objetivo: 0.11, 0.07, 0.05, 0.08, 0.04, 0.02, 0.14, 0.10, 0.08, 0.12, 0.08, 0.06
         obj_coefs = ["0.11", "0.07", "0.05", "0.08", "0.04", "0.02", "0.14", "0.10", "0.08", "0.12", "0.08", "0.06"]
-        for i, coef in enumerate(obj_coefs):
-            if i < len(self.objective_entries):
-                self.objective_entries[i].delete(0, tk.END)
-                self.objective_entries[i].insert(0, coef)
         
         # Restricciones (orden según imagen)
         # R1: 1,1,1,1,1,1,1,1,1,1,1,1 = 5000000 (Producción total)
@@ -1296,20 +1854,7 @@ Configuración: 12 variables, 8 restricciones
             (["1", "0", "0", "1", "0", "0", "1", "0", "0", "1", "0", "0"], ">=", "2000000")
         ]
         
-        for r, (coefs, tipo, valor) in enumerate(constraints_data):
-            if r < len(self.constraint_entries):
-                # Coeficientes
-                for c, coef in enumerate(coefs):
-                    if c < len(self.constraint_entries[r]['coefficients']):
-                        self.constraint_entries[r]['coefficients'][c].delete(0, tk.END)
-                        self.constraint_entries[r]['coefficients'][c].insert(0, coef)
-                
-                # Tipo
-                self.constraint_entries[r]['type'].set(tipo)
-                
-                # Valor
-                self.constraint_entries[r]['value'].delete(0, tk.END)
-                self.constraint_entries[r]['value'].insert(0, valor)
+        self._fill_table(nombres, obj_coefs, constraints_data)
         
         # Cambiar a pestaña Solver
         self.notebook.select(0)
@@ -1322,3 +1867,39 @@ Configuración: 12 variables, 8 restricciones
             "✅ Ejemplo 4: Mezcla de Petróleo cargado exitosamente.\n\n"
             "Haz clic en 'Resolver Problema' para ver la solución."
         )
+
+
+def _format_number(value):
+    """Texto de un número para la tabla: sin decimales si es entero, exacto si no."""
+    value = float(value)
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _bound_description(var_name, lower, upper, integer):
+    """
+    Texto de las cotas y el tipo de una variable para la vista del modelo.
+    
+    Args:
+        var_name (str): Nombre de la variable
+        lower (float): Cota inferior (-inf si no tiene)
+        upper (float): Cota superior (inf si no tiene)
+        integer (bool): True si la variable es entera
+    
+    Returns:
+        str: Por ejemplo 'X ≥ 0', '0 ≤ X ≤ 10', 'X libre' o 'X ∈ {0, 1}'
+    """
+    if integer and lower == 0 and upper == 1:
+        return f"{var_name} ∈ {{0, 1}}"
+    if lower == upper:
+        text = f"{var_name} = {_format_number(lower)}"
+    elif np.isinf(lower) and np.isinf(upper):
+        text = f"{var_name} libre"
+    elif np.isinf(upper):
+        text = f"{var_name} ≥ {_format_number(lower)}"
+    elif np.isinf(lower):
+        text = f"{var_name} ≤ {_format_number(upper)}"
+    else:
+        text = f"{_format_number(lower)} ≤ {var_name} ≤ {_format_number(upper)}"
+    return text + " y entera" if integer else text
@@ -0,0 +1,563 @@
+"""
+Tabla virtual tipo hoja de cálculo dibujada sobre un Canvas.
+Solo se dibujan las celdas visibles y se usa un único editor flotante,
+por lo que construir o desplazar la tabla cuesta lo mismo sin importar su tamaño.
+"""
+
+import csv
+import tkinter as tk
+from tkinter import ttk
+
+from ..models.problem_data import VARIABLE_TYPES
+
+
+# Filas fijas de la tabla (en orden) antes de la fila objetivo
+HEADER_ROWS = ('names', 'header', 'var_type', 'lower', 'upper')
+OBJECTIVE_ROW = len(HEADER_ROWS)
+FIRST_CONSTRAINT_ROW = OBJECTIVE_ROW + 1
+
+CONSTRAINT_TYPES = ("<=", ">=", "=")
+
+# Tipos de celda que se editan con el editor flotante
+EDITABLE_KINDS = ('name', 'var_type', 'bound', 'objective', 'coef', 'value', 'type')
+
+# Tipos de celda que se editan con la lista desplegable
+CHOICE_KINDS = ('var_type', 'type')
+
+
+class SpreadsheetGrid(tk.Frame):
+    """
+    Tabla virtualizada para el modelo de PL.
+
+    La tabla no guarda datos: pide el texto de cada celda visible con
+    get_text(row, col) y notifica los cambios con commit(row, col, text).
+    Las coordenadas (row, col) son las mismas que usaba la tabla de widgets:
+    columna 0 = etiquetas, 1..n = variables, n+1 = Tipo, n+2 = Valor.
+    """
+
+    ROW_HEIGHT = 24
+    LABEL_WIDTH = 110
+    CELL_WIDTH = 72
+    TYPE_WIDTH = 60
+    VALUE_WIDTH = 86
+
+    # Colores por tipo de celda: (fondo, texto)
+    COLORS = {
+        'name': ("#F0F0F0", "black"),
+        'header': ("#4472C4", "white"),
+        'var_type': ("#F0F0F0", "black"),
+        'bound': ("#F0F0F0", "black"),
+        'objective': ("white", "black"),
+        'coef': ("white", "black"),
+        'type': ("#FAFAFA", "black"),
+        'value': ("#FFFF99", "black"),
+    }
+    HIGHLIGHT_COLOR = "#E8F5E9"
+    HIGHLIGHT_VALUE_COLOR = "#FFEB9C"
+    INVALID_COLORS = ("#FFC7CE", "#9C0006")
+
+    def __init__(self, parent, get_text, commit, navigate,
+                 on_focus=None, on_blur=None, paste=None):
+        """
+        Inicializa la tabla virtual.
+
+        Args:
+            parent (tk.Widget): Contenedor de la tabla
+            get_text (callable): get_text(row, col) -> str con el texto de la celda
+            commit (callable): commit(row, col, text) al confirmar una edición
+            navigate (callable): navigate(event, row, col) para las teclas de navegación
+            on_focus (callable, optional): on_focus(row, col) al activar una celda
+            on_blur (callable, optional): on_blur() cuando el foco sale de la tabla
+            paste (callable, optional): paste(row, col, rows) al pegar un bloque de
+                                        varias celdas (filas de textos) en la celda activa
+        """
+        super().__init__(parent, bg="white")
+        self.get_text = get_text
+        self.commit = commit
+        self.navigate = navigate
+        self.on_focus = on_focus
+        self.on_blur = on_blur
+        self.paste = paste
+
+        self.num_vars = 0
+        self.num_constraints = 0
+        self.highlight_row = None
+        self.invalid_cells = set()  # Celdas (row, col) marcadas como inválidas
+        self.edit_cell = None  # Celda (row, col) que muestra el editor flotante
+
+        # Canvas y scrollbars
+        self.canvas = tk.Canvas(self, bg="white", highlightthickness=0)
+        v_scrollbar = tk.Scrollbar(self, orient="vertical", command=self._yview)
+        h_scrollbar = tk.Scrollbar(self, orient="horizontal", command=self._xview)
+        self.canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+
+        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Editores flotantes (uno para texto y otro para el tipo de variable o restricción)
+        self.editor = tk.Entry(
+            self.canvas,
+            font=("Arial", 10),
+            justify="center",
+            relief=tk.SOLID,
+            borderwidth=1
+        )
+        self.type_editor = ttk.Combobox(
+            self.canvas,
+            values=CONSTRAINT_TYPES,
+            state="readonly",
+            font=("Arial", 10),
+            justify="center"
+        )
+
+        for key in ('<Return>', '<Up>', '<Down>', '<Left>', '<Right>', '<Tab>'):
+            self.editor.bind(key, self._on_editor_key)
+        self.editor.bind('<Escape>', self._on_editor_escape)
+        self.editor.bind('<FocusOut>', lambda e: self.after_idle(self._check_blur))
+        self.type_editor.bind('<Return>', self._on_editor_key)
+        self.type_editor.bind('<Tab>', self._on_editor_key)
+        for widget in (self.editor, self.type_editor):
+            widget.bind('<<Paste>>', self._on_paste)
+        self.type_editor.bind('<<ComboboxSelected>>', lambda e: self.commit_edit())
+        self.type_editor.bind('<FocusOut>', lambda e: self.after_idle(self._check_blur))
+
+        # Eventos del canvas
+        self.canvas.bind('<Configure>', lambda e: self.redraw())
+        self.canvas.bind('<Button-1>', self._on_click)
+        for widget in (self.canvas, self.editor):
+            widget.bind('<MouseWheel>', self._on_mousewheel)
+            widget.bind('<Shift-MouseWheel>', self._on_shift_mousewheel)
+            widget.bind('<Button-4>', lambda e: self._scroll_rows(-3))
+            widget.bind('<Button-5>', lambda e: self._scroll_rows(3))
+
+    # ------------------------------------------------------------------
+    # Geometría
+    # ------------------------------------------------------------------
+
+    @property
+    def num_rows(self):
+        """int: Número total de filas (encabezados + objetivo + restricciones)."""
+        return FIRST_CONSTRAINT_ROW + self.num_constraints
+
+    @property
+    def num_columns(self):
+        """int: Número total de columnas (etiquetas + variables + Tipo + Valor)."""
+        return self.num_vars + 3
+
+    def _column_x(self, col):
+        """Coordenada x del borde izquierdo de una columna."""
+        if col == 0:
+            return 0
+        x = self.LABEL_WIDTH + (min(col, self.num_vars + 1) - 1) * self.CELL_WIDTH
+        if col == self.num_vars + 2:
+            x += self.TYPE_WIDTH
+        return x
+
+    def _column_width(self, col):
+        """Ancho en píxeles de una columna."""
+        if col == 0:
+            return self.LABEL_WIDTH
+        if col == self.num_vars + 1:
+            return self.TYPE_WIDTH
+        if col == self.num_vars + 2:
+            return self.VALUE_WIDTH
+        return self.CELL_WIDTH
+
+    def _column_at(self, x):
+        """Columna que contiene la coordenada x (o None si está fuera)."""
+        if x < 0:
+            return None
+        if x < self.LABEL_WIDTH:
+            return 0
+        col = 1 + int((x - self.LABEL_WIDTH) // self.CELL_WIDTH)
+        if col <= self.num_vars:
+            return col
+        type_x = self._column_x(self.num_vars + 1)
+        if x < type_x + self.TYPE_WIDTH:
+            return self.num_vars + 1
+        if x < type_x + self.TYPE_WIDTH + self.VALUE_WIDTH:
+            return self.num_vars + 2
+        return None
+
+    def _total_size(self):
+        """Tamaño total (ancho, alto) de la tabla en píxeles."""
+        width = self._column_x(self.num_vars + 2) + self.VALUE_WIDTH
+        return width, self.num_rows * self.ROW_HEIGHT
+
+    def cell_kind(self, row, col):
+        """
+        Devuelve el tipo de una celda según su posición.
+
+        Args:
+            row (int): Fila de la tabla
+            col (int): Columna de la tabla
+
+        Returns:
+            str: 'label', 'name', 'header', 'var_type', 'bound', 'objective',
+                 'coef', 'type', 'value' o 'blank'
+        """
+        if col == 0:
+            if row < OBJECTIVE_ROW and HEADER_ROWS[row] == 'header':
+                return 'blank'
+            return 'label'
+        is_var = col <= self.num_vars
+        if row < OBJECTIVE_ROW:
+            header = HEADER_ROWS[row]
+            if header == 'header':
+                return 'header'
+            if not is_var:
+                return 'blank'
+            if header == 'names':
+                return 'name'
+            return 'var_type' if header == 'var_type' else 'bound'
+        if row == OBJECTIVE_ROW:
+            return 'objective' if is_var else 'blank'
+        if is_var:
+            return 'coef'
+        return 'type' if col == self.num_vars + 1 else 'value'
+
+    def _label_colors(self, row):
+        """Colores (fondo, texto) de la columna de etiquetas."""
+        if row < OBJECTIVE_ROW:
+            if HEADER_ROWS[row] == 'header':
+                return "white", "black"
+            return "#E7E6E6", "black"
+        if row == OBJECTIVE_ROW:
+            return "#70AD47", "white"
+        r = row - FIRST_CONSTRAINT_ROW
+        return ("#FFC000" if r < 5 else "#92D050"), "black"
+
+    # ------------------------------------------------------------------
+    # Dibujo
+    # ------------------------------------------------------------------
+
+    def set_size(self, num_vars, num_constraints):
+        """
+        Cambia las dimensiones de la tabla. No crea widgets por celda,
+        así que el costo es constante. La edición en curso se descarta.
+        """
+        self.canvas.delete('editor')
+        self.edit_cell = None
+        self.num_vars = num_vars
+        self.num_constraints = num_constraints
+        self.highlight_row = None
+        width, height = self._total_size()
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
+        self.redraw()
+
+    def redraw(self):
+        """Redibuja únicamente las celdas visibles."""
+        canvas = self.canvas
+        canvas.delete('cell')
+        if self.num_vars == 0:
+            return
+
+        left = canvas.canvasx(0)
+        top = canvas.canvasy(0)
+        width = max(canvas.winfo_width(), 1)
+        height = max(canvas.winfo_height(), 1)
+
+        first_row = max(0, int(top // self.ROW_HEIGHT))
+        last_row = min(self.num_rows - 1, int((top + height) // self.ROW_HEIGHT))
+        first_col = self._column_at(left)
+        last_col = self._column_at(left + width)
+        if first_col is None:
+            first_col = 0
+        if last_col is None:
+            last_col = self.num_columns - 1
+
+        for row in range(first_row, last_row + 1):
+            y0 = row * self.ROW_HEIGHT
+            y1 = y0 + self.ROW_HEIGHT - 1
+            for col in range(first_col, last_col + 1):
+                self._draw_cell(row, col, y0, y1)
+
+    def _draw_cell(self, row, col, y0, y1):
+        """Dibuja el fondo y el texto de una celda."""
+        kind = self.cell_kind(row, col)
+        if kind == 'blank':
+            return
+
+        x0 = self._column_x(col)
+        x1 = x0 + self._column_width(col) - 1
+
+        if kind == 'label':
+            bg, fg = self._label_colors(row)
+            font = ("Arial", 8 if row < OBJECTIVE_ROW else 9, "bold")
+        else:
+            bg, fg = self._cell_colors(kind, row, col)
+            if kind == 'header':
+                font = ("Arial", 9, "bold")
+            elif kind == 'name':
+                font = ("Arial", 8)
+            else:
+                font = ("Arial", 10)
+
+        self.canvas.create_rectangle(
+            x0, y0, x1, y1, fill=bg, outline="#BFBFBF", tags='cell'
+        )
+        text = self._fit_text(self.get_text(row, col), x1 - x0)
+        if text:
+            self.canvas.create_text(
+                (x0 + x1) / 2, (y0 + y1) / 2,
+                text=text, fill=fg, font=font, tags='cell'
+            )
+
+    def _cell_colors(self, kind, row, col):
+        """Colores (fondo, texto) de una celda de datos."""
+        if (row, col) in self.invalid_cells:
+            return self.INVALID_COLORS
+        bg, fg = self.COLORS[kind]
+        if row == self.highlight_row and kind in ('objective', 'coef', 'value'):
+            bg = self.HIGHLIGHT_VALUE_COLOR if kind == 'value' else self.HIGHLIGHT_COLOR
+        return bg, fg
+
+    @staticmethod
+    def _fit_text(text, width):
+        """Recorta el texto para que quepa en el ancho de la celda."""
+        max_chars = max(1, (width - 6) // 7)
+        if len(text) > max_chars:
+            return text[:max_chars - 1] + "…"
+        return text
+
+    def set_invalid_cells(self, cells):
+        """
+        Marca en rojo las celdas indicadas.
+        
+        Args:
+            cells (collection): Celdas (row, col); se guarda la referencia, así
+                                que los cambios posteriores se ven al redibujar
+        """
+        self.invalid_cells = cells
+        self.redraw()
+    
+    def set_highlight_row(self, row):
+        """Resalta una fila (o ninguna si row es None)."""
+        if row != self.highlight_row:
+            self.highlight_row = row
+            self.redraw()
+
+    # ------------------------------------------------------------------
+    # Desplazamiento
+    # ------------------------------------------------------------------
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self.redraw()
+
+    def _xview(self, *args):
+        self.canvas.xview(*args)
+        self.redraw()
+
+    def _scroll_rows(self, amount):
+        self.canvas.yview_scroll(amount, "units")
+        self.redraw()
+        return 'break'
+
+    def _on_mousewheel(self, event):
+        return self._scroll_rows(-1 if event.delta > 0 else 1)
+
+    def _on_shift_mousewheel(self, event):
+        self.canvas.xview_scroll(-1 if event.delta > 0 else 1, "units")
+        self.redraw()
+        return 'break'
+
+    def ensure_visible(self, row, col):
+        """Desplaza la vista lo mínimo necesario para mostrar la celda."""
+        width, height = self._total_size()
+        view_w = max(self.canvas.winfo_width(), 1)
+        view_h = max(self.canvas.winfo_height(), 1)
+        left = self.canvas.canvasx(0)
+        top = self.canvas.canvasy(0)
+
+        x0 = self._column_x(col)
+        x1 = x0 + self._column_width(col)
+        y0 = row * self.ROW_HEIGHT
+        y1 = y0 + self.ROW_HEIGHT
+
+        moved = False
+        if y0 < top:
+            self.canvas.yview_moveto(y0 / height)
+            moved = True
+        elif y1 > top + view_h:
+            self.canvas.yview_moveto(max(0, y1 - view_h) / height)
+            moved = True
+        if x0 < left:
+            self.canvas.xview_moveto(x0 / width)
+            moved = True
+        elif x1 > left + view_w:
+            self.canvas.xview_moveto(max(0, x1 - view_w) / width)
+            moved = True
+        if moved:
+            self.redraw()
+
+    # ------------------------------------------------------------------
+    # Edición
+    # ------------------------------------------------------------------
+
+    def _on_click(self, event):
+        """Activa la celda bajo el cursor."""
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        row = int(y // self.ROW_HEIGHT)
+        col = self._column_at(x)
+        if col is None or row >= self.num_rows:
+            return
+
+        kind = self.cell_kind(row, col)
+        if kind in EDITABLE_KINDS:
+            self.focus_cell(row, col)
+
+    def focus_cell(self, row, col):
+        """
+        Mueve el editor flotante a la celda indicada y selecciona su texto.
+
+        Args:
+            row (int): Fila de la tabla
+            col (int): Columna de la tabla
+        """
+        self.commit_edit()
+        kind = self.cell_kind(row, col)
+        if kind not in EDITABLE_KINDS:
+            return
+
+        self.ensure_visible(row, col)
+        text = self.get_text(row, col)
+        if kind in CHOICE_KINDS:
+            widget = self.type_editor
+            widget.config(values=VARIABLE_TYPES if kind == 'var_type' else CONSTRAINT_TYPES)
+            widget.set(text)
+        else:
+            widget = self.editor
+            widget.delete(0, tk.END)
+            widget.insert(0, text)
+            widget.config(font=("Arial", 8) if kind == 'name' else ("Arial", 10))
+
+        x0 = self._column_x(col)
+        self.canvas.delete('editor')
+        self.canvas.create_window(
+            x0, row * self.ROW_HEIGHT,
+            window=widget,
+            anchor="nw",
+            width=self._column_width(col) - 1,
+            height=self.ROW_HEIGHT - 1,
+            tags='editor'
+        )
+        self.edit_cell = (row, col)
+        widget.focus_set()
+        if widget is self.editor:
+            widget.select_range(0, tk.END)
+            widget.icursor(tk.END)
+
+        if self.on_focus:
+            self.on_focus(row, col)
+
+    def _editor_widget(self):
+        """Editor correspondiente a la celda activa."""
+        row, col = self.edit_cell
+        return self.type_editor if self.cell_kind(row, col) in CHOICE_KINDS else self.editor
+
+    def commit_edit(self):
+        """Confirma el texto del editor en la celda activa, si cambió."""
+        if self.edit_cell is None:
+            return
+        row, col = self.edit_cell
+        text = self._editor_widget().get()
+        if text != self.get_text(row, col):
+            self.commit(row, col, text)
+            self.redraw()
+
+    def hide_editor(self):
+        """Confirma la edición en curso y oculta el editor flotante."""
+        self.commit_edit()
+        self.canvas.delete('editor')
+        self.edit_cell = None
+
+    def _on_editor_key(self, event):
+        """Confirma la celda y delega la navegación por teclado."""
+        if self.edit_cell is None:
+            return 'break'
+        row, col = self.edit_cell
+        self.commit_edit()
+        self.navigate(event, row, col)
+        return 'break'
+
+    def _on_paste(self, event):
+        """
+        Pega un bloque copiado de una hoja de cálculo a partir de la celda activa.
+        Un valor suelto se pega en el editor como siempre.
+        """
+        if self.paste is None or self.edit_cell is None:
+            return None
+        try:
+            rows = parse_table_text(self.clipboard_get())
+        except tk.TclError:
+            return None
+        if len(rows) < 2 and (not rows or len(rows[0]) < 2):
+            return None
+        
+        row, col = self.edit_cell
+        self.commit_edit()
+        # El editor muestra el texto anterior: se descarta sin confirmarlo
+        self.canvas.delete('editor')
+        self.edit_cell = None
+        self.paste(row, col, rows)
+        self.redraw()
+        self.focus_cell(row, col)
+        return 'break'
+    
+    def _on_editor_escape(self, event):
+        """Descarta los cambios del editor y restaura el texto de la celda."""
+        if self.edit_cell is not None:
+            row, col = self.edit_cell
+            self.editor.delete(0, tk.END)
+            self.editor.insert(0, self.get_text(row, col))
+            self.editor.select_range(0, tk.END)
+        return 'break'
+
+    def _check_blur(self):
+        """Confirma la edición si el foco salió de los editores de la tabla."""
+        try:
+            focused = self.focus_get()
+        except KeyError:
+            # El foco está en la lista desplegable del Combobox
+            return
+        if focused in (self.editor, self.type_editor):
+            return
+        self.commit_edit()
+        if self.on_blur:
+            self.on_blur()
+
+
+def parse_table_text(text):
+    """
+    Convierte un bloque copiado de una hoja de cálculo en filas de celdas.
+    
+    Las celdas se separan por tabuladores (formato del portapapeles de Excel y
+    LibreOffice); si no hay ninguno, por ';' o ',' como en CSV. Con ',' como
+    separador no se admite la coma decimal.
+    
+    Args:
+        text (str): Texto del portapapeles
+    
+    Returns:
+        list: Filas de textos, todas del mismo largo (las cortas se completan con "")
+    """
+    lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if not lines:
+        return []
+    
+    for delimiter in ('\t', ';', ','):
+        if delimiter in text:
+            rows = [[cell.strip() for cell in row] for row in csv.reader(lines, delimiter=delimiter)]
+            break
+    else:
+        rows = [[line.strip()] for line in lines]
+    
+    width = max(len(row) for row in rows)
+    return [row + [""] * (width - len(row)) for row in rows]
@@ -0,0 +1,270 @@
+"""
+Diálogo de análisis paramétrico: barre un lado derecho o un coeficiente de
+la función objetivo y muestra una tabla de resultados exportable a CSV.
+"""
+
+import os
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from ..models.parametric import RHS, OBJECTIVE, parametric_sweep, sweep_values
+from ..utils.validators import validate_float
+
+
+# Columnas de variables que se muestran en la tabla (el CSV las incluye todas)
+MAX_TABLE_VARIABLES = 30
+
+
+class SweepDialog:
+    """
+    Ventana secundaria que resuelve el modelo para una serie de valores de un
+    parámetro. El barrido corre en un hilo de trabajo y la ventana consulta
+    su progreso con root.after, igual que la resolución principal.
+    """
+    
+    def __init__(self, parent, lp_model, constraint_names, variable_names, backend):
+        """
+        Crea el diálogo.
+        
+        Args:
+            parent (tk.Widget): Ventana principal
+            lp_model (LPModel): Modelo propio del diálogo (no se comparte con la ventana)
+            constraint_names (list): Nombres de las restricciones
+            variable_names (list): Nombres de las variables
+            backend (str): Solver a usar
+        """
+        self.lp_model = lp_model
+        self.constraint_names = list(constraint_names)
+        self.variable_names = list(variable_names)
+        self.backend = backend
+        self.result = None
+        self._queue = queue.Queue()
+        self._stop_event = None
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("Análisis Paramétrico")
+        self.window.geometry("820x520")
+        self.window.configure(bg="white")
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        self.kind_var = tk.StringVar(value="Lado derecho")
+        self.target_var = tk.StringVar()
+        self.start_var = tk.StringVar(value="0")
+        self.stop_var = tk.StringVar(value="100")
+        self.steps_var = tk.StringVar(value="50")
+        self.parallel_var = tk.BooleanVar(value=False)
+        
+        self._create_widgets()
+        self._update_targets()
+    
+    def _create_widgets(self):
+        """Crea los controles del parámetro, la tabla y los botones."""
+        form = tk.Frame(self.window, bg="white")
+        form.pack(fill=tk.X, padx=10, pady=10)
+        
+        tk.Label(form, text="Parámetro:", font=("Arial", 10), bg="white").grid(row=0, column=0, sticky="w")
+        kind_box = ttk.Combobox(
+            form,
+            textvariable=self.kind_var,
+            values=["Lado derecho", "Coeficiente objetivo"],
+            state="readonly",
+            width=20
+        )
+        kind_box.grid(row=0, column=1, padx=5, sticky="w")
+        kind_box.bind("<<ComboboxSelected>>", lambda e: self._update_targets())
+        
+        self.target_box = ttk.Combobox(form, textvariable=self.target_var, state="readonly", width=14)
+        self.target_box.grid(row=0, column=2, padx=5, sticky="w")
+        
+        tk.Label(form, text="Desde:", font=("Arial", 10), bg="white").grid(row=1, column=0, sticky="w", pady=5)
+        tk.Entry(form, textvariable=self.start_var, width=10).grid(row=1, column=1, padx=5, sticky="w")
+        tk.Label(form, text="Hasta:", font=("Arial", 10), bg="white").grid(row=1, column=2, sticky="w")
+        tk.Entry(form, textvariable=self.stop_var, width=10).grid(row=1, column=3, padx=5, sticky="w")
+        tk.Label(form, text="Puntos:", font=("Arial", 10), bg="white").grid(row=1, column=4, sticky="w")
+        tk.Entry(form, textvariable=self.steps_var, width=6).grid(row=1, column=5, padx=5, sticky="w")
+        
+        ttk.Checkbutton(
+            form,
+            text="Resolver en paralelo",
+            variable=self.parallel_var
+        ).grid(row=2, column=0, columnspan=2, sticky="w")
+        
+        buttons = tk.Frame(self.window, bg="white")
+        buttons.pack(fill=tk.X, padx=10)
+        
+        self.run_button = tk.Button(
+            buttons,
+            text="Ejecutar",
+            font=("Arial", 10, "bold"),
+            bg="#4CAF50",
+            fg="white",
+            command=self._run,
+            cursor="hand2"
+        )
+        self.run_button.pack(side=tk.LEFT, padx=5)
+        
+        self.stop_button = tk.Button(
+            buttons,
+            text="Detener",
+            font=("Arial", 10, "bold"),
+            bg="#E53935",
+            fg="white",
+            command=self._stop,
+            cursor="hand2",
+            state=tk.DISABLED
+        )
+        self.stop_button.pack(side=tk.LEFT, padx=5)
+        
+        self.export_button = tk.Button(
+            buttons,
+            text="Exportar CSV",
+            font=("Arial", 10),
+            bg="#2196F3",
+            fg="white",
+            command=self._export_csv,
+            cursor="hand2",
+            state=tk.DISABLED
+        )
+        self.export_button.pack(side=tk.LEFT, padx=5)
+        
+        self.status_label = tk.Label(buttons, text="", font=("Arial", 10), bg="white", fg="#666")
+        self.status_label.pack(side=tk.LEFT, padx=10)
+        
+        # Tabla de resultados
+        table_frame = tk.Frame(self.window, bg="white")
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.table = ttk.Treeview(table_frame, show="headings")
+        y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.table.yview)
+        x_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.table.xview)
+        self.table.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.table.pack(fill=tk.BOTH, expand=True)
+    
+    def _update_targets(self):
+        """Llena la lista de filas o columnas según el tipo de parámetro."""
+        if self.kind_var.get() == "Lado derecho":
+            names = self.constraint_names
+        else:
+            names = self.variable_names
+        self.target_box.config(values=names)
+        self.target_var.set(names[0] if names else "")
+    
+    def _run(self):
+        """Valida el formulario y lanza el barrido en un hilo de trabajo."""
+        try:
+            start = validate_float(self.start_var.get(), "Desde")
+            stop = validate_float(self.stop_var.get(), "Hasta")
+            steps = validate_float(self.steps_var.get(), "Puntos")
+            values = sweep_values(start, stop, steps)
+        except ValueError as e:
+            messagebox.showerror("Error de Validación", str(e), parent=self.window)
+            return
+        
+        parameter = RHS if self.kind_var.get() == "Lado derecho" else OBJECTIVE
+        index = self.target_box.current()
+        if index < 0:
+            return
+        workers = (os.cpu_count() or 1) if self.parallel_var.get() else 1
+        
+        self._stop_event = threading.Event()
+        self.run_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.NORMAL)
+        self.export_button.config(state=tk.DISABLED)
+        self.status_label.config(text=f"⏱ 0 / {len(values)}")
+        
+        worker = threading.Thread(
+            target=self._worker,
+            args=(parameter, index, values, workers, self._stop_event),
+            daemon=True
+        )
+        worker.start()
+        self._poll()
+    
+    def _worker(self, parameter, index, values, workers, stop_event):
+        """Ejecuta el barrido y deja el progreso y el resultado en la cola."""
+        def progress(done, total):
+            self._queue.put(('progress', (done, total)))
+        
+        try:
+            result = parametric_sweep(
+                self.lp_model, parameter, index, values, backend=self.backend,
+                max_workers=workers, progress=progress, stop_event=stop_event
+            )
+        except Exception as e:
+            result = e
+        self._queue.put(('done', result))
+    
+    def _poll(self):
+        """Recoge el progreso desde el hilo de Tk."""
+        if not self.window.winfo_exists():
+            return
+        while True:
+            try:
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                self.status_label.config(text=f"⏱ {payload[0]} / {payload[1]}")
+            else:
+                self._finish(payload)
+                return
+        self.window.after(100, self._poll)
+    
+    def _finish(self, result):
+        """Muestra la tabla de resultados y restablece los botones."""
+        self._stop_event = None
+        self.run_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+        if isinstance(result, Exception):
+            self.status_label.config(text="")
+            messagebox.showerror("Error", f"Ocurrió un error inesperado:\n{str(result)}", parent=self.window)
+            return
+        
+        self.result = result
+        self.export_button.config(state=tk.NORMAL if result.points else tk.DISABLED)
+        solved = sum(1 for point in result.points if point['status'] == 'Optimal')
+        self.status_label.config(text=f"✓ {len(result.points)} puntos ({solved} óptimos)")
+        self._fill_table(result)
+    
+    def _fill_table(self, result):
+        """Carga las filas del barrido en la tabla."""
+        header = result.header()[:3 + MAX_TABLE_VARIABLES]
+        self.table.delete(*self.table.get_children())
+        self.table.config(columns=list(range(len(header))))
+        for col, title in enumerate(header):
+            self.table.heading(col, text=title)
+            self.table.column(col, width=90 if col != 1 else 80, anchor="e", stretch=False)
+        for row in result.rows():
+            cells = ["" if cell is None else (f"{cell:.4f}" if isinstance(cell, float) else cell)
+                     for cell in row[:len(header)]]
+            self.table.insert("", tk.END, values=cells)
+    
+    def _export_csv(self):
+        """Guarda la tabla completa en un archivo CSV."""
+        if self.result is None:
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self.window,
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("Todos los archivos", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            self.result.to_csv(path)
+        except OSError as e:
+            messagebox.showerror("Error", f"No se pudo guardar el archivo:\n{str(e)}", parent=self.window)
+    
+    def _stop(self):
+        """Detiene el barrido tras el punto en curso."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self.stop_button.config(state=tk.DISABLED)
+    
+    def _on_close(self):
+        """Cierra la ventana deteniendo antes el barrido."""
+        self._stop()
+        self.window.destroy()
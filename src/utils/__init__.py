@@ -2,6 +2,14 @@
 Módulo de utilidades para la aplicación de Programación Lineal.
 """
 
-from .validators import validate_float
+from .validators import validate_float, validate_float_array, validate_bound
+from .problem_files import read_problem_file, parse_problem_dict
+from .model_formats import read_mps, read_lp, write_mps, write_lp
+from .project_files import save_project, load_project, project_to_spec
 
-__all__ = ['validate_float']
+__all__ = [
+    'validate_float', 'validate_float_array', 'validate_bound', 'read_problem_file',
+    'parse_problem_dict',
+    'read_mps', 'read_lp', 'write_mps', 'write_lp',
+    'save_project', 'load_project', 'project_to_spec'
+]
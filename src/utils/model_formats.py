@@ -0,0 +1,793 @@
+"""
+Lectura y escritura de modelos en formato MPS y CPLEX LP.
+
+Los lectores recorren el archivo línea por línea y acumulan los coeficientes
+en arreglos compactos (memoria proporcional al número de coeficientes
+distintos de cero), sin pasar por la interfaz gráfica. Devuelven los mismos
+argumentos de LPModel.from_arrays que read_problem_file, con A dispersa si
+SciPy está instalado.
+
+Las cotas de las variables (BOUNDS de MPS, Bounds de LP) se leen y se
+escriben como cotas propias de cada variable; los RANGES de MPS se
+traducen en una segunda restricción sobre la misma fila. Las constantes en
+la función objetivo y las secciones no lineales (QUADOBJ, SOS,
+semicontinuas) producen ValueError.
+"""
+
+import math
+import re
+from array import array
+
+import numpy as np
+
+try:
+    from scipy.sparse import csr_matrix
+except ImportError:  # SciPy es opcional
+    csr_matrix = None
+
+
+# Términos por línea al escribir expresiones en formato LP
+LP_TERMS_PER_LINE = 8
+
+MPS_SENSES = {'L': '<=', 'G': '>=', 'E': '='}
+MPS_ROW_TYPES = {'<=': 'L', '>=': 'G', '=': 'E'}
+MPS_SECTIONS = ('NAME', 'OBJSENSE', 'ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS', 'ENDATA')
+
+LP_OPERATORS = {'<=': '<=', '=<': '<=', '<': '<=', '>=': '>=', '=>': '>=', '>': '>=', '=': '='}
+
+_LP_SECTION = re.compile(
+    r"\s*(maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|subject\s+to|such\s+that|s\.t\.|st"
+    r"|bounds?|generals?|gen|integers?|binary|binaries|bin|semi-continuous|semis?|sos|end)(?=\s|$)",
+    re.IGNORECASE
+)
+
+# Fichas: operadores, signos, números, nombres o un carácter suelto (error)
+_LP_TOKEN = re.compile(
+    r"<=|>=|=<|=>|[<>=:+-]|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+    r"|(?:[^\W\d]|[!\"#$%&()/,;?@'`{}|~])[^\s+\-<>=:\[\]^*]*|\S"
+)
+# Tipo de ficha según su primer carácter (el resto son nombres)
+_LP_KINDS = {'+': 'sign', '-': 'sign', '<': 'op', '>': 'op', '=': 'op', ':': 'colon', '.': 'number'}
+_LP_KINDS.update((digit, 'number') for digit in "0123456789")
+_LP_KINDS.update((char, 'error') for char in "[]^*")
+
+_LP_NAME_INVALID = re.compile(r"[\s+\-<>=:\[\]^*\\]")
+
+
+class _ModelBuilder:
+    """Acumula un modelo leído por partes y lo convierte en forma matricial."""
+    
+    def __init__(self):
+        self.sense = 'Minimizar'
+        self.columns = {}  # Nombre -> posición
+        self.variable_names = []
+        self.objective = []
+        self.integer = []
+        self.lower = []
+        self.upper = []
+        self.row_names = []
+        self.senses = []
+        self.rhs = []
+        self.ranges = {}  # Posición de fila -> valor del rango (MPS)
+        # Coeficientes en formato de coordenadas
+        self.entry_rows = array('q')
+        self.entry_cols = array('q')
+        self.entry_values = array('d')
+    
+    def column(self, name, integer=False):
+        """Posición de una variable, registrándola si es nueva."""
+        j = self.columns.get(name)
+        if j is None:
+            j = len(self.variable_names)
+            self.columns[name] = j
+            self.variable_names.append(name)
+            self.objective.append(0.0)
+            self.integer.append(integer)
+            self.lower.append(0.0)
+            self.upper.append(math.inf)
+        return j
+    
+    def add_row(self, name, sense, rhs=0.0):
+        """Registra una restricción y devuelve su posición."""
+        self.row_names.append(name)
+        self.senses.append(sense)
+        self.rhs.append(rhs)
+        return len(self.row_names) - 1
+    
+    def add_entry(self, row, col, value):
+        """Añade un coeficiente de la matriz de restricciones."""
+        self.entry_rows.append(row)
+        self.entry_cols.append(col)
+        self.entry_values.append(value)
+    
+    def to_spec(self):
+        """
+        Convierte lo leído en argumentos de LPModel.from_arrays.
+        
+        Returns:
+            dict: sense, c, A, senses, b, variable_names, integer_vars,
+                  constraint_names, lower_bounds y upper_bounds
+        """
+        num_rows = len(self.row_names)
+        rows = np.frombuffer(self.entry_rows, dtype=np.int64) if self.entry_rows else np.zeros(0, dtype=np.int64)
+        cols = np.frombuffer(self.entry_cols, dtype=np.int64) if self.entry_cols else np.zeros(0, dtype=np.int64)
+        values = np.frombuffer(self.entry_values, dtype=float) if self.entry_values else np.zeros(0)
+        order = np.lexsort((cols, rows))
+        indices, data = cols[order], values[order]
+        counts = np.bincount(rows, minlength=num_rows)
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        
+        senses, rhs, names = list(self.senses), list(self.rhs), list(self.row_names)
+        extra_indices, extra_data, extra_counts = [], [], []
+        
+        # RANGES: la fila queda acotada por ambos lados con una segunda restricción
+        for i, value in sorted(self.ranges.items()):
+            lower_rhs, upper_rhs = _range_limits(senses[i], rhs[i], value)
+            if lower_rhs == upper_rhs:
+                continue
+            senses[i], rhs[i] = '>=', lower_rhs
+            start, end = indptr[i], indptr[i + 1]
+            extra_indices.append(indices[start:end])
+            extra_data.append(data[start:end])
+            extra_counts.append(end - start)
+            senses.append('<=')
+            rhs.append(upper_rhs)
+            names.append(f"{names[i]}_rango")
+        
+        if extra_counts:
+            indices = np.concatenate([indices] + extra_indices)
+            data = np.concatenate([data] + extra_data)
+            indptr = np.concatenate([indptr, indptr[-1] + np.cumsum(extra_counts)])
+        
+        shape = (len(senses), len(self.variable_names))
+        return {
+            'sense': self.sense,
+            'c': np.asarray(self.objective, dtype=float),
+            'A': _sparse_matrix(data, indices, indptr, shape),
+            'senses': senses,
+            'b': np.asarray(rhs, dtype=float),
+            'variable_names': list(self.variable_names),
+            'integer_vars': list(self.integer),
+            'constraint_names': names,
+            'lower_bounds': np.asarray(self.lower, dtype=float),
+            'upper_bounds': np.asarray(self.upper, dtype=float)
+        }
+
+
+def _range_limits(sense, rhs, value):
+    """Límites [inferior, superior] de una fila con RANGES según la norma MPS."""
+    if sense == '<=':
+        return rhs - abs(value), rhs
+    if sense == '>=':
+        return rhs, rhs + abs(value)
+    if value >= 0:
+        return rhs, rhs + value
+    return rhs + value, rhs
+
+
+def _sparse_matrix(data, indices, indptr, shape):
+    """Matriz CSR de SciPy, o densa si SciPy no está instalado."""
+    if csr_matrix is not None:
+        return csr_matrix((data, indices, indptr), shape=shape)
+    dense = np.zeros(shape)
+    rows = np.repeat(np.arange(shape[0]), np.diff(indptr))
+    np.add.at(dense, (rows, indices), data)
+    return dense
+
+
+# ---------------------------------------------------------------------------
+# MPS
+# ---------------------------------------------------------------------------
+
+def read_mps(path):
+    """
+    Lee un archivo MPS (formato fijo o libre, sin espacios en los nombres).
+    
+    Args:
+        path (str): Ruta del archivo
+    
+    Returns:
+        dict: Argumentos para LPModel.from_arrays
+    
+    Raises:
+        ValueError: Si el archivo no es válido o usa algo que el modelo no admite
+    """
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return parse_mps(f)
+
+
+def parse_mps(lines):
+    """
+    Interpreta un modelo MPS línea por línea.
+    
+    Args:
+        lines (iterable): Líneas del archivo
+    
+    Returns:
+        dict: Argumentos para LPModel.from_arrays
+    
+    Raises:
+        ValueError: Si el contenido no es válido o usa algo que el modelo no admite
+    """
+    model = _ModelBuilder()
+    rows = {}  # Nombre -> posición de las restricciones
+    objective_row = None
+    free_rows = set()  # Filas N adicionales (se ignoran)
+    section = None
+    in_integer_block = False
+    rhs_set = range_set = bound_set = None
+    # Acceso directo a los arreglos de coeficientes para la sección COLUMNS
+    append_row = model.entry_rows.append
+    append_col = model.entry_cols.append
+    append_value = model.entry_values.append
+    objective = model.objective
+    last_column, j = None, None
+    
+    for number, line in enumerate(lines, 1):
+        fields = line.split()
+        if not fields or line[0] == '*':
+            continue
+        
+        try:
+            if section == 'COLUMNS' and line[0].isspace():
+                # La sección más larga: cada columna ocupa líneas consecutivas
+                if fields[1] == "'MARKER'":
+                    in_integer_block = fields[2] == "'INTORG'"
+                    last_column = None
+                    continue
+                if fields[0] != last_column:
+                    last_column = fields[0]
+                    j = model.column(last_column, in_integer_block)
+                for k in range(1, len(fields) - 1, 2):
+                    row = rows.get(fields[k])
+                    value = float(fields[k + 1])
+                    if row is not None:
+                        if value != 0:
+                            append_row(row)
+                            append_col(j)
+                            append_value(value)
+                    elif fields[k] == objective_row:
+                        objective[j] += value
+                    elif fields[k] not in free_rows:
+                        raise ValueError(f"fila '{fields[k]}' no declarada")
+                continue
+            
+            if not line[0].isspace():
+                section = fields[0].upper()
+                if section not in MPS_SECTIONS:
+                    raise ValueError(f"sección '{fields[0]}' no soportada")
+                if section == 'ENDATA':
+                    break
+                if section == 'OBJSENSE' and len(fields) > 1:
+                    model.sense = _mps_sense(fields[1])
+                continue
+            
+            if section == 'OBJSENSE':
+                model.sense = _mps_sense(fields[0])
+            
+            elif section == 'ROWS':
+                row_type, name = fields[0].upper(), fields[1]
+                if row_type == 'N':
+                    if objective_row is None:
+                        objective_row = name
+                    else:
+                        free_rows.add(name)
+                elif row_type in MPS_SENSES:
+                    rows[name] = model.add_row(name, MPS_SENSES[row_type])
+                else:
+                    raise ValueError(f"tipo de fila '{fields[0]}' no válido")
+            
+            elif section in ('RHS', 'RANGES'):
+                # El nombre del conjunto es opcional en MPS libre
+                start = len(fields) % 2
+                set_name = fields[0] if start else None
+                if section == 'RHS':
+                    rhs_set = set_name if rhs_set is None else rhs_set
+                    if set_name != rhs_set:
+                        continue
+                else:
+                    range_set = set_name if range_set is None else range_set
+                    if set_name != range_set:
+                        continue
+                for k in range(start, len(fields) - 1, 2):
+                    row_name, value = fields[k], float(fields[k + 1])
+                    if row_name == objective_row:
+                        if section == 'RHS' and value != 0:
+                            raise ValueError("constante en la función objetivo no soportada")
+                    elif row_name in rows:
+                        if section == 'RHS':
+                            model.rhs[rows[row_name]] = value
+                        else:
+                            model.ranges[rows[row_name]] = value
+                    elif row_name not in free_rows:
+                        raise ValueError(f"fila '{row_name}' no declarada")
+            
+            elif section == 'BOUNDS':
+                bound_type = fields[0].upper()
+                # El nombre del conjunto y el valor son opcionales según el tipo
+                if fields[-1] in model.columns and bound_type in ('FR', 'MI', 'PL', 'BV'):
+                    col_name, value, set_name = fields[-1], None, fields[1] if len(fields) > 2 else None
+                else:
+                    col_name, value = fields[-2], float(fields[-1])
+                    set_name = fields[1] if len(fields) > 3 else None
+                bound_set = set_name if bound_set is None else bound_set
+                if set_name != bound_set:
+                    continue
+                if col_name not in model.columns:
+                    raise ValueError(f"variable '{col_name}' no declarada")
+                _apply_mps_bound(model, model.columns[col_name], bound_type, value)
+            
+            else:
+                raise ValueError("dato fuera de una sección")
+        
+        except (IndexError, ValueError) as e:
+            detail = str(e) if isinstance(e, ValueError) else "faltan campos"
+            raise ValueError(f"MPS, línea {number}: {detail}") from None
+    
+    if objective_row is None and not model.variable_names:
+        raise ValueError("MPS: el archivo no contiene un modelo.")
+    return model.to_spec()
+
+
+def _mps_sense(text):
+    """Sentido de la función objetivo de una sección OBJSENSE."""
+    text = text.upper()
+    if text in ('MAX', 'MAXIMIZE'):
+        return 'Maximizar'
+    if text in ('MIN', 'MINIMIZE'):
+        return 'Minimizar'
+    raise ValueError(f"sentido '{text}' no válido")
+
+
+def _apply_mps_bound(model, j, bound_type, value):
+    """Aplica una línea de la sección BOUNDS a la variable j."""
+    if bound_type == 'UP':
+        if value < 0 and model.lower[j] == 0:
+            # Norma MPS: una cota superior negativa hace libre la cota inferior
+            model.lower[j] = -math.inf
+        model.upper[j] = value
+    elif bound_type == 'LO':
+        model.lower[j] = value
+    elif bound_type == 'FX':
+        model.lower[j] = model.upper[j] = value
+    elif bound_type in ('FR', 'MI'):
+        model.lower[j] = -math.inf
+    elif bound_type == 'PL':
+        model.upper[j] = math.inf
+    elif bound_type == 'BV':
+        model.integer[j] = True
+        model.lower[j], model.upper[j] = 0.0, 1.0
+    elif bound_type == 'LI':
+        model.integer[j] = True
+        model.lower[j] = value
+    elif bound_type == 'UI':
+        model.integer[j] = True
+        model.upper[j] = value
+    else:
+        raise ValueError(f"tipo de cota '{bound_type}' no soportado")
+
+
+def write_mps(model, path, name="PROBLEMA_PL"):
+    """
+    Escribe un modelo en formato MPS (columnas alineadas, legible como MPS libre).
+    
+    Args:
+        model (LPModel): Modelo construido
+        path (str): Ruta del archivo
+        name (str): Nombre del problema en la cabecera
+    """
+    arrays = model.to_arrays()
+    variable_names = [_mps_name(n) for n in arrays['variable_names']]
+    row_names = [_mps_name(n) for n in arrays['constraint_names']]
+    c, integer = arrays['c'], arrays['integer']
+    num_cols = len(c)
+    
+    # Recorrido por columnas: índices de los coeficientes ordenados por columna
+    rows_of = np.repeat(np.arange(len(row_names)), np.diff(arrays['indptr']))
+    order = np.argsort(arrays['indices'], kind='stable')
+    col_rows = rows_of[order].tolist()
+    col_values = arrays['data'][order].tolist()
+    col_ptr = np.zeros(num_cols + 1, dtype=np.int64)
+    np.cumsum(np.bincount(arrays['indices'], minlength=num_cols), out=col_ptr[1:])
+    col_ptr = col_ptr.tolist()
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"NAME          {_mps_name(name)}\n")
+        f.write("OBJSENSE\n")
+        f.write(f"    {'MAX' if arrays['sense'] == 'Maximizar' else 'MIN'}\n")
+        f.write("ROWS\n N  OBJ\n")
+        for row_name, sense in zip(row_names, arrays['senses']):
+            f.write(f" {MPS_ROW_TYPES[sense]}  {row_name}\n")
+        
+        f.write("COLUMNS\n")
+        in_integer_block = False
+        for j in range(num_cols):
+            if bool(integer[j]) != in_integer_block:
+                in_integer_block = bool(integer[j])
+                marker = "'INTORG'" if in_integer_block else "'INTEND'"
+                f.write(f"    MARKER                 'MARKER'                 {marker}\n")
+            column = variable_names[j]
+            start, end = col_ptr[j], col_ptr[j + 1]
+            # El coeficiente objetivo se escribe aunque sea cero si la columna
+            # no aparece en ninguna fila, para no perder la variable
+            if c[j] != 0 or start == end:
+                f.write(f"    {column:<10}{'OBJ':<10}{_number(c[j]):>14}\n")
+            for k in range(start, end):
+                f.write(f"    {column:<10}{row_names[col_rows[k]]:<10}{_number(col_values[k]):>14}\n")
+        if in_integer_block:
+            f.write("    MARKER                 'MARKER'                 'INTEND'\n")
+        
+        f.write("RHS\n")
+        for row_name, value in zip(row_names, arrays['b'].tolist()):
+            if value != 0:
+                f.write(f"    {'RHS':<10}{row_name:<10}{_number(value):>14}\n")
+        
+        bounds = [
+            (bound_type, variable_names[j], value)
+            for j, (lower, upper) in enumerate(zip(arrays['lower'].tolist(), arrays['upper'].tolist()))
+            for bound_type, value in _mps_bounds(lower, upper, integer[j])
+        ]
+        if bounds:
+            f.write("BOUNDS\n")
+            for bound_type, column, value in bounds:
+                if value is None:
+                    f.write(f" {bound_type} {'BND':<10}{column}\n")
+                else:
+                    f.write(f" {bound_type} {'BND':<10}{column:<10}{_number(value):>14}\n")
+        f.write("ENDATA\n")
+
+
+def _mps_bounds(lower, upper, integer):
+    """
+    Líneas BOUNDS (tipo, valor) de una variable; ninguna si es no negativa y
+    sin cota superior.
+    """
+    if lower == upper:
+        return [('FX', lower)]
+    if lower == -math.inf:
+        bounds = [('FR', None)] if upper == math.inf else [('MI', None)]
+    elif lower != 0:
+        bounds = [('LO', lower)]
+    else:
+        bounds = []
+    if upper < math.inf:
+        bounds.append(('UP', upper))
+    elif integer and lower != -math.inf:
+        # Sin cota superior explícita algunos lectores asumen enteras binarias
+        bounds.append(('PL', None))
+    return bounds
+
+
+def _mps_name(name):
+    """Nombre sin espacios (separan los campos en MPS)."""
+    return re.sub(r"\s+", "_", str(name)) or "_"
+
+
+# ---------------------------------------------------------------------------
+# CPLEX LP
+# ---------------------------------------------------------------------------
+
+def read_lp(path):
+    """
+    Lee un archivo en formato CPLEX LP.
+    
+    Args:
+        path (str): Ruta del archivo
+    
+    Returns:
+        dict: Argumentos para LPModel.from_arrays
+    
+    Raises:
+        ValueError: Si el archivo no es válido o usa algo que el modelo no admite
+    """
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return parse_lp(f)
+
+
+def parse_lp(lines):
+    """
+    Interpreta un modelo en formato CPLEX LP línea por línea.
+    
+    Las restricciones pueden ocupar varias líneas; cada una se convierte en
+    coeficientes en cuanto se lee su lado derecho.
+    
+    Args:
+        lines (iterable): Líneas del archivo
+    
+    Returns:
+        dict: Argumentos para LPModel.from_arrays
+    
+    Raises:
+        ValueError: Si el contenido no es válido o usa algo que el modelo no admite
+    """
+    model = _ModelBuilder()
+    section = None
+    objective_tokens = []
+    pending = []  # Fichas de la restricción que se está leyendo
+    seen_section = False
+    
+    number = 0
+    try:
+        for number, line in enumerate(lines, 1):
+            line = line.split('\\', 1)[0]
+            match = _LP_SECTION.match(line)
+            if match:
+                if section == 'constraints' and pending:
+                    raise ValueError("restricción incompleta")
+                if section == 'objective':
+                    _lp_objective(model, objective_tokens)
+                    objective_tokens = []
+                section = _lp_section(match.group(1))
+                seen_section = True
+                if section == 'end':
+                    break
+                if section in ('max', 'min'):
+                    model.sense = 'Maximizar' if section == 'max' else 'Minimizar'
+                    section = 'objective'
+                line = line[match.end():]
+            
+            tokens = _lp_tokens(line)
+            if not tokens:
+                continue
+            if section == 'objective':
+                objective_tokens.extend(tokens)
+            elif section == 'constraints':
+                pending.extend(tokens)
+                pending = _lp_constraints(model, pending)
+            elif section == 'bounds':
+                _lp_bound(model, tokens)
+            elif section in ('generals', 'binaries'):
+                for kind, text in tokens:
+                    if kind != 'name':
+                        raise ValueError(f"se esperaba un nombre de variable, no '{text}'")
+                    j = model.column(text)
+                    model.integer[j] = True
+                    if section == 'binaries':
+                        model.upper[j] = 1.0
+            else:
+                raise ValueError("dato fuera de una sección")
+        
+        if pending:
+            raise ValueError("restricción incompleta al final del archivo")
+        if section == 'objective':
+            _lp_objective(model, objective_tokens)
+    except ValueError as e:
+        raise ValueError(f"LP, línea {number}: {e}") from None
+    
+    if not seen_section:
+        raise ValueError("LP: el archivo no contiene un modelo.")
+    return model.to_spec()
+
+
+def _lp_objective(model, tokens):
+    """Registra la función objetivo; sus variables son las primeras columnas."""
+    if tokens[1:2] == [('colon', ':')]:
+        tokens = tokens[2:]
+    terms, constant = _lp_linear(tokens)
+    if constant != 0:
+        raise ValueError("constante en la función objetivo no soportada")
+    for name, coef in terms:
+        model.objective[model.column(name)] += coef
+
+
+def _lp_section(keyword):
+    """Nombre interno de la sección a partir de su palabra clave."""
+    keyword = re.sub(r"\s+", " ", keyword.lower())
+    if keyword.startswith('max'):
+        return 'max'
+    if keyword.startswith('min'):
+        return 'min'
+    if keyword in ('subject to', 'such that', 's.t.', 'st'):
+        return 'constraints'
+    if keyword.startswith('bound'):
+        return 'bounds'
+    if keyword.startswith('gen') or keyword.startswith('integer'):
+        return 'generals'
+    if keyword.startswith('bin'):
+        return 'binaries'
+    if keyword == 'end':
+        return 'end'
+    raise ValueError(f"sección '{keyword}' no soportada")
+
+
+def _lp_tokens(line):
+    """Divide una línea en fichas (tipo, texto)."""
+    return [(_LP_KINDS.get(text[0], 'name'), text) for text in _LP_TOKEN.findall(line)]
+
+
+def _lp_linear(tokens):
+    """
+    Interpreta una expresión lineal.
+    
+    Returns:
+        tuple: (lista de (variable, coeficiente), constante)
+    """
+    terms, constant = [], 0.0
+    sign, coef = 1.0, None
+    for kind, text in tokens:
+        if kind == 'sign':
+            if coef is not None:
+                # Un número sin variable es un término constante
+                constant += sign * coef
+                sign, coef = 1.0, None
+            if text == '-':
+                sign = -sign
+        elif kind == 'number':
+            if coef is not None:
+                raise ValueError(f"número inesperado '{text}'")
+            coef = float(text)
+        elif kind == 'name':
+            terms.append((text, sign * (1.0 if coef is None else coef)))
+            sign, coef = 1.0, None
+        else:
+            raise ValueError(f"'{text}' inesperado en una expresión")
+    if coef is not None:
+        constant += sign * coef
+    return terms, constant
+
+
+def _lp_constraints(model, tokens):
+    """
+    Convierte en restricciones todas las que estén completas en tokens.
+    
+    Returns:
+        list: Fichas sobrantes (restricción que continúa en la línea siguiente)
+    """
+    while True:
+        op = next((k for k, (kind, _) in enumerate(tokens) if kind == 'op'), None)
+        if op is None:
+            return tokens
+        # Lado derecho: signo opcional y un número
+        end = op + 1
+        sign = 1.0
+        while end < len(tokens) and tokens[end][0] == 'sign':
+            sign = -sign if tokens[end][1] == '-' else sign
+            end += 1
+        if end >= len(tokens):
+            return tokens
+        kind, text = tokens[end]
+        if kind != 'number':
+            raise ValueError("el lado derecho de una restricción debe ser un número")
+        rhs = sign * float(text)
+        
+        body = tokens[:op]
+        name = None
+        if len(body) >= 2 and body[0][0] == 'name' and body[1][0] == 'colon':
+            name, body = body[0][1], body[2:]
+        terms, constant = _lp_linear(body)
+        row = model.add_row(name or f"R{len(model.row_names) + 1}", LP_OPERATORS[tokens[op][1]], rhs - constant)
+        for var_name, coef in terms:
+            if coef != 0:
+                model.add_entry(row, model.column(var_name), coef)
+        tokens = tokens[end + 1:]
+
+
+def _lp_bound(model, tokens):
+    """Aplica una línea de la sección Bounds."""
+    if len(tokens) == 2 and tokens[0][0] == 'name' and tokens[1][1].lower() == 'free':
+        model.lower[model.column(tokens[0][1])] = -math.inf
+        return
+    
+    # Se agrupan los signos con el número siguiente: a op x [op b]
+    items, sign = [], 1.0
+    for kind, text in tokens:
+        if kind == 'sign':
+            sign = -sign if text == '-' else sign
+        elif kind == 'number':
+            items.append(('value', sign * float(text)))
+            sign = 1.0
+        elif kind == 'name' and text.lower() in ('inf', 'infinity'):
+            items.append(('value', sign * math.inf))
+            sign = 1.0
+        else:
+            items.append((kind, text))
+    
+    if len(items) == 3 and items[0][0] == 'name' and items[1][0] == 'op' and items[2][0] == 'value':
+        _set_lp_bound(model, items[0][1], LP_OPERATORS[items[1][1]], items[2][1])
+    elif len(items) == 3 and items[0][0] == 'value' and items[1][0] == 'op' and items[2][0] == 'name':
+        flipped = {'<=': '>=', '>=': '<=', '=': '='}[LP_OPERATORS[items[1][1]]]
+        _set_lp_bound(model, items[2][1], flipped, items[0][1])
+    elif (len(items) == 5 and [kind for kind, _ in items] == ['value', 'op', 'name', 'op', 'value']
+          and LP_OPERATORS[items[1][1]] == LP_OPERATORS[items[3][1]] == '<='):
+        _set_lp_bound(model, items[2][1], '>=', items[0][1])
+        _set_lp_bound(model, items[2][1], '<=', items[4][1])
+    else:
+        raise ValueError("cota no válida")
+
+
+def _set_lp_bound(model, name, sense, value):
+    """Fija la cota de una variable: x <= v, x >= v o x = v."""
+    j = model.column(name)
+    if sense in ('>=', '='):
+        model.lower[j] = value
+    if sense in ('<=', '='):
+        model.upper[j] = value
+
+
+def write_lp(model, path):
+    """
+    Escribe un modelo en formato CPLEX LP.
+    
+    Args:
+        model (LPModel): Modelo construido
+        path (str): Ruta del archivo
+    """
+    arrays = model.to_arrays()
+    variable_names = [_lp_name(n, 'x') for n in arrays['variable_names']]
+    indptr, indices, data = arrays['indptr'].tolist(), arrays['indices'].tolist(), arrays['data'].tolist()
+    c = arrays['c'].tolist()
+    
+    # Las variables que no aparecen en ninguna fila se escriben con su
+    # coeficiente objetivo aunque sea cero, para no perderlas
+    used = np.zeros(len(c), dtype=bool)
+    used[arrays['indices']] = True
+    objective = [(j, coef) for j, coef in enumerate(c) if coef != 0 or not used[j]]
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("Maximize\n" if arrays['sense'] == 'Maximizar' else "Minimize\n")
+        f.write(" obj:")
+        _write_lp_terms(f, objective, variable_names)
+        f.write("\nSubject To\n")
+        for i, (row_name, sense, rhs) in enumerate(zip(arrays['constraint_names'], arrays['senses'], arrays['b'].tolist())):
+            f.write(f" {_lp_name(row_name, 'R')}:")
+            start, end = indptr[i], indptr[i + 1]
+            _write_lp_terms(f, zip(indices[start:end], data[start:end]), variable_names)
+            f.write(f" {sense} {_number(rhs)}\n")
+        
+        bounds = [
+            _lp_bound_line(variable_names[j], lower, upper)
+            for j, (lower, upper) in enumerate(zip(arrays['lower'].tolist(), arrays['upper'].tolist()))
+            if lower != 0 or upper != math.inf
+        ]
+        if bounds:
+            f.write("Bounds\n")
+            f.writelines(bounds)
+        
+        integer = np.flatnonzero(arrays['integer']).tolist()
+        if integer:
+            f.write("Generals\n")
+            for k in range(0, len(integer), LP_TERMS_PER_LINE):
+                f.write(" " + " ".join(variable_names[j] for j in integer[k:k + LP_TERMS_PER_LINE]) + "\n")
+        f.write("End\n")
+
+
+def _lp_bound_line(name, lower, upper):
+    """Línea de la sección Bounds: 'x free', 'x = v', 'l <= x <= u' o 'x >= l'."""
+    if lower == upper:
+        return f" {name} = {_number(lower)}\n"
+    if lower == -math.inf and upper == math.inf:
+        return f" {name} free\n"
+    if upper == math.inf:
+        return f" {name} >= {_number(lower)}\n"
+    low = "-inf" if lower == -math.inf else _number(lower)
+    return f" {low} <= {name} <= {_number(upper)}\n"
+
+
+def _write_lp_terms(f, terms, variable_names):
+    """Escribe ' + 3 x1 - 2 x2 ...' partiendo las líneas largas."""
+    count = 0
+    for j, coef in terms:
+        if count and count % LP_TERMS_PER_LINE == 0:
+            f.write("\n   ")
+        sign = ' -' if coef < 0 else ' +' if count else ''
+        f.write(f"{sign} {_number(abs(coef))} {variable_names[j]}")
+        count += 1
+    if count == 0:
+        f.write(" 0")
+
+
+def _lp_name(name, prefix):
+    """Nombre válido en formato LP: sin operadores ni espacios y sin empezar con número."""
+    name = _LP_NAME_INVALID.sub("_", str(name))
+    if not name or name[0].isdigit() or name[0] == '.' or _LP_SECTION.fullmatch(name):
+        name = prefix + "_" + name
+    return name
+
+
+def _number(value):
+    """Número con precisión suficiente para reproducir el valor original."""
+    value = float(value)
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
@@ -0,0 +1,218 @@
+"""
+Lectura de archivos de problema para el modo sin interfaz gráfica.
+
+Formato JSON:
+    
+    {
+        "sense": "Maximizar",
+        "variables": ["Mesas", "Sillas"],
+        "types": ["Continua", "Entera"],
+        "lower": [0, 2],
+        "upper": [null, 10],
+        "objective": [3, 5],
+        "constraints": [
+            {"name": "R1", "coefficients": [1, 2], "type": "<=", "rhs": 20}
+        ]
+    }
+
+"variables", "types", "lower", "upper" y los nombres de restricción son
+opcionales. "types" admite 'Continua', 'Entera' y 'Binaria' (entera con cotas
+0 y 1), también en inglés; en lugar de "types" puede darse "integer" con un
+booleano por variable. Sin "lower" las variables son no negativas; null en
+"lower" o "upper" indica que la variable no tiene esa cota.
+
+También se leen archivos MPS (.mps) y CPLEX LP (.lp), ver model_formats.py,
+y proyectos binarios (.npz), ver project_files.py.
+"""
+
+import json
+import os
+
+from .model_formats import read_lp, read_mps
+from .project_files import PROJECT_EXTENSION, load_project, project_to_spec
+
+
+SENSE_ALIASES = {
+    'maximizar': 'Maximizar',
+    'max': 'Maximizar',
+    'maximize': 'Maximizar',
+    'minimizar': 'Minimizar',
+    'min': 'Minimizar',
+    'minimize': 'Minimizar'
+}
+
+TYPE_ALIASES = {
+    'continua': 'Continua',
+    'continuous': 'Continua',
+    'entera': 'Entera',
+    'integer': 'Entera',
+    'binaria': 'Binaria',
+    'binary': 'Binaria'
+}
+
+
+def read_problem_file(path):
+    """
+    Lee un archivo de problema y lo devuelve en forma matricial.
+    
+    Args:
+        path (str): Ruta del archivo (.json, .mps, .lp o .npz)
+    
+    Returns:
+        dict: Argumentos para LPModel.from_arrays (sense, c, A, senses, b,
+              variable_names, integer_vars, constraint_names, lower_bounds,
+              upper_bounds)
+    
+    Raises:
+        ValueError: Si el archivo no tiene un formato válido
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.mps':
+        return read_mps(path)
+    if extension == '.lp':
+        return read_lp(path)
+    if extension == PROJECT_EXTENSION:
+        return project_to_spec(load_project(path))
+    if extension != '.json':
+        raise ValueError(f"Formato de archivo no soportado: '{extension}'")
+    
+    with open(path, encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON inválido en '{path}': {e}")
+    
+    return parse_problem_dict(data)
+
+
+def parse_problem_dict(data):
+    """
+    Convierte un problema en forma de diccionario (formato JSON) a forma matricial.
+    
+    Args:
+        data (dict): Problema con las claves del formato JSON
+    
+    Returns:
+        dict: Argumentos para LPModel.from_arrays
+    
+    Raises:
+        ValueError: Si falta algún campo, tiene un tipo no válido o las
+            dimensiones no coinciden
+    """
+    if not isinstance(data, dict):
+        raise ValueError("El problema debe ser un objeto JSON con los campos 'sense' y 'objective'.")
+    try:
+        sense = SENSE_ALIASES[str(data['sense']).strip().lower()]
+    except KeyError:
+        raise ValueError("El campo 'sense' debe ser 'Maximizar' o 'Minimizar'.")
+    
+    if 'objective' not in data:
+        raise ValueError("Falta el campo 'objective'.")
+    objective = _number_list(data['objective'], "El campo 'objective'")
+    num_vars = len(objective)
+    
+    constraints = data.get('constraints', [])
+    if not isinstance(constraints, list):
+        raise ValueError("El campo 'constraints' debe ser una lista de restricciones.")
+    A, senses, b, constraint_names = [], [], [], []
+    for i, constraint in enumerate(constraints):
+        field = f"La restricción {i+1}"
+        if not isinstance(constraint, dict):
+            raise ValueError(f"{field} debe ser un objeto con 'coefficients', 'type' y 'rhs'.")
+        for key in ('coefficients', 'rhs'):
+            if key not in constraint:
+                raise ValueError(f"Falta el campo '{key}' en la restricción {i+1}.")
+        coefficients = _number_list(constraint['coefficients'], f"El campo 'coefficients' de la restricción {i+1}")
+        if len(coefficients) != num_vars:
+            raise ValueError(
+                f"{field} tiene {len(coefficients)} coeficientes, "
+                f"se esperaban {num_vars}."
+            )
+        constraint_type = constraint.get('type', '<=')
+        if constraint_type not in ('<=', '>=', '='):
+            raise ValueError(f"{field} tiene un tipo no válido: {constraint_type!r}. Opciones: <=, >=, =.")
+        A.append(coefficients)
+        senses.append(constraint_type)
+        b.append(_number(constraint['rhs'], f"El campo 'rhs' de la restricción {i+1}"))
+        constraint_names.append(str(constraint.get('name', f"R{i+1}")))
+    
+    for key in ('variables', 'integer'):
+        if data.get(key) is not None and not isinstance(data[key], list):
+            raise ValueError(f"El campo '{key}' debe ser una lista con un valor por variable.")
+    
+    lower_bounds = _variable_list(data, 'lower', num_vars)
+    upper_bounds = _variable_list(data, 'upper', num_vars)
+    integer_vars = data.get('integer')
+    types = _variable_list(data, 'types', num_vars)
+    if types is not None:
+        try:
+            types = [TYPE_ALIASES[str(var_type).strip().lower()] for var_type in types]
+        except KeyError as e:
+            raise ValueError(f"Tipo de variable no válido: {e}. Opciones: Continua, Entera, Binaria.")
+        integer_vars = [var_type != 'Continua' for var_type in types]
+        # Las binarias son enteras con cotas 0 y 1
+        binary = [j for j, var_type in enumerate(types) if var_type == 'Binaria']
+        if binary:
+            lower_bounds = list(lower_bounds) if lower_bounds is not None else [0.0] * num_vars
+            upper_bounds = list(upper_bounds) if upper_bounds is not None else [None] * num_vars
+            for j in binary:
+                lower_bounds[j], upper_bounds[j] = 0.0, 1.0
+    
+    return {
+        'sense': sense,
+        'c': objective,
+        'A': A,
+        'senses': senses,
+        'b': b,
+        'variable_names': data.get('variables'),
+        'integer_vars': integer_vars,
+        'constraint_names': constraint_names,
+        'lower_bounds': lower_bounds,
+        'upper_bounds': upper_bounds
+    }
+
+
+def _variable_list(data, key, num_vars):
+    """
+    Lista opcional con un valor por variable.
+    
+    Raises:
+        ValueError: Si no es una lista o no tiene un valor por variable
+    """
+    values = data.get(key)
+    if values is None:
+        return None
+    if not isinstance(values, list):
+        raise ValueError(f"El campo '{key}' debe ser una lista con un valor por variable.")
+    if len(values) != num_vars:
+        raise ValueError(f"El campo '{key}' tiene {len(values)} valores, se esperaban {num_vars}.")
+    if key in ('lower', 'upper'):
+        return [None if value is None else _number(value, f"El campo '{key}'") for value in values]
+    return values
+
+
+def _number_list(values, field):
+    """
+    Lista de números de un campo.
+    
+    Raises:
+        ValueError: Si no es una lista de números
+    """
+    if not isinstance(values, list):
+        raise ValueError(f"{field} debe ser una lista de números.")
+    return [_number(value, field) for value in values]
+
+
+def _number(value, field):
+    """
+    Número de un campo (se aceptan también textos numéricos).
+    
+    Raises:
+        ValueError: Si el valor no es un número
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"{field} debe ser numérico, no {json.dumps(value)}.")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} debe ser numérico, no {json.dumps(value)}.")
@@ -0,0 +1,252 @@
+"""
+Archivos de proyecto binarios (.npz) con matrices mapeadas en memoria.
+
+Un proyecto es un contenedor .npz sin comprimir (np.savez) con:
+    
+    metadata  JSON en bytes: formato, versión, sentido, nombres de variables
+              y restricciones, variables enteras y tipos de restricción
+    c         coeficientes de la función objetivo (n)
+    indptr    A en CSR: inicio de cada fila (m + 1)
+    indices   A en CSR: columna de cada coeficiente
+    data      A en CSR: valor de cada coeficiente
+    b         lados derechos (m)
+    lower     cotas inferiores de las variables (n, -inf si no tienen)
+    upper     cotas superiores de las variables (n, inf si no tienen)
+
+Los proyectos de la versión 1 no tienen lower ni upper: sus variables son no
+negativas.
+
+Como los miembros se guardan sin comprimir, load_project mapea cada arreglo
+directamente desde el archivo (np.memmap): abrir un modelo grande no lee la
+matriz, y solo se cargan las páginas que se consultan (por ejemplo, las
+celdas visibles de la tabla).
+"""
+
+import json
+import os
+import stat
+import struct
+import tempfile
+import zipfile
+
+import numpy as np
+
+try:
+    from scipy.sparse import csr_matrix
+except ImportError:  # SciPy es opcional
+    csr_matrix = None
+
+
+PROJECT_FORMAT = 'lp-solver-project'
+PROJECT_VERSION = 2
+PROJECT_EXTENSION = '.npz'
+
+ARRAY_MEMBERS = ('c', 'indptr', 'indices', 'data', 'b')
+
+# Cabecera local de un miembro ZIP: 30 bytes fijos + nombre + campo extra
+_ZIP_LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+_ZIP_LOCAL_SIGNATURE = 0x04034b50
+
+
+def save_project(path, arrays):
+    """
+    Guarda un modelo en un archivo de proyecto.
+    
+    Args:
+        path (str): Ruta del archivo (.npz)
+        arrays (dict): Modelo en el formato de LPModel.to_arrays()
+    """
+    num_cols = len(arrays['c'])
+    index_type = np.int32 if num_cols < 2 ** 31 else np.int64
+    metadata = {
+        'format': PROJECT_FORMAT,
+        'version': PROJECT_VERSION,
+        'sense': arrays['sense'],
+        'variable_names': list(arrays['variable_names']),
+        'constraint_names': list(arrays['constraint_names']),
+        'integer': [bool(flag) for flag in arrays['integer']],
+        'senses': list(arrays['senses'])
+    }
+    members = {
+        'metadata': np.frombuffer(json.dumps(metadata, ensure_ascii=False).encode('utf-8'), dtype=np.uint8),
+        'c': np.asarray(arrays['c'], dtype=float),
+        'indptr': np.asarray(arrays['indptr'], dtype=np.int64),
+        'indices': np.asarray(arrays['indices'], dtype=index_type),
+        'data': np.asarray(arrays['data'], dtype=float),
+        'b': np.asarray(arrays['b'], dtype=float),
+        'lower': np.asarray(arrays['lower'], dtype=float),
+        'upper': np.asarray(arrays['upper'], dtype=float)
+    }
+    # Se escribe aparte y se reemplaza al final: un proyecto abierto (mapeado
+    # en memoria) sigue viendo el archivo anterior aunque se guarde encima
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(suffix=PROJECT_EXTENSION, dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **members)
+        # mkstemp crea el archivo solo para el dueño (0600)
+        os.chmod(temporary, _file_mode(path))
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _file_mode(path):
+    """Permisos del archivo existente o, si no existe, los de uno nuevo según la umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def load_project(path, mmap=True):
+    """
+    Abre un archivo de proyecto.
+    
+    Args:
+        path (str): Ruta del archivo (.npz)
+        mmap (bool): Mapear los arreglos en memoria en lugar de leerlos
+    
+    Returns:
+        dict: Modelo en el formato de LPModel.to_arrays() (c, indptr, indices,
+              data, b, lower y upper son arreglos de solo lectura si mmap es True)
+    
+    Raises:
+        ValueError: Si el archivo no es un proyecto válido
+    """
+    try:
+        members = _map_members(path) if mmap else _read_members(path)
+    except (zipfile.BadZipFile, OSError, struct.error) as e:
+        raise ValueError(f"'{path}' no es un archivo de proyecto válido: {e}")
+    
+    missing = [name for name in ('metadata',) + ARRAY_MEMBERS if name not in members]
+    if missing:
+        raise ValueError(f"Al proyecto '{path}' le falta '{missing[0]}'.")
+    metadata = json.loads(bytes(members['metadata']).decode('utf-8'))
+    if metadata.get('format') != PROJECT_FORMAT:
+        raise ValueError(f"'{path}' no es un archivo de proyecto de esta aplicación.")
+    if metadata.get('version', 0) > PROJECT_VERSION:
+        raise ValueError(f"El proyecto '{path}' es de una versión más reciente de la aplicación.")
+    
+    num_rows, num_cols = len(members['b']), len(members['c'])
+    # Versión 1: variables no negativas, sin cotas guardadas
+    lower = members.get('lower', np.zeros(num_cols))
+    upper = members.get('upper', np.full(num_cols, np.inf))
+    if (len(members['indptr']) != num_rows + 1 or len(metadata['senses']) != num_rows
+            or len(metadata['variable_names']) != num_cols or len(lower) != num_cols
+            or len(upper) != num_cols):
+        raise ValueError(f"Las dimensiones del proyecto '{path}' no coinciden.")
+    
+    return {
+        'sense': metadata['sense'],
+        'c': members['c'],
+        'indptr': members['indptr'],
+        'indices': members['indices'],
+        'data': members['data'],
+        'senses': metadata['senses'],
+        'b': members['b'],
+        'integer': np.asarray(metadata['integer'], dtype=bool),
+        'lower': lower,
+        'upper': upper,
+        'variable_names': metadata['variable_names'],
+        'constraint_names': metadata['constraint_names']
+    }
+
+
+def project_to_spec(project):
+    """
+    Argumentos de LPModel.from_arrays para un proyecto abierto.
+    
+    Args:
+        project (dict): Resultado de load_project
+    
+    Returns:
+        dict: sense, c, A (dispersa si SciPy está instalado), senses, b,
+              variable_names, integer_vars, lower_bounds, upper_bounds y
+              constraint_names
+    """
+    shape = (len(project['b']), len(project['c']))
+    indptr, indices, data = project['indptr'], project['indices'], project['data']
+    if csr_matrix is not None:
+        A = csr_matrix((data, indices, indptr), shape=shape)
+    else:
+        A = np.zeros(shape)
+        A[np.repeat(np.arange(shape[0]), np.diff(indptr)), indices] = data
+    return {
+        'sense': project['sense'],
+        'c': project['c'],
+        'A': A,
+        'senses': project['senses'],
+        'b': project['b'],
+        'variable_names': project['variable_names'],
+        'integer_vars': project['integer'].tolist(),
+        'constraint_names': project['constraint_names'],
+        'lower_bounds': project['lower'],
+        'upper_bounds': project['upper']
+    }
+
+
+def coefficient(project, row, col):
+    """
+    Coeficiente A[row, col] de un proyecto sin materializar la matriz.
+    
+    Args:
+        project (dict): Resultado de load_project
+        row (int): Posición de la restricción
+        col (int): Posición de la variable
+    
+    Returns:
+        float: El coeficiente (0.0 si no está almacenado)
+    """
+    start, end = int(project['indptr'][row]), int(project['indptr'][row + 1])
+    columns = project['indices'][start:end]
+    k = int(np.searchsorted(columns, col))
+    if k < len(columns) and columns[k] == col:
+        return float(project['data'][start + k])
+    return 0.0
+
+
+def _map_members(path):
+    """Mapea en memoria cada arreglo .npy del contenedor sin descomprimirlo."""
+    members = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            if not info.filename.endswith('.npy'):
+                continue
+            name = info.filename[:-4]
+            if info.compress_type != zipfile.ZIP_STORED:
+                # Miembro comprimido (np.savez_compressed): se lee completo
+                with archive.open(info) as member:
+                    members[name] = np.lib.format.read_array(member)
+                continue
+            
+            f.seek(info.header_offset)
+            header = _ZIP_LOCAL_HEADER.unpack(f.read(_ZIP_LOCAL_HEADER.size))
+            if header[0] != _ZIP_LOCAL_SIGNATURE:
+                raise ValueError(f"cabecera ZIP inválida en '{info.filename}'")
+            f.seek(info.header_offset + _ZIP_LOCAL_HEADER.size + header[9] + header[10])
+            
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.hasobject:
+                raise ValueError(f"'{info.filename}' contiene objetos de Python")
+            if int(np.prod(shape)) == 0:
+                members[name] = np.empty(shape, dtype=dtype)
+            else:
+                members[name] = np.memmap(
+                    path, dtype=dtype, mode='r', offset=f.tell(), shape=shape,
+                    order='F' if fortran_order else 'C'
+                )
+    return members
+
+
+def _read_members(path):
+    """Lee todos los arreglos del contenedor en memoria."""
+    with np.load(path, allow_pickle=False) as archive:
+        return {name: archive[name] for name in archive.files}
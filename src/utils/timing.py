@@ -0,0 +1,136 @@
+"""
+Medición del tiempo de cada fase de una resolución (lectura de celdas,
+validación, construcción, escritura, resolución, lectura de la solución...).
+
+Variables de entorno:
+    LP_SOLVER_TIMINGS=1   Escribe en stderr los tiempos de cada resolución
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+# Nombres para mostrar de cada fase, en el orden en que ocurren
+PHASE_LABELS = {
+    'preview': "Vista del modelo",
+    'read': "Lectura de celdas",
+    'validate': "Validación",
+    'build': "Construcción",
+    'cache': "Caché",
+    'presolve': "Presolve",
+    'write': "Escritura",
+    'solve': "Resolución",
+    'postsolve': "Postsolve",
+    'parse': "Lectura de la solución",
+    'sensitivity': "Sensibilidad",
+    'format': "Formato",
+    'display': "Presentación",
+    'total': "Total"
+}
+
+
+class PhaseTimer:
+    """
+    Acumula el tiempo de cada fase con time.perf_counter.
+    
+    Cada fase se mide con el bloque with phase() o, para código secuencial,
+    con lap(), que cierra la fase en curso. Una fase que se mide varias veces
+    suma sus duraciones; el orden es el de su primera medición.
+    """
+    
+    def __init__(self):
+        """Inicializa el acumulador vacío y la marca de lap()."""
+        self.phases = {}
+        self._mark = time.perf_counter()
+    
+    def restart(self):
+        """Reinicia la marca desde la que mide lap()."""
+        self._mark = time.perf_counter()
+    
+    def lap(self, name):
+        """
+        Asigna a una fase el tiempo transcurrido desde la marca anterior.
+        
+        Args:
+            name (str): Nombre de la fase
+        """
+        now = time.perf_counter()
+        self.add(name, now - self._mark)
+        self._mark = now
+    
+    @contextmanager
+    def phase(self, name):
+        """
+        Mide el bloque with como parte de la fase dada.
+        
+        Args:
+            name (str): Nombre de la fase (ver PHASE_LABELS)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+    
+    def add(self, name, seconds):
+        """
+        Suma una duración a una fase.
+        
+        Args:
+            name (str): Nombre de la fase
+            seconds (float): Duración en segundos
+        """
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+    
+    def merge(self, timings):
+        """
+        Suma las fases de otro diccionario de tiempos.
+        
+        Args:
+            timings (dict): Segundos por fase
+        """
+        for name, seconds in timings.items():
+            self.add(name, seconds)
+    
+    def as_dict(self):
+        """dict: Copia de los segundos por fase."""
+        return dict(self.phases)
+
+
+def timings_enabled():
+    """bool: True si LP_SOLVER_TIMINGS pide registrar los tiempos."""
+    return os.environ.get("LP_SOLVER_TIMINGS", "").lower() in ("1", "on", "true", "yes")
+
+
+def format_timings(timings):
+    """
+    Formatea los tiempos como una línea por fase, en milisegundos.
+    
+    Args:
+        timings (dict): Segundos por fase
+    
+    Returns:
+        str: Texto con una fase por línea
+    """
+    ordered = [name for name in PHASE_LABELS if name in timings]
+    ordered += [name for name in timings if name not in PHASE_LABELS]
+    return "\n".join(
+        f"{PHASE_LABELS.get(name, name):<24}{timings[name] * 1000:>10.2f} ms"
+        for name in ordered
+    )
+
+
+def log_timings(timings, label):
+    """
+    Escribe los tiempos en stderr si LP_SOLVER_TIMINGS está activo.
+    
+    Args:
+        timings (dict): Segundos por fase
+        label (str): Origen de los tiempos (por ejemplo 'solve' o 'interfaz')
+    """
+    if not timings_enabled():
+        return
+    phases = " | ".join(f"{name} {seconds * 1000:.2f} ms" for name, seconds in timings.items())
+    print(f"[tiempos {label}] {phases}", file=sys.stderr)
@@ -2,6 +2,8 @@
 Funciones de validación para la entrada de datos del usuario.
 """
 
+import numpy as np
+
 
 def validate_float(value, field_name):
     """
@@ -27,3 +29,74 @@ def validate_float(value, field_name):
             f"El campo '{field_name}' debe ser un número válido.\n"
             f"Valor ingresado: '{value}'"
         )
+
+
+def validate_bound(value, field_name, upper=False):
+    """
+    Valida la cota de una variable.
+    
+    Una celda vacía o con '∞' indica que la variable no tiene esa cota; en la
+    cota inferior '-∞' significa lo mismo.
+    
+    Args:
+        value (str): Valor a validar
+        field_name (str): Nombre del campo para mensajes de error
+        upper (bool): True si es la cota superior
+    
+    Returns:
+        float: Cota como float (inf o -inf si no hay cota)
+    
+    Raises:
+        ValueError: Si el valor no es un número o es un infinito del lado contrario
+    """
+    no_bound = np.inf if upper else -np.inf
+    text = (value or "").strip().lower().replace('∞', 'inf')
+    if text in ("", "inf"):
+        return no_bound
+    
+    bound = validate_float(text, field_name)
+    if np.isnan(bound) or (np.isinf(bound) and bound != no_bound):
+        raise ValueError(
+            f"El campo '{field_name}' no es una cota válida.\n"
+            f"Valor ingresado: '{value}'"
+        )
+    return float(bound)
+
+
+def validate_float_array(values, field_name):
+    """
+    Valida en bloque una matriz de textos y la convierte a float.
+    
+    Todas las celdas se convierten de una vez con NumPy; solo si alguna falla
+    se revisan celda a celda las filas que no se pudieron convertir, para
+    informar todos los errores juntos y no solo el primero.
+    
+    Args:
+        values (list): Filas de textos (todas del mismo largo) o arreglo 2D
+        field_name (callable): field_name(row, col) -> nombre del campo para
+                               los mensajes de error
+        
+    Returns:
+        tuple: (numpy.ndarray de float con NaN en las celdas inválidas,
+                lista de errores (row, col, mensaje) en orden de filas)
+    """
+    texts = np.atleast_2d(np.asarray(values, dtype=str))
+    try:
+        return texts.astype(float), []
+    except ValueError:
+        pass
+    
+    result = np.full(texts.shape, np.nan)
+    errors = []
+    for row in range(texts.shape[0]):
+        try:
+            result[row] = texts[row].astype(float)
+            continue
+        except ValueError:
+            pass
+        for col, text in enumerate(texts[row].tolist()):
+            try:
+                result[row, col] = validate_float(text, field_name(row, col))
+            except ValueError as e:
+                errors.append((row, col, str(e)))
+    return result, errors